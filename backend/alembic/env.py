@@ -12,7 +12,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 # Import database and models
 from database import Base
 from config import settings
-from models import Campaign, CampaignMetric  # noqa: F401
+from models import Campaign, CampaignMetric, CampaignDailyRollup, SegmentDailyRollup, DataVersion, Job, PlanExecution  # noqa: F401
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -0,0 +1,86 @@
+"""Daily rollup tables
+
+Revision ID: 002_daily_rollups
+Revises: 001_initial
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '002_daily_rollups'
+down_revision = '001_initial'
+branch_labels = None
+depends_on = None
+
+# Enum types already exist from the initial schema; never re-create them
+platform_enum = sa.Enum('GOOGLE', 'META', 'AMAZON', name='platform').with_variant(
+    postgresql.ENUM('GOOGLE', 'META', 'AMAZON', name='platform', create_type=False), 'postgresql'
+)
+campaign_type_enum = sa.Enum('PMAX', 'SHOPPING', 'SPONSORED_BRANDS', name='campaigntype').with_variant(
+    postgresql.ENUM('PMAX', 'SHOPPING', 'SPONSORED_BRANDS', name='campaigntype', create_type=False), 'postgresql'
+)
+
+
+def upgrade() -> None:
+    # Create campaign_daily_rollups table
+    op.create_table(
+        'campaign_daily_rollups',
+        sa.Column('campaign_id', sa.Integer(), nullable=False),
+        sa.Column('date', sa.Date(), nullable=False),
+        sa.Column('spend', sa.Numeric(precision=14, scale=2), nullable=False),
+        sa.Column('impressions', sa.BigInteger(), nullable=False),
+        sa.Column('clicks', sa.BigInteger(), nullable=False),
+        sa.Column('conversions', sa.BigInteger(), nullable=False),
+        sa.Column('conversion_value', sa.Numeric(precision=14, scale=2), nullable=False),
+        sa.ForeignKeyConstraint(['campaign_id'], ['campaigns.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('campaign_id', 'date')
+    )
+    op.create_index(op.f('ix_campaign_daily_rollups_date'), 'campaign_daily_rollups', ['date'], unique=False)
+
+    # Create segment_daily_rollups table
+    op.create_table(
+        'segment_daily_rollups',
+        sa.Column('platform', platform_enum, nullable=False),
+        sa.Column('campaign_type', campaign_type_enum, nullable=False),
+        sa.Column('date', sa.Date(), nullable=False),
+        sa.Column('spend', sa.Numeric(precision=14, scale=2), nullable=False),
+        sa.Column('impressions', sa.BigInteger(), nullable=False),
+        sa.Column('clicks', sa.BigInteger(), nullable=False),
+        sa.Column('conversions', sa.BigInteger(), nullable=False),
+        sa.Column('conversion_value', sa.Numeric(precision=14, scale=2), nullable=False),
+        sa.PrimaryKeyConstraint('platform', 'campaign_type', 'date')
+    )
+    op.create_index(op.f('ix_segment_daily_rollups_date'), 'segment_daily_rollups', ['date'], unique=False)
+
+    # Backfill from existing raw metrics
+    op.execute(
+        """
+        INSERT INTO campaign_daily_rollups
+            (campaign_id, date, spend, impressions, clicks, conversions, conversion_value)
+        SELECT campaign_id, date, SUM(spend), SUM(impressions), SUM(clicks),
+               COALESCE(SUM(conversions), 0), COALESCE(SUM(conversion_value), 0)
+        FROM campaign_metrics
+        GROUP BY campaign_id, date
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO segment_daily_rollups
+            (platform, campaign_type, date, spend, impressions, clicks, conversions, conversion_value)
+        SELECT c.platform, c.campaign_type, r.date, SUM(r.spend), SUM(r.impressions), SUM(r.clicks),
+               SUM(r.conversions), SUM(r.conversion_value)
+        FROM campaign_daily_rollups r
+        JOIN campaigns c ON c.id = r.campaign_id
+        GROUP BY c.platform, c.campaign_type, r.date
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_segment_daily_rollups_date'), table_name='segment_daily_rollups')
+    op.drop_table('segment_daily_rollups')
+    op.drop_index(op.f('ix_campaign_daily_rollups_date'), table_name='campaign_daily_rollups')
+    op.drop_table('campaign_daily_rollups')
@@ -0,0 +1,67 @@
+"""Unique composite index on campaign_metrics (campaign_id, date)
+
+Revision ID: 003_metric_campaign_date
+Revises: 002_daily_rollups
+Create Date: 2026-10-17 12:30:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '003_metric_campaign_date'
+down_revision = '002_daily_rollups'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Remove duplicate (campaign_id, date) rows, keeping the most recent one
+    op.execute(
+        """
+        DELETE FROM campaign_metrics
+        WHERE id NOT IN (
+            SELECT MAX(id) FROM campaign_metrics GROUP BY campaign_id, date
+        )
+        """
+    )
+
+    # Re-derive rollups so they no longer count the removed duplicates
+    op.execute("DELETE FROM segment_daily_rollups")
+    op.execute("DELETE FROM campaign_daily_rollups")
+    op.execute(
+        """
+        INSERT INTO campaign_daily_rollups
+            (campaign_id, date, spend, impressions, clicks, conversions, conversion_value)
+        SELECT campaign_id, date, SUM(spend), SUM(impressions), SUM(clicks),
+               COALESCE(SUM(conversions), 0), COALESCE(SUM(conversion_value), 0)
+        FROM campaign_metrics
+        GROUP BY campaign_id, date
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO segment_daily_rollups
+            (platform, campaign_type, date, spend, impressions, clicks, conversions, conversion_value)
+        SELECT c.platform, c.campaign_type, r.date, SUM(r.spend), SUM(r.impressions), SUM(r.clicks),
+               SUM(r.conversions), SUM(r.conversion_value)
+        FROM campaign_daily_rollups r
+        JOIN campaigns c ON c.id = r.campaign_id
+        GROUP BY c.platform, c.campaign_type, r.date
+        """
+    )
+
+    # Composite index replaces the single-column campaign_id index; on
+    # PostgreSQL the measures are included so range scans are index-only
+    op.create_index(
+        'ux_campaign_metrics_campaign_id_date',
+        'campaign_metrics',
+        ['campaign_id', 'date'],
+        unique=True,
+        postgresql_include=['spend', 'impressions', 'clicks', 'conversions', 'conversion_value'],
+    )
+    op.drop_index(op.f('ix_campaign_metrics_campaign_id'), table_name='campaign_metrics')
+
+
+def downgrade() -> None:
+    op.create_index(op.f('ix_campaign_metrics_campaign_id'), 'campaign_metrics', ['campaign_id'], unique=False)
+    op.drop_index('ux_campaign_metrics_campaign_id_date', table_name='campaign_metrics')
@@ -0,0 +1,28 @@
+"""Keyset pagination indexes
+
+Revision ID: 004_keyset_indexes
+Revises: 003_metric_campaign_date
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '004_keyset_indexes'
+down_revision = '003_metric_campaign_date'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_campaigns_created_at_id', 'campaigns', ['created_at', 'id'], unique=False)
+
+    # Composite index replaces the single-column date index
+    op.create_index('ix_campaign_metrics_date_campaign_id', 'campaign_metrics', ['date', 'campaign_id'], unique=False)
+    op.drop_index(op.f('ix_campaign_metrics_date'), table_name='campaign_metrics')
+
+
+def downgrade() -> None:
+    op.create_index(op.f('ix_campaign_metrics_date'), 'campaign_metrics', ['date'], unique=False)
+    op.drop_index('ix_campaign_metrics_date_campaign_id', table_name='campaign_metrics')
+    op.drop_index('ix_campaigns_created_at_id', table_name='campaigns')
@@ -0,0 +1,37 @@
+"""Plan execution records for idempotency
+
+Revision ID: 007_plan_executions
+Revises: 006_jobs
+Create Date: 2026-10-17 19:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '007_plan_executions'
+down_revision = '006_jobs'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'plan_executions',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('idempotency_key', sa.String(length=300), nullable=False),
+        sa.Column('request_hash', sa.String(length=64), nullable=False),
+        sa.Column('status', sa.Enum('IN_PROGRESS', 'COMPLETED', name='planexecutionstatus'), nullable=False),
+        sa.Column('status_code', sa.Integer(), nullable=True),
+        sa.Column('response_body', sa.JSON(), nullable=True),
+        sa.Column('response_headers', sa.JSON(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('completed_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_plan_executions_idempotency_key'), 'plan_executions', ['idempotency_key'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_plan_executions_idempotency_key'), table_name='plan_executions')
+    op.drop_table('plan_executions')
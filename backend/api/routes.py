@@ -1,81 +1,161 @@
 """API routes for campaigns and plans."""
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import Any, Awaitable, Callable, List, Optional, Tuple
+from datetime import date, datetime, timedelta
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from database import get_db
-from repositories import CampaignRepository, MetricRepository
-from services import PlanService, CampaignExecutionService
+from config import settings
+from database import ReadSessionLocal, get_db, get_async_db, get_async_read_db, pool_stats
+from models.campaign import Platform, CampaignStatus, CampaignType
+from models.job import Job, JobStatus
+from repositories import (
+    MetricRepository,
+    AsyncCampaignRepository,
+    AsyncMetricRepository,
+    AsyncDataVersionRepository,
+    AsyncJobRepository,
+)
+from services import PlanService, CampaignExecutionService, MetricIngestionService, IdempotencyService
+from services.idempotency_service import plan_fingerprint, IDEMPOTENCY_KEY_HEADER, IDEMPOTENT_REPLAYED_HEADER
+from services.metric_ingestion_service import iter_parsed_batches
+from services.job_runner import job_runner
+from repositories.metric_repository import SERIES_INTERVALS
+from utils.pagination import encode_cursor, decode_cursor, NEXT_CURSOR_HEADER
+from utils.streaming import stream_json_array, stream_ndjson, stream_csv, gzip_stream
+from utils.cache import dashboard_cache
+from utils.singleflight import dashboard_flights, execution_flights
+from utils.errors import IdempotencyConflictError, IdempotencyKeyReuseError
+from utils.retry import retry_stats
+from utils.circuit_breaker import platform_breakers
+from utils.http_client import platform_http
+from utils.rate_limiter import platform_rate_limiters
 from schemas import (
     PlanInput,
     GeneratedPlan,
     CampaignWithMetricsResponse,
     CampaignCreateResponse,
+    CampaignBatchExecuteRequest,
+    CampaignBatchExecuteResponse,
     CampaignResponse,
+    CampaignSummaryResponse,
+    BulkIngestResponse,
+    MetricSeriesPoint,
+    JobResponse,
+    JobAcceptedResponse,
 )
 
 router = APIRouter(prefix="/api", tags=["campaigns"])
 
+EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+}
+
+EXPORT_FIELDS = [
+    "platform",
+    "campaign_id",
+    "campaign_name",
+    "campaign_type",
+    "date",
+    "spend",
+    "impressions",
+    "clicks",
+    "ctr",
+    "conversions",
+    "conversion_value",
+    "currency",
+]
+
 
 @router.get("/campaigns", response_model=List[CampaignWithMetricsResponse])
-def get_campaigns(
+async def get_campaigns(
+    request: Request,
+    response: Response,
     platform: Optional[str] = Query(None, description="Filter by platform (google, meta, amazon)"),
     status: Optional[str] = Query(None, description="Filter by status"),
     campaign_type: Optional[str] = Query(None, description="Filter by campaign type (pmax, shopping, sponsored_brands)"),
     days: int = Query(7, ge=1, le=90, description="Number of days for metrics aggregation"),
-    db: Session = Depends(get_db),
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="Page size; enables keyset pagination"),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
     """
     Get all campaigns with aggregated metrics.
     
     Returns campaigns with performance metrics aggregated over the specified number of days.
+    When ``limit`` is given, returns one page (newest first) and sets the
+    X-Next-Cursor header if more campaigns follow. Answers 304 Not Modified
+    when If-None-Match matches the current data version.
     """
-    from models.campaign import Platform, CampaignStatus, CampaignType
+    platform_enum, status_enum, campaign_type_enum = _parse_campaign_filters(
+        platform, status, campaign_type
+    )
+    after = _decode_cursor_param(cursor, (datetime, int))
     
-    # Parse filters
-    platform_enum = None
-    if platform:
-        try:
-            platform_enum = Platform[platform.upper()]
-        except KeyError:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid platform: {platform}. Must be one of: google, meta, amazon"
-            )
+    version = await _data_version(db)
+    etag = _data_etag(version)
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
     
-    status_enum = None
-    if status:
-        try:
-            status_enum = CampaignStatus[status.upper()]
-        except KeyError:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid status: {status}. Must be one of: created, pending, active, failed"
-            )
+    # Get campaigns with metrics (one extra row tells us whether a next page exists)
+    campaign_repo = AsyncCampaignRepository(db)
+    campaigns_data = await _coalesce(
+        (
+            "campaigns", days, platform_enum, status_enum, campaign_type_enum, limit,
+            tuple(after) if after else None, version,
+        ),
+        lambda: campaign_repo.get_with_metrics(
+            days=days,
+            platform=platform_enum,
+            status=status_enum,
+            campaign_type=campaign_type_enum,
+            limit=limit + 1 if limit else None,
+            after=after,
+            data_version=version,
+        ),
+    )
     
-    campaign_type_enum = None
-    if campaign_type:
-        try:
-            campaign_type_enum = CampaignType[campaign_type.upper()]
-        except KeyError:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid campaign_type: {campaign_type}. Must be one of: pmax, shopping, sponsored_brands"
-            )
+    if limit and len(campaigns_data) > limit:
+        campaigns_data = campaigns_data[:limit]
+        last = campaigns_data[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(last["createdAt"], last["id"])
     
-    # Get campaigns with metrics
-    campaign_repo = CampaignRepository(db)
-    campaigns_data = campaign_repo.get_with_metrics(
+    return campaigns_data
+
+
+@router.get("/campaigns/summary", response_model=CampaignSummaryResponse)
+async def get_campaigns_summary(
+    platform: Optional[str] = Query(None, description="Filter by platform (google, meta, amazon)"),
+    status: Optional[str] = Query(None, description="Filter by status"),
+    campaign_type: Optional[str] = Query(None, description="Filter by campaign type (pmax, shopping, sponsored_brands)"),
+    days: int = Query(7, ge=1, le=90, description="Number of days for metrics aggregation"),
+    db: AsyncSession = Depends(get_async_read_db),
+):
+    """
+    Get dashboard header totals.
+    
+    Returns total spend, ROAS and the other metrics overall and per platform,
+    campaign type and status, for the same campaigns and window as
+    GET /api/campaigns.
+    """
+    platform_enum, status_enum, campaign_type_enum = _parse_campaign_filters(
+        platform, status, campaign_type
+    )
+    
+    campaign_repo = AsyncCampaignRepository(db)
+    return await campaign_repo.get_summary(
         days=days,
         platform=platform_enum,
         status=status_enum,
         campaign_type=campaign_type_enum,
     )
-    
-    return campaigns_data
 
 
 @router.post("/plans/generate", response_model=GeneratedPlan)
-def generate_plan(
+async def generate_plan(
     plan_input: PlanInput,
 ):
     """
@@ -94,132 +174,694 @@ def generate_plan(
         )
 
 
-@router.post("/campaigns/execute", response_model=CampaignCreateResponse, status_code=201)
-def execute_plan(
+@router.post(
+    "/campaigns/execute",
+    response_model=CampaignCreateResponse,
+    status_code=201,
+    responses={202: {"model": JobAcceptedResponse}},
+)
+async def execute_plan(
     plan: GeneratedPlan,
+    run_async: bool = Query(False, alias="async", description="Queue the plan as a background job and return 202"),
+    idempotency_key: Optional[str] = Header(None, alias=IDEMPOTENCY_KEY_HEADER, max_length=255),
     db: Session = Depends(get_db),
 ):
     """
     Execute a media plan by creating campaigns across all platforms.
     
     Creates campaigns on Google Ads, Meta Ads, and Amazon Ads based on the plan.
-    Returns the created campaigns and any errors encountered.
+    Returns the created campaigns and any errors encountered. Runs on the
+    sync session in the threadpool, like the other write paths.
+    
+    With ``async=true`` the campaigns are saved as pending and a job is
+    queued to create them; responds 202 with the job's status URL.
+    
+    Retries are idempotent: a request with the same ``Idempotency-Key``
+    header, or without one the same plan shortly after, gets the stored
+    response back without creating anything. Concurrent duplicates wait
+    for the first execution in this worker and get its response as a
+    replay, or get 409 while it runs in another worker.
     """
-    try:
-        execution_service = CampaignExecutionService(db)
-        created_campaigns, errors = execution_service.execute_plan(plan)
-        
-        if not created_campaigns:
-            raise HTTPException(
-                status_code=500,
-                detail="Failed to create any campaigns. All platforms failed."
-            )
-        
-        # Build response message
-        message = f"Successfully created {len(created_campaigns)} campaign(s)"
-        if errors:
-            message += f". {len(errors)} platform(s) failed: {', '.join(errors)}"
+    fingerprint = plan_fingerprint(plan, "async" if run_async else "sync")
+    idempotency = IdempotencyService(db)
+    key, ttl = idempotency.resolve_key(idempotency_key, fingerprint)
+    
+    executed_here = False
+    
+    async def execute_once() -> Tuple[int, dict, dict]:
+        nonlocal executed_here
+        executed_here = True
+        try:
+            stored = await run_in_threadpool(idempotency.begin, key, fingerprint, ttl)
+        except IdempotencyConflictError as e:
+            raise HTTPException(status_code=409, detail=str(e))
+        except IdempotencyKeyReuseError as e:
+            raise HTTPException(status_code=422, detail=str(e))
+        if stored is not None:
+            status_code, body, headers = stored
+            return status_code, body, {**headers, IDEMPOTENT_REPLAYED_HEADER: "true"}
         
-        return CampaignCreateResponse(
-            message=message,
-            campaigns=created_campaigns,
+        try:
+            response = await _execute_plan(plan, run_async, db)
+        except Exception:
+            await run_in_threadpool(idempotency.release, key)
+            raise
+        await run_in_threadpool(idempotency.complete, key, response)
+        return response
+    
+    # Coalesce only identical plans, so a different plan under the same key still gets 422
+    status_code, body, headers = await execution_flights.do((key, fingerprint), execute_once)
+    if not executed_here:
+        headers = {**headers, IDEMPOTENT_REPLAYED_HEADER: "true"}
+    return JSONResponse(body, status_code=status_code, headers=headers)
+
+
+@router.post("/campaigns/execute/batch", response_model=CampaignBatchExecuteResponse)
+async def execute_plans_batch(
+    request: CampaignBatchExecuteRequest,
+    concurrency: int = Query(settings.BATCH_EXECUTE_CONCURRENCY, ge=1, le=100, description="Plans calling their platforms at once"),
+    db: Session = Depends(get_db),
+):
+    """
+    Execute many media plans in one request.
+    
+    Plans call their platforms with bounded concurrency and are saved in
+    batched transactions. Returns the created campaigns and errors for each
+    plan, in request order; a plan succeeds if any platform succeeded.
+    """
+    if len(request.plans) > settings.BATCH_EXECUTE_MAX_PLANS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many plans: {len(request.plans)}. At most {settings.BATCH_EXECUTE_MAX_PLANS} per request"
         )
-    except HTTPException:
-        raise
+    
+    try:
+        execution_service = CampaignExecutionService(db)
+        outcomes = await run_in_threadpool(execution_service.execute_plans, request.plans, concurrency)
     except Exception as e:
         raise HTTPException(
             status_code=500,
-            detail=f"Failed to execute plan: {str(e)}"
+            detail=f"Failed to execute plans: {str(e)}"
+        )
+    
+    results = [
+        {"index": index, "campaigns": campaigns, "errors": errors}
+        for index, (campaigns, errors) in enumerate(outcomes)
+    ]
+    succeeded = sum(1 for result in results if result["campaigns"])
+    failed = len(results) - succeeded
+    
+    return {
+        "message": f"Executed {len(results)} plan(s): {succeeded} succeeded, {failed} failed",
+        "succeeded": succeeded,
+        "failed": failed,
+        "results": results,
+    }
+
+
+@router.get("/jobs/stats")
+async def get_job_stats():
+    """
+    Get background job counters.
+    
+    Returns how many jobs are running and waiting in this process, out of
+    JOB_MAX_CONCURRENCY, and how many have succeeded or failed.
+    """
+    return job_runner.stats()
+
+
+@router.get("/jobs/{job_id}", response_model=JobResponse)
+async def get_job(
+    job_id: int,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Get the status of a background job.
+    
+    Read from the primary, so a job's progress is visible immediately.
+    """
+    job = await AsyncJobRepository(db).get_by_id(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Job not found: {job_id}"
         )
+    return _job_dict(job)
 
 
 @router.get("/metrics")
-def get_metrics(
+async def get_metrics(
+    request: Request,
+    response: Response,
     campaign_id: Optional[int] = Query(None, description="Filter by campaign ID"),
     days: int = Query(7, ge=1, le=90, description="Number of days to retrieve"),
-    db: Session = Depends(get_db),
+    limit: Optional[int] = Query(None, ge=1, le=5000, description="Page size; enables keyset pagination"),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
     """
     Get campaign metrics.
     
     Returns metrics for all campaigns or a specific campaign if campaign_id is provided.
+    When ``limit`` is given, returns one page ordered newest first by
+    (date, campaign_id) and sets the X-Next-Cursor header if more rows follow.
+    Answers 304 Not Modified when If-None-Match matches the current data version.
     """
-    metric_repo = MetricRepository(db)
-    campaign_repo = CampaignRepository(db)
+    version = await _data_version(db)
+    etag = _data_etag(version)
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    
+    if limit:
+        page = await _get_metrics_page(campaign_id, days, limit, cursor, version, db)
+        page.headers["ETag"] = etag
+        return page
+    
+    end_date = datetime.utcnow().date()
+    start_date = end_date - timedelta(days=days)
     
     if campaign_id:
         # Get metrics for specific campaign
-        from datetime import datetime, timedelta
-        end_date = datetime.utcnow().date()
-        start_date = end_date - timedelta(days=days)
-        
-        metrics = metric_repo.get_by_campaign(
+        response.headers["ETag"] = etag
+        return await _coalesce_cached(
+            ("campaign_metrics", start_date, end_date, campaign_id),
+            version,
+            lambda: _get_campaign_metrics(campaign_id, start_date, end_date, db),
+        )
+    else:
+        # Stream daily metrics for all campaigns (matching required reporting structure).
+        # Never cached or coalesced: this is the largest payload, and streaming
+        # keeps memory constant however many rows there are
+        return StreamingResponse(
+            stream_json_array(_iter_daily_metrics(start_date=start_date, end_date=end_date)),
+            media_type="application/json",
+            headers={"ETag": etag},
+        )
+
+
+@router.get("/metrics/series", response_model=List[MetricSeriesPoint])
+async def get_metrics_series(
+    interval: str = Query("day", description="Bucket size (day, week, month)"),
+    campaign_id: Optional[int] = Query(None, description="Filter by campaign ID"),
+    platform: Optional[str] = Query(None, description="Filter by platform (google, meta, amazon)"),
+    days: int = Query(30, ge=1, le=366, description="Number of days covered by the series"),
+    db: AsyncSession = Depends(get_async_read_db),
+):
+    """
+    Get a time-bucketed metric series for charts.
+    
+    Returns one row per day, week or month with summed metrics plus CTR and
+    ROAS, for one campaign, one platform or all campaigns. Bucketing happens
+    in the database and empty buckets are filled with zeros.
+    """
+    if interval not in SERIES_INTERVALS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid interval: {interval}. Must be one of: day, week, month"
+        )
+    if campaign_id and platform:
+        raise HTTPException(
+            status_code=400,
+            detail="Filter by either campaign_id or platform, not both"
+        )
+    
+    platform_enum, _, _ = _parse_campaign_filters(platform, None, None)
+    
+    end_date = datetime.utcnow().date()
+    start_date = end_date - timedelta(days=days)
+    
+    metric_repo = AsyncMetricRepository(db)
+    return await metric_repo.get_series(
+        interval=interval,
+        start_date=start_date,
+        end_date=end_date,
+        campaign_id=campaign_id,
+        platform=platform_enum,
+    )
+
+
+@router.get("/metrics/export")
+async def export_metrics(
+    format: str = Query("csv", description="Export format (csv, ndjson)"),
+    platform: Optional[str] = Query(None, description="Filter by platform (google, meta, amazon)"),
+    status: Optional[str] = Query(None, description="Filter by status"),
+    campaign_type: Optional[str] = Query(None, description="Filter by campaign type (pmax, shopping, sponsored_brands)"),
+    start_date: Optional[date] = Query(None, description="First day to export (inclusive)"),
+    end_date: Optional[date] = Query(None, description="Last day to export (inclusive)"),
+    gzip: bool = Query(False, description="Compress the response with gzip"),
+):
+    """
+    Export daily campaign metrics as CSV or NDJSON.
+    
+    Rows are streamed from a server-side cursor, so any date range can be
+    exported with constant memory. Optionally gzip-compressed on the fly.
+    The body is produced by a sync generator, iterated in the threadpool.
+    """
+    fmt = format.lower()
+    if fmt not in EXPORT_MEDIA_TYPES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid format: {format}. Must be one of: csv, ndjson"
+        )
+    if start_date and end_date and start_date > end_date:
+        raise HTTPException(
+            status_code=400,
+            detail="start_date must be on or before end_date"
+        )
+    
+    platform_enum, status_enum, campaign_type_enum = _parse_campaign_filters(
+        platform, status, campaign_type
+    )
+    
+    rows = _iter_daily_metrics(
+        start_date=start_date,
+        end_date=end_date,
+        platform=platform_enum,
+        status=status_enum,
+        campaign_type=campaign_type_enum,
+    )
+    body = stream_csv(rows, EXPORT_FIELDS) if fmt == "csv" else stream_ndjson(rows)
+    
+    headers = {"Content-Disposition": f'attachment; filename="metrics.{fmt}"'}
+    if gzip:
+        body = gzip_stream(body)
+        headers["Content-Encoding"] = "gzip"
+    
+    return StreamingResponse(body, media_type=EXPORT_MEDIA_TYPES[fmt], headers=headers)
+
+
+@router.post("/metrics/bulk", response_model=BulkIngestResponse)
+async def ingest_metrics_bulk(
+    request: Request,
+    format: Optional[str] = Query(None, description="Body format (ndjson, csv). Defaults to the Content-Type"),
+    batch_size: int = Query(settings.METRICS_INGEST_BATCH_SIZE, ge=1, le=50000, description="Rows validated and written per batch"),
+    db: Session = Depends(get_db),
+):
+    """
+    Bulk ingest daily metric rows from an NDJSON or CSV body.
+    
+    The body is parsed incrementally and each batch is validated and upserted
+    on (campaign_id, date) in its own transaction. Returns accepted and
+    rejected counts per batch.
+    """
+    fmt = (format or "").lower()
+    if not fmt:
+        content_type = request.headers.get("content-type", "")
+        fmt = "csv" if "csv" in content_type else "ndjson"
+    if fmt not in ("ndjson", "csv"):
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid format: {format}. Must be one of: ndjson, csv"
+        )
+    
+    ingestion_service = MetricIngestionService(db)
+    batches = []
+    
+    try:
+        batch_number = 0
+        async for lines in iter_parsed_batches(request.stream(), fmt, batch_size=batch_size):
+            batch_number += 1
+            batches.append(await run_in_threadpool(ingestion_service.ingest_batch, batch_number, lines))
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Failed to parse body after {len(batches)} committed batch(es): {str(e)}"
+        )
+    
+    return {
+        "accepted": sum(b["accepted"] for b in batches),
+        "rejected": sum(b["rejected"] for b in batches),
+        "batches": batches,
+    }
+
+
+@router.get("/cache/stats")
+async def get_cache_stats():
+    """
+    Get dashboard cache counters.
+    
+    Returns size, hits, misses, hit rate, evictions and invalidations for
+    this worker, for sizing DASHBOARD_CACHE_MAX_ENTRIES and the TTL, plus
+    how many requests were coalesced onto an in-flight query.
+    """
+    stats = dashboard_cache.stats()
+    stats["coalescing"] = dashboard_flights.stats()
+    return stats
+
+
+@router.get("/retries/stats")
+async def get_retry_stats():
+    """
+    Get retry counters.
+    
+    Returns calls, retries and give-ups per retry policy in this worker, and
+    the calls and retries in the shared retry budget's current window.
+    """
+    return retry_stats()
+
+
+@router.get("/platforms/breakers")
+async def get_platform_breakers():
+    """
+    Get circuit breaker state per platform.
+    
+    Returns each platform's state (closed, open or half_open), consecutive
+    failures, seconds until an open breaker lets a trial call through, and
+    how often it opened and rejected calls in this worker.
+    """
+    return platform_breakers.stats()
+
+
+@router.get("/http/stats")
+async def get_http_stats():
+    """
+    Get platform API connection pool counters.
+    
+    Returns requests, connections opened, HTTP versions used and errors per
+    platform host in this worker; requests far above connections opened
+    means keep-alive connections are being reused.
+    """
+    return platform_http.stats()
+
+
+@router.get("/rate-limits/stats")
+async def get_rate_limit_stats():
+    """
+    Get client-side rate limiter counters.
+    
+    Returns, per platform account, the configured rate and burst, tokens
+    available, callers queued for a slot, and how many calls were delayed
+    or refused and for how long in this worker.
+    """
+    return platform_rate_limiters.stats()
+
+
+@router.get("/db/pool/stats")
+async def get_db_pool_stats():
+    """
+    Get connection pool counters.
+    
+    Returns size, checked-out and overflow connections plus checkout counts,
+    timeouts and wait times for the sync and async engines of this worker,
+    for sizing DB_POOL_SIZE and DB_MAX_OVERFLOW.
+    """
+    return pool_stats()
+
+
+def _iter_daily_metrics(
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    platform: Optional[Platform] = None,
+    status: Optional[CampaignStatus] = None,
+    campaign_type: Optional[CampaignType] = None,
+):
+    """
+    Yield daily metric dictionaries for all matching campaigns.
+
+    Owns its own session because the response body is produced after the
+    request-scoped session from ``get_db`` may already have been closed.
+    """
+    db = ReadSessionLocal()
+    try:
+        metric_repo = MetricRepository(db)
+        rows = metric_repo.iter_daily_rows(
+            start_date=start_date,
+            end_date=end_date,
+            platform=platform,
+            status=status,
+            campaign_type=campaign_type,
+        )
+        for m in rows:
+            yield _daily_metric_dict(m)
+    finally:
+        db.close()
+
+
+async def _get_metrics_page(
+    campaign_id: Optional[int],
+    days: int,
+    limit: int,
+    cursor: Optional[str],
+    version: int,
+    db: AsyncSession,
+) -> JSONResponse:
+    """Build one keyset page of daily metrics for GET /api/metrics at data ``version``."""
+    after = _decode_cursor_param(cursor, (date, int))
+    
+    end_date = datetime.utcnow().date()
+    start_date = end_date - timedelta(days=days)
+    
+    async def build_page() -> Tuple[List[dict], dict]:
+        # One extra row tells us whether a next page exists
+        metric_repo = AsyncMetricRepository(db)
+        rows = await metric_repo.get_daily_rows_page(
+            limit=limit + 1,
+            after=after,
             campaign_id=campaign_id,
             start_date=start_date,
             end_date=end_date,
         )
         
-        # Get campaign info
-        campaign = campaign_repo.get_by_id(campaign_id)
+        headers = {}
+        if len(rows) > limit:
+            rows = rows[:limit]
+            headers[NEXT_CURSOR_HEADER] = encode_cursor(rows[-1].date, rows[-1].campaign_id)
         
-        result = []
-        for m in metrics:
-            # Calculate CTR
-            ctr = (m.clicks / m.impressions * 100) if m.impressions > 0 else 0.0
-            
-            result.append({
-                "platform": campaign.platform.value if campaign else "unknown",
-                "campaign_id": str(m.campaign_id),
-                "campaign_name": campaign.name if campaign else "Unknown",
-                "campaign_type": campaign.campaign_type.value if campaign else "unknown",
-                "date": m.date.isoformat(),
-                "spend": float(m.spend),
-                "impressions": m.impressions,
-                "clicks": m.clicks,
-                "ctr": round(ctr, 2),
-                "conversions": m.conversions or 0,
-                "conversion_value": float(m.conversion_value) if m.conversion_value else 0.0,
-                "currency": m.currency,
-            })
-        
-        return result
-    else:
-        # Get daily metrics for all campaigns (matching required reporting structure)
-        from repositories import CampaignRepository
-        from datetime import datetime, timedelta
+        return [_daily_metric_dict(m) for m in rows], headers
+    
+    cache_key = ("metrics_page", start_date, end_date, campaign_id, limit, tuple(after) if after else None)
+    content, headers = await _coalesce_cached(cache_key, version, build_page)
+    
+    return JSONResponse(content, headers=headers)
+
+
+async def _get_campaign_metrics(
+    campaign_id: int,
+    start_date: date,
+    end_date: date,
+    db: AsyncSession,
+) -> List[dict]:
+    """Build the daily metrics of one campaign for GET /api/metrics."""
+    metric_repo = AsyncMetricRepository(db)
+    campaign_repo = AsyncCampaignRepository(db)
+    
+    metrics = await metric_repo.get_by_campaign(
+        campaign_id=campaign_id,
+        start_date=start_date,
+        end_date=end_date,
+    )
+    
+    # Get campaign info
+    campaign = await campaign_repo.get_by_id(campaign_id)
+    
+    result = []
+    for m in metrics:
+        # Calculate CTR
+        ctr = (m.clicks / m.impressions * 100) if m.impressions > 0 else 0.0
         
-        campaign_repo = CampaignRepository(db)
-        campaigns = campaign_repo.get_all()
+        result.append({
+            "platform": campaign.platform.value if campaign else "unknown",
+            "campaign_id": str(m.campaign_id),
+            "campaign_name": campaign.name if campaign else "Unknown",
+            "campaign_type": campaign.campaign_type.value if campaign else "unknown",
+            "date": m.date.isoformat(),
+            "spend": float(m.spend),
+            "impressions": m.impressions,
+            "clicks": m.clicks,
+            "ctr": round(ctr, 2),
+            "conversions": m.conversions or 0,
+            "conversion_value": float(m.conversion_value) if m.conversion_value else 0.0,
+            "currency": m.currency,
+        })
+    
+    return result
+
+
+async def _coalesce(key: tuple, compute: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    Run ``compute`` once for all concurrent requests with the same ``key``.
+
+    Followers share the leader's result or error, and get a 504 if it is not
+    ready within DASHBOARD_COALESCE_TIMEOUT_SECONDS.
+    """
+    try:
+        return await dashboard_flights.do(key, compute, timeout=settings.DASHBOARD_COALESCE_TIMEOUT_SECONDS)
+    except TimeoutError:
+        raise HTTPException(
+            status_code=504,
+            detail="Timed out waiting for an identical in-flight request"
+        )
+
+
+async def _coalesce_cached(key: tuple, version: int, compute: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    Serve ``key`` from ``dashboard_cache`` at data ``version``, coalescing
+    concurrent misses. The version is the one the response's ETag was built
+    from, so a cached or shared body never predates its ETag.
+    """
+    found, value = dashboard_cache.get(key, version)
+    if found:
+        return value
+    
+    generation = dashboard_cache.generation
+    
+    async def compute_and_store():
+        value = await compute()
+        dashboard_cache.set(key, value, generation, version)
+        return value
+    
+    return await _coalesce(key + (version,), compute_and_store)
+
+
+def _daily_metric_dict(m) -> dict:
+    """Convert a joined daily metric row into the reporting dictionary."""
+    # Calculate CTR
+    ctr = (m.clicks / m.impressions * 100) if m.impressions > 0 else 0.0
+    
+    return {
+        "platform": m.platform.value,
+        "campaign_id": str(m.campaign_id),
+        "campaign_name": m.campaign_name,
+        "campaign_type": m.campaign_type.value,
+        "date": m.date.isoformat(),
+        "spend": float(m.spend),
+        "impressions": m.impressions,
+        "clicks": m.clicks,
+        "ctr": round(ctr, 2),
+        "conversions": m.conversions or 0,
+        "conversion_value": float(m.conversion_value) if m.conversion_value else 0.0,
+        "currency": m.currency,
+    }
+
+
+async def _execute_plan(plan: GeneratedPlan, run_async: bool, db: Session) -> Tuple[int, dict, dict]:
+    """Run or queue one plan, returning the status code, body and headers to send."""
+    try:
+        execution_service = CampaignExecutionService(db)
+        if run_async:
+            job_id, pending_campaigns = await run_in_threadpool(execution_service.enqueue_plan, plan)
+            status_url = f"{router.prefix}/jobs/{job_id}"
+            accepted = JobAcceptedResponse(
+                jobId=job_id,
+                status=JobStatus.QUEUED.value,
+                statusUrl=status_url,
+                campaigns=pending_campaigns,
+            )
+            return 202, accepted.model_dump(), {"Location": status_url}
         
-        end_date = datetime.utcnow().date()
-        start_date = end_date - timedelta(days=days)
+        created_campaigns, errors = await run_in_threadpool(execution_service.execute_plan, plan)
         
-        result = []
-        for campaign in campaigns:
-            # Get daily metrics for this campaign
-            daily_metrics = metric_repo.get_by_campaign(
-                campaign_id=campaign.id,
-                start_date=start_date,
-                end_date=end_date,
+        if not created_campaigns:
+            raise HTTPException(
+                status_code=500,
+                detail="Failed to create any campaigns. All platforms failed."
             )
-            
-            for m in daily_metrics:
-                # Calculate CTR
-                ctr = (m.clicks / m.impressions * 100) if m.impressions > 0 else 0.0
-                
-                result.append({
-                    "platform": campaign.platform.value,
-                    "campaign_id": str(campaign.id),
-                    "campaign_name": campaign.name,
-                    "campaign_type": campaign.campaign_type.value,
-                    "date": m.date.isoformat(),
-                    "spend": float(m.spend),
-                    "impressions": m.impressions,
-                    "clicks": m.clicks,
-                    "ctr": round(ctr, 2),
-                    "conversions": m.conversions or 0,
-                    "conversion_value": float(m.conversion_value) if m.conversion_value else 0.0,
-                    "currency": m.currency,
-                })
         
-        return result
+        # Build response message
+        message = f"Successfully created {len(created_campaigns)} campaign(s)"
+        if errors:
+            message += f". {len(errors)} platform(s) failed: {', '.join(errors)}"
+        
+        created = CampaignCreateResponse(
+            message=message,
+            campaigns=created_campaigns,
+        )
+        return 201, created.model_dump(), {}
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to execute plan: {str(e)}"
+        )
+
+
+def _job_dict(job: Job) -> dict:
+    """Convert a job to the job response format."""
+    return {
+        "id": job.id,
+        "kind": job.kind,
+        "status": job.status.value,
+        "createdAt": job.created_at.isoformat() if job.created_at else None,
+        "startedAt": job.started_at.isoformat() if job.started_at else None,
+        "finishedAt": job.finished_at.isoformat() if job.finished_at else None,
+        "result": job.result,
+        "error": job.error,
+    }
+
+
+async def _data_version(db: AsyncSession) -> int:
+    """Current data version; read it before the data it validates."""
+    return await AsyncDataVersionRepository(db).current()
+
+
+def _data_etag(version: int) -> str:
+    """
+    Weak ETag for dashboard reads: the data version plus today's date,
+    since the rolling ``days`` window moves at midnight without any write.
+    """
+    return f'W/"{version}-{datetime.utcnow().date().isoformat()}"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Weak comparison of ``etag`` against the request's If-None-Match header."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+def _decode_cursor_param(cursor: Optional[str], types: tuple) -> Optional[list]:
+    """Decode a ``cursor`` query value, or raise 400 if it is malformed."""
+    if not cursor:
+        return None
+    try:
+        return decode_cursor(cursor, types)
+    except ValueError:
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid cursor"
+        )
+
+
+def _parse_campaign_filters(
+    platform: Optional[str],
+    status: Optional[str],
+    campaign_type: Optional[str],
+) -> Tuple[Optional[Platform], Optional[CampaignStatus], Optional[CampaignType]]:
+    """Parse platform/status/campaign_type query values into enums, or raise 400."""
+    platform_enum = None
+    if platform:
+        try:
+            platform_enum = Platform[platform.upper()]
+        except KeyError:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid platform: {platform}. Must be one of: google, meta, amazon"
+            )
+    
+    status_enum = None
+    if status:
+        try:
+            status_enum = CampaignStatus[status.upper()]
+        except KeyError:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid status: {status}. Must be one of: created, pending, active, failed"
+            )
+    
+    campaign_type_enum = None
+    if campaign_type:
+        try:
+            campaign_type_enum = CampaignType[campaign_type.upper()]
+        except KeyError:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid campaign_type: {campaign_type}. Must be one of: pmax, shopping, sponsored_brands"
+            )
+    
+    return platform_enum, status_enum, campaign_type_enum
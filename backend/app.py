@@ -1,20 +1,40 @@
 """FastAPI application entry point."""
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 from config import settings
 from api.routes import router
+from services.job_runner import job_runner
+from services.idempotency_service import IDEMPOTENT_REPLAYED_HEADER
+from utils.http_client import platform_http
 from utils.logger import get_logger
+from utils.pagination import NEXT_CURSOR_HEADER
 
 # Initialize centralized logging
 logger = get_logger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start background workers on startup; stop them and close pooled connections on shutdown."""
+    # Picks up jobs queued or interrupted before the last shutdown
+    await run_in_threadpool(job_runner.start)
+    yield
+    # Waits for running jobs; queued ones resume on the next start
+    await run_in_threadpool(job_runner.shutdown)
+    # After the jobs, which may still be calling platform APIs
+    await run_in_threadpool(platform_http.close)
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Coretas API",
     description="Dashboard-First Auto-Builder Backend API",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # Configure CORS
@@ -24,6 +44,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, "ETag", "Location", IDEMPOTENT_REPLAYED_HEADER],
 )
 
 # Include API routes
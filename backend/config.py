@@ -13,6 +13,91 @@ class Settings:
     
     # Database
     DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite:///./coretas.db")
+    # Async driver URL for request handlers; derived from DATABASE_URL when empty
+    ASYNC_DATABASE_URL: str = os.getenv("ASYNC_DATABASE_URL", "")
+    # Read replica for reporting endpoints; reads use DATABASE_URL when empty
+    READ_DATABASE_URL: str = os.getenv("READ_DATABASE_URL", "")
+    ASYNC_READ_DATABASE_URL: str = os.getenv("ASYNC_READ_DATABASE_URL", "")
+    
+    # Connection pool (per engine; ignored for in-memory SQLite)
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "10"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+    DB_POOL_TIMEOUT_SECONDS: float = float(os.getenv("DB_POOL_TIMEOUT_SECONDS", "30"))
+    # Recycle connections older than this (-1 never); keep below server/proxy idle timeouts
+    DB_POOL_RECYCLE_SECONDS: int = int(os.getenv("DB_POOL_RECYCLE_SECONDS", "1800"))
+    DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes")
+    
+    # SQLite connection tuning (file databases only)
+    SQLITE_BUSY_TIMEOUT_MS: int = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+    SQLITE_MMAP_SIZE: int = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+    # Negative values are KiB, positive values are pages
+    SQLITE_CACHE_SIZE: int = int(os.getenv("SQLITE_CACHE_SIZE", "-65536"))
+    
+    # Bulk metric ingestion
+    METRICS_INGEST_BATCH_SIZE: int = int(os.getenv("METRICS_INGEST_BATCH_SIZE", "5000"))
+    
+    # Metrics engine for dashboard aggregation: "sql" or "cube" (in-memory NumPy cube)
+    METRICS_ENGINE: str = os.getenv("METRICS_ENGINE", "sql")
+    METRIC_CUBE_RELOAD_SECONDS: int = int(os.getenv("METRIC_CUBE_RELOAD_SECONDS", "300"))
+    
+    # Dashboard response cache (TTL of 0 disables it)
+    DASHBOARD_CACHE_TTL_SECONDS: float = float(os.getenv("DASHBOARD_CACHE_TTL_SECONDS", "30"))
+    DASHBOARD_CACHE_MAX_ENTRIES: int = int(os.getenv("DASHBOARD_CACHE_MAX_ENTRIES", "256"))
+    # Longest a request waits on an identical in-flight dashboard query
+    DASHBOARD_COALESCE_TIMEOUT_SECONDS: float = float(os.getenv("DASHBOARD_COALESCE_TIMEOUT_SECONDS", "30"))
+    
+    # Platform calls during plan execution run concurrently, each bounded by
+    # its own timeout and all of them by the plan deadline
+    PLATFORM_CALL_TIMEOUT_SECONDS: float = float(os.getenv("PLATFORM_CALL_TIMEOUT_SECONDS", "20"))
+    PLAN_EXECUTION_DEADLINE_SECONDS: float = float(os.getenv("PLAN_EXECUTION_DEADLINE_SECONDS", "30"))
+    PLATFORM_MAX_WORKERS: int = int(os.getenv("PLATFORM_MAX_WORKERS", "16"))
+    
+    # Batch plan execution: plans calling platforms at once, plans per transaction
+    BATCH_EXECUTE_MAX_PLANS: int = int(os.getenv("BATCH_EXECUTE_MAX_PLANS", "500"))
+    BATCH_EXECUTE_CONCURRENCY: int = int(os.getenv("BATCH_EXECUTE_CONCURRENCY", "5"))
+    BATCH_EXECUTE_COMMIT_SIZE: int = int(os.getenv("BATCH_EXECUTE_COMMIT_SIZE", "50"))
+    
+    # Background jobs (POST /api/campaigns/execute?async=true): jobs run at once per process
+    JOB_MAX_CONCURRENCY: int = int(os.getenv("JOB_MAX_CONCURRENCY", "4"))
+    
+    # Idempotent plan execution: how long responses are replayed for requests
+    # with an Idempotency-Key header, for identical plans without one, and how
+    # long an unfinished execution blocks duplicates before it is presumed dead
+    IDEMPOTENCY_KEY_TTL_SECONDS: float = float(os.getenv("IDEMPOTENCY_KEY_TTL_SECONDS", "86400"))
+    IDEMPOTENCY_FINGERPRINT_TTL_SECONDS: float = float(os.getenv("IDEMPOTENCY_FINGERPRINT_TTL_SECONDS", "600"))
+    IDEMPOTENCY_LOCK_SECONDS: float = float(os.getenv("IDEMPOTENCY_LOCK_SECONDS", "120"))
+    
+    # Per-platform circuit breakers: consecutive failures before failing fast,
+    # cool-down before a trial call, and trial calls let through half-open
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD: int = int(os.getenv("CIRCUIT_BREAKER_FAILURE_THRESHOLD", "5"))
+    CIRCUIT_BREAKER_RECOVERY_SECONDS: float = float(os.getenv("CIRCUIT_BREAKER_RECOVERY_SECONDS", "30"))
+    CIRCUIT_BREAKER_HALF_OPEN_CALLS: int = int(os.getenv("CIRCUIT_BREAKER_HALF_OPEN_CALLS", "1"))
+    
+    # Retry budget shared by platform calls: retries may not exceed this share
+    # of calls over the window, plus a floor for low traffic
+    RETRY_BUDGET_RATIO: float = float(os.getenv("RETRY_BUDGET_RATIO", "0.2"))
+    RETRY_BUDGET_MIN_RETRIES: int = int(os.getenv("RETRY_BUDGET_MIN_RETRIES", "10"))
+    RETRY_BUDGET_WINDOW_SECONDS: float = float(os.getenv("RETRY_BUDGET_WINDOW_SECONDS", "10"))
+    
+    # Pooled HTTP clients for platform APIs: one keep-alive pool per host,
+    # HTTP/2 when h2 is installed, and retries within the platform call timeout
+    HTTP_CONNECT_TIMEOUT_SECONDS: float = float(os.getenv("HTTP_CONNECT_TIMEOUT_SECONDS", "5"))
+    HTTP_READ_TIMEOUT_SECONDS: float = float(os.getenv("HTTP_READ_TIMEOUT_SECONDS", "15"))
+    HTTP_WRITE_TIMEOUT_SECONDS: float = float(os.getenv("HTTP_WRITE_TIMEOUT_SECONDS", "15"))
+    HTTP_POOL_TIMEOUT_SECONDS: float = float(os.getenv("HTTP_POOL_TIMEOUT_SECONDS", "5"))
+    HTTP_MAX_CONNECTIONS_PER_HOST: int = int(os.getenv("HTTP_MAX_CONNECTIONS_PER_HOST", "20"))
+    HTTP_MAX_KEEPALIVE_PER_HOST: int = int(os.getenv("HTTP_MAX_KEEPALIVE_PER_HOST", "10"))
+    HTTP_KEEPALIVE_EXPIRY_SECONDS: float = float(os.getenv("HTTP_KEEPALIVE_EXPIRY_SECONDS", "60"))
+    HTTP2_ENABLED: bool = os.getenv("HTTP2_ENABLED", "true").lower() in ("1", "true", "yes")
+    HTTP_MAX_RETRIES: int = int(os.getenv("HTTP_MAX_RETRIES", "2"))
+    
+    # Client-side rate limits per platform account (calls per second; 0 disables),
+    # burst as seconds of quota, and the longest a call may queue for a slot
+    GOOGLE_ADS_RATE_LIMIT_QPS: float = float(os.getenv("GOOGLE_ADS_RATE_LIMIT_QPS", "10"))
+    META_RATE_LIMIT_QPS: float = float(os.getenv("META_RATE_LIMIT_QPS", "20"))
+    AMAZON_ADS_RATE_LIMIT_QPS: float = float(os.getenv("AMAZON_ADS_RATE_LIMIT_QPS", "10"))
+    RATE_LIMIT_BURST_SECONDS: float = float(os.getenv("RATE_LIMIT_BURST_SECONDS", "1"))
+    RATE_LIMIT_MAX_WAIT_SECONDS: float = float(os.getenv("RATE_LIMIT_MAX_WAIT_SECONDS", "10"))
     
     # Platform API Keys (optional)
     GOOGLE_ADS_API_KEY: str = os.getenv("GOOGLE_ADS_API_KEY", "")
@@ -1,22 +1,240 @@
 """Database configuration and session management."""
-from sqlalchemy import create_engine
+import threading
+import time
+from typing import AsyncIterator, Optional
+from sqlalchemy import create_engine, event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 from config import settings
 
+# Async drivers used for each sync database URL scheme
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+}
+
+
+class PoolStats:
+    """Checkout counters and wait times for one connection pool."""
+
+    def __init__(self):
+        """Initialize all counters at zero."""
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record(self, wait: float, timed_out: bool = False) -> None:
+        """Record one checkout attempt that waited ``wait`` seconds."""
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+
+    def snapshot(self, pool) -> dict:
+        """Counters plus the pool's current occupancy."""
+        with self._lock:
+            attempts = self.checkouts + self.timeouts
+            return {
+                "size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "idle": pool.checkedin(),
+                # QueuePool counts unopened pool slots as negative overflow
+                "overflow": max(pool.overflow(), 0),
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "avg_wait_ms": round(self.total_wait / attempts * 1000, 3) if attempts else 0.0,
+                "max_wait_ms": round(self.max_wait * 1000, 3),
+            }
+
+
+class _InstrumentedPoolMixin:
+    """Times every checkout, including waits for a free connection."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.stats.record(time.perf_counter() - started, timed_out=True)
+            raise
+        self.stats.record(time.perf_counter() - started)
+        return connection
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    """QueuePool that records checkout statistics."""
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that records checkout statistics."""
+
+
+def _is_sqlite(url: str) -> bool:
+    return url.startswith("sqlite")
+
+
+def _is_sqlite_memory(url: str) -> bool:
+    return _is_sqlite(url) and (":memory:" in url or url.rstrip("/") in ("sqlite:", "sqlite+aiosqlite:"))
+
+
+def _engine_options(url: str, poolclass) -> dict:
+    """Pool options from Settings; in-memory SQLite keeps SQLAlchemy's default pool."""
+    if _is_sqlite_memory(url):
+        return {}
+    return {
+        "poolclass": poolclass,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+
+def _apply_sqlite_pragmas(engine: Engine) -> None:
+    """
+    Tune every new SQLite connection: WAL lets dashboard reads proceed while
+    metric writes commit, and synchronous=NORMAL is durable under WAL.
+    """
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute(f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT_MS)}")
+        cursor.execute(f"PRAGMA mmap_size={int(settings.SQLITE_MMAP_SIZE)}")
+        cursor.execute(f"PRAGMA cache_size={int(settings.SQLITE_CACHE_SIZE)}")
+        cursor.close()
+
+
+def _create_sync_engine(url: str) -> Engine:
+    """Create a sync engine with the configured pool and SQLite tuning."""
+    sync_engine = create_engine(
+        url,
+        connect_args={"check_same_thread": False} if "sqlite" in url else {},
+        echo=settings.ENVIRONMENT == "development",
+        **_engine_options(url, InstrumentedQueuePool),
+    )
+    if _is_sqlite(url) and not _is_sqlite_memory(url):
+        _apply_sqlite_pragmas(sync_engine)
+    return sync_engine
+
+
+def _create_async_engine(url: str) -> AsyncEngine:
+    """Create an async engine with the configured pool and SQLite tuning."""
+    async_engine = create_async_engine(
+        url,
+        echo=settings.ENVIRONMENT == "development",
+        **_engine_options(url, InstrumentedAsyncQueuePool),
+    )
+    if _is_sqlite(url) and not _is_sqlite_memory(url):
+        _apply_sqlite_pragmas(async_engine.sync_engine)
+    return async_engine
+
+
 # Create SQLAlchemy engine
-engine = create_engine(
-    settings.DATABASE_URL,
-    connect_args={"check_same_thread": False} if "sqlite" in settings.DATABASE_URL else {},
-    echo=settings.ENVIRONMENT == "development",
-)
+engine = _create_sync_engine(settings.DATABASE_URL)
 
-# Create session factory
+# Reporting reads go to the read replica; the primary when none is configured
+read_engine = _create_sync_engine(settings.READ_DATABASE_URL) if settings.READ_DATABASE_URL else engine
+
+# Create session factories
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
 
 # Base class for models
 Base = declarative_base()
 
+# Async engines and session factories, created on first use so that Alembic
+# and scripts keep working without the async drivers installed
+_async_engine: Optional[AsyncEngine] = None
+_async_read_engine: Optional[AsyncEngine] = None
+_async_session_factory: Optional[async_sessionmaker] = None
+_async_read_session_factory: Optional[async_sessionmaker] = None
+
+
+def async_database_url(url: str) -> str:
+    """Translate a sync database URL to its async driver (aiosqlite / asyncpg)."""
+    scheme, sep, rest = url.partition("://")
+    return f"{ASYNC_DRIVERS.get(scheme, scheme)}{sep}{rest}"
+
+
+def get_async_engine() -> AsyncEngine:
+    """Get the process-wide async engine, creating it on first use."""
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = _create_async_engine(
+            settings.ASYNC_DATABASE_URL or async_database_url(settings.DATABASE_URL)
+        )
+    return _async_engine
+
+
+def get_async_read_engine() -> AsyncEngine:
+    """Get the async engine for reporting reads: the replica if configured, else the primary."""
+    global _async_read_engine
+    if _async_read_engine is None:
+        if settings.ASYNC_READ_DATABASE_URL or settings.READ_DATABASE_URL:
+            _async_read_engine = _create_async_engine(
+                settings.ASYNC_READ_DATABASE_URL or async_database_url(settings.READ_DATABASE_URL)
+            )
+        else:
+            _async_read_engine = get_async_engine()
+    return _async_read_engine
+
+
+def AsyncSessionLocal() -> AsyncSession:
+    """Create a new async session bound to the async engine."""
+    global _async_session_factory
+    if _async_session_factory is None:
+        _async_session_factory = async_sessionmaker(
+            get_async_engine(),
+            autoflush=False,
+            expire_on_commit=False,
+        )
+    return _async_session_factory()
+
+
+def AsyncReadSessionLocal() -> AsyncSession:
+    """Create a new async session bound to the reporting (read replica) engine."""
+    global _async_read_session_factory
+    if _async_read_session_factory is None:
+        _async_read_session_factory = async_sessionmaker(
+            get_async_read_engine(),
+            autoflush=False,
+            expire_on_commit=False,
+        )
+    return _async_read_session_factory()
+
+
+def pool_stats() -> dict:
+    """Checkout statistics and occupancy of each connection pool in use."""
+    stats = {}
+    engines = {
+        "sync": engine,
+        "async": _async_engine.sync_engine if _async_engine else None,
+    }
+    if read_engine is not engine:
+        engines["read"] = read_engine
+    if _async_read_engine is not None and _async_read_engine is not _async_engine:
+        engines["async_read"] = _async_read_engine.sync_engine
+    for name, pool_engine in engines.items():
+        if pool_engine is not None and hasattr(pool_engine.pool, "stats"):
+            stats[name] = pool_engine.pool.stats.snapshot(pool_engine.pool)
+    return stats
+
 
 def get_db():
     """Dependency for getting database session."""
@@ -25,3 +243,24 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def get_read_db():
+    """Dependency for getting a database session for reporting reads."""
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """Dependency for getting an async database session."""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def get_async_read_db() -> AsyncIterator[AsyncSession]:
+    """Dependency for getting an async database session for reporting reads."""
+    async with AsyncReadSessionLocal() as db:
+        yield db
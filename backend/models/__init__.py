@@ -1,5 +1,22 @@
 """Database models."""
 from .campaign import Campaign, Platform, CampaignType, CampaignStatus
 from .metric import CampaignMetric
+from .rollup import CampaignDailyRollup, SegmentDailyRollup
+from .data_version import DataVersion
+from .job import Job, JobStatus
+from .plan_execution import PlanExecution, PlanExecutionStatus
 
-__all__ = ["Campaign", "CampaignMetric", "Platform", "CampaignType", "CampaignStatus"]
+__all__ = [
+    "Campaign",
+    "CampaignMetric",
+    "CampaignDailyRollup",
+    "SegmentDailyRollup",
+    "DataVersion",
+    "Job",
+    "PlanExecution",
+    "Platform",
+    "CampaignType",
+    "CampaignStatus",
+    "JobStatus",
+    "PlanExecutionStatus",
+]
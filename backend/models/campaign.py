@@ -1,7 +1,7 @@
 """Campaign database model."""
 from datetime import datetime
 from enum import Enum as PyEnum
-from sqlalchemy import Column, Integer, String, Numeric, JSON, DateTime, Enum
+from sqlalchemy import Column, Integer, String, Numeric, JSON, DateTime, Enum, Index
 from sqlalchemy.orm import relationship
 from database import Base
 
@@ -31,6 +31,10 @@ class CampaignStatus(PyEnum):
 class Campaign(Base):
     """Campaign model."""
     __tablename__ = "campaigns"
+    __table_args__ = (
+        # Keyset pagination over (created_at, id), newest first
+        Index("ix_campaigns_created_at_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False, index=True)
@@ -0,0 +1,14 @@
+"""Data version counter model for HTTP cache validation."""
+from sqlalchemy import Column, Integer, BigInteger
+from database import Base
+
+
+class DataVersion(Base):
+    """Single-row counter bumped by every campaign or metric write."""
+    __tablename__ = "data_version"
+
+    id = Column(Integer, primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<DataVersion(version={self.version})>"
@@ -1,6 +1,6 @@
 """Campaign metrics database model."""
 from datetime import date, datetime
-from sqlalchemy import Column, Integer, Numeric, String, Date, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, Numeric, String, Date, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from database import Base
 
@@ -8,10 +8,22 @@ from database import Base
 class CampaignMetric(Base):
     """Campaign metrics model for daily performance data."""
     __tablename__ = "campaign_metrics"
+    __table_args__ = (
+        # One row per campaign per day; also serves campaign_id lookups
+        Index(
+            "ux_campaign_metrics_campaign_id_date",
+            "campaign_id",
+            "date",
+            unique=True,
+            postgresql_include=["spend", "impressions", "clicks", "conversions", "conversion_value"],
+        ),
+        # Keyset pagination over (date, campaign_id); also serves date range scans
+        Index("ix_campaign_metrics_date_campaign_id", "date", "campaign_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    campaign_id = Column(Integer, ForeignKey("campaigns.id", ondelete="CASCADE"), nullable=False, index=True)
-    date = Column(Date, nullable=False, index=True)
+    campaign_id = Column(Integer, ForeignKey("campaigns.id", ondelete="CASCADE"), nullable=False)
+    date = Column(Date, nullable=False)
     spend = Column(Numeric(10, 2), nullable=False, default=0.0)
     impressions = Column(Integer, nullable=False, default=0)
     clicks = Column(Integer, nullable=False, default=0)
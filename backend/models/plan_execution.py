@@ -0,0 +1,31 @@
+"""Plan execution record model for idempotent plan execution."""
+from datetime import datetime
+from enum import Enum as PyEnum
+from sqlalchemy import Column, Integer, String, JSON, DateTime, Enum
+from database import Base
+
+
+class PlanExecutionStatus(PyEnum):
+    """Plan execution record status."""
+    IN_PROGRESS = "in_progress"
+    COMPLETED = "completed"
+
+
+class PlanExecution(Base):
+    """Stored response of a plan execution, keyed by idempotency key."""
+    __tablename__ = "plan_executions"
+
+    id = Column(Integer, primary_key=True)
+    # "key:<Idempotency-Key header>" or "plan:<plan fingerprint>"
+    idempotency_key = Column(String(300), nullable=False, unique=True, index=True)
+    # Fingerprint of the request, to reject a reused key with a different plan
+    request_hash = Column(String(64), nullable=False)
+    status = Column(Enum(PlanExecutionStatus), nullable=False, default=PlanExecutionStatus.IN_PROGRESS)
+    status_code = Column(Integer, nullable=True)
+    response_body = Column(JSON, nullable=True)
+    response_headers = Column(JSON, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    completed_at = Column(DateTime, nullable=True)
+
+    def __repr__(self):
+        return f"<PlanExecution(key={self.idempotency_key}, status={self.status.value})>"
@@ -0,0 +1,37 @@
+"""Pre-aggregated daily rollup models for dashboard KPIs."""
+from sqlalchemy import Column, Integer, BigInteger, Numeric, Date, Enum, ForeignKey
+from database import Base
+from models.campaign import Platform, CampaignType
+
+
+class CampaignDailyRollup(Base):
+    """Daily metric totals per campaign."""
+    __tablename__ = "campaign_daily_rollups"
+
+    campaign_id = Column(Integer, ForeignKey("campaigns.id", ondelete="CASCADE"), primary_key=True)
+    date = Column(Date, primary_key=True, index=True)
+    spend = Column(Numeric(14, 2), nullable=False, default=0)
+    impressions = Column(BigInteger, nullable=False, default=0)
+    clicks = Column(BigInteger, nullable=False, default=0)
+    conversions = Column(BigInteger, nullable=False, default=0)
+    conversion_value = Column(Numeric(14, 2), nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<CampaignDailyRollup(campaign_id={self.campaign_id}, date={self.date})>"
+
+
+class SegmentDailyRollup(Base):
+    """Daily metric totals per platform and campaign type."""
+    __tablename__ = "segment_daily_rollups"
+
+    platform = Column(Enum(Platform), primary_key=True)
+    campaign_type = Column(Enum(CampaignType), primary_key=True)
+    date = Column(Date, primary_key=True, index=True)
+    spend = Column(Numeric(14, 2), nullable=False, default=0)
+    impressions = Column(BigInteger, nullable=False, default=0)
+    clicks = Column(BigInteger, nullable=False, default=0)
+    conversions = Column(BigInteger, nullable=False, default=0)
+    conversion_value = Column(Numeric(14, 2), nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<SegmentDailyRollup(platform={self.platform.value}, campaign_type={self.campaign_type.value}, date={self.date})>"
@@ -1,5 +1,26 @@
 """Repositories module."""
 from .campaign_repository import CampaignRepository
 from .metric_repository import MetricRepository
+from .rollup_repository import RollupRepository
+from .data_version_repository import DataVersionRepository
+from .job_repository import JobRepository
+from .plan_execution_repository import PlanExecutionRepository
+from .unit_of_work import UnitOfWork
+from .metric_cube import MetricCube, metric_cube
+from .async_repositories import AsyncCampaignRepository, AsyncMetricRepository, AsyncDataVersionRepository, AsyncJobRepository
 
-__all__ = ["CampaignRepository", "MetricRepository"]
+__all__ = [
+    "CampaignRepository",
+    "MetricRepository",
+    "RollupRepository",
+    "DataVersionRepository",
+    "JobRepository",
+    "PlanExecutionRepository",
+    "UnitOfWork",
+    "AsyncCampaignRepository",
+    "AsyncMetricRepository",
+    "AsyncDataVersionRepository",
+    "AsyncJobRepository",
+    "MetricCube",
+    "metric_cube",
+]
@@ -0,0 +1,181 @@
+"""Async variants of the read repositories used by request handlers."""
+from typing import List, Optional, Sequence, Tuple
+from datetime import date, datetime
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from models.campaign import Campaign, Platform, CampaignType, CampaignStatus
+from models.metric import CampaignMetric
+from models.data_version import DataVersion
+from models.job import Job
+from repositories.campaign_repository import CampaignRepository
+from repositories.metric_repository import MetricRepository
+from repositories.data_version_repository import DATA_VERSION_ID
+
+# The repositories below run the sync repository code through
+# AsyncSession.run_sync: queries go through the async driver on the event
+# loop, without pinning a thread for the DB round-trip, and the query logic
+# (rollups, metric cube, dashboard cache) is shared with the sync path.
+
+
+class AsyncCampaignRepository:
+    """Async repository for campaign reads."""
+
+    def __init__(self, db: AsyncSession):
+        """Initialize repository with an async database session."""
+        self.db = db
+
+    async def get_by_id(self, campaign_id: int) -> Optional[Campaign]:
+        """Get a campaign by ID."""
+        return await self.db.get(Campaign, campaign_id)
+
+    async def get_all(
+        self,
+        platform: Optional[Platform] = None,
+        status: Optional[CampaignStatus] = None,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[datetime, int]] = None,
+    ) -> List[Campaign]:
+        """Get all campaigns with optional filters. See ``CampaignRepository.get_all``."""
+        return await self.db.run_sync(
+            lambda session: CampaignRepository(session).get_all(
+                platform=platform, status=status, limit=limit, after=after,
+            )
+        )
+
+    async def get_with_metrics(
+        self,
+        days: int = 7,
+        platform: Optional[Platform] = None,
+        status: Optional[CampaignStatus] = None,
+        campaign_type: Optional[CampaignType] = None,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[datetime, int]] = None,
+        data_version: Optional[int] = None,
+    ) -> List[dict]:
+        """Get campaigns with aggregated metrics. See ``CampaignRepository.get_with_metrics``."""
+        return await self.db.run_sync(
+            lambda session: CampaignRepository(session).get_with_metrics(
+                days=days,
+                platform=platform,
+                status=status,
+                campaign_type=campaign_type,
+                limit=limit,
+                after=after,
+                data_version=data_version,
+            )
+        )
+
+    async def get_summary(
+        self,
+        days: int = 7,
+        platform: Optional[Platform] = None,
+        status: Optional[CampaignStatus] = None,
+        campaign_type: Optional[CampaignType] = None,
+    ) -> dict:
+        """Get dashboard header totals. See ``CampaignRepository.get_summary``."""
+        return await self.db.run_sync(
+            lambda session: CampaignRepository(session).get_summary(
+                days=days, platform=platform, status=status, campaign_type=campaign_type,
+            )
+        )
+
+
+class AsyncMetricRepository:
+    """Async repository for campaign metric reads."""
+
+    def __init__(self, db: AsyncSession):
+        """Initialize repository with an async database session."""
+        self.db = db
+
+    async def get_by_campaign(
+        self,
+        campaign_id: int,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> List[CampaignMetric]:
+        """Get metrics for a specific campaign within date range."""
+        query = select(CampaignMetric).where(CampaignMetric.campaign_id == campaign_id)
+
+        if start_date:
+            query = query.where(CampaignMetric.date >= start_date)
+        if end_date:
+            query = query.where(CampaignMetric.date <= end_date)
+
+        result = await self.db.scalars(query.order_by(CampaignMetric.date.desc()))
+        return list(result)
+
+    async def get_daily_rows_page(
+        self,
+        limit: int,
+        after: Optional[Tuple[date, int]] = None,
+        campaign_id: Optional[int] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> List:
+        """Get one keyset page of daily metric rows. See ``MetricRepository.get_daily_rows_page``."""
+        return await self.db.run_sync(
+            lambda session: MetricRepository(session).get_daily_rows_page(
+                limit=limit,
+                after=after,
+                campaign_id=campaign_id,
+                start_date=start_date,
+                end_date=end_date,
+            )
+        )
+
+    async def aggregate_by(
+        self,
+        group_by: Sequence[str],
+        start_date: date,
+        end_date: date,
+        platform: Optional[Platform] = None,
+        campaign_type: Optional[CampaignType] = None,
+    ) -> List[dict]:
+        """Group metric totals by dimension. See ``MetricRepository.aggregate_by``."""
+        return await self.db.run_sync(
+            lambda session: MetricRepository(session).aggregate_by(
+                group_by, start_date, end_date, platform=platform, campaign_type=campaign_type,
+            )
+        )
+
+    async def get_series(
+        self,
+        interval: str,
+        start_date: date,
+        end_date: date,
+        campaign_id: Optional[int] = None,
+        platform: Optional[Platform] = None,
+    ) -> List[dict]:
+        """Get bucketed metric totals. See ``MetricRepository.get_series``."""
+        return await self.db.run_sync(
+            lambda session: MetricRepository(session).get_series(
+                interval, start_date, end_date, campaign_id=campaign_id, platform=platform,
+            )
+        )
+
+
+class AsyncDataVersionRepository:
+    """Async repository for reading the data version."""
+
+    def __init__(self, db: AsyncSession):
+        """Initialize repository with an async database session."""
+        self.db = db
+
+    async def current(self) -> int:
+        """Get the current data version."""
+        version = await self.db.scalar(
+            select(DataVersion.version).where(DataVersion.id == DATA_VERSION_ID)
+        )
+        return version or 0
+
+
+class AsyncJobRepository:
+    """Async repository for reading background jobs."""
+
+    def __init__(self, db: AsyncSession):
+        """Initialize repository with an async database session."""
+        self.db = db
+
+    async def get_by_id(self, job_id: int) -> Optional[Job]:
+        """Get a job by ID."""
+        return await self.db.get(Job, job_id)
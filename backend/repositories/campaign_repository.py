@@ -1,18 +1,41 @@
 """Campaign repository for data access operations."""
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional, Tuple
+from decimal import Decimal
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
-from datetime import datetime, timedelta
+from sqlalchemy import func, and_, or_, tuple_
+from datetime import date, datetime, timedelta
+from config import settings
 from models.campaign import Campaign, Platform, CampaignType, CampaignStatus
-from models.metric import CampaignMetric
+from repositories.rollup_repository import RollupRepository
+from repositories.data_version_repository import DataVersionRepository
+from repositories.metric_cube import metric_cube
+from utils.cache import dashboard_cache
+
+if TYPE_CHECKING:
+    from repositories.unit_of_work import UnitOfWork
+
+# Summed columns of the get_summary query, in _to_summary_dict order
+SUMMARY_MEASURES = (
+    "campaign_count",
+    "total_spend",
+    "total_impressions",
+    "total_clicks",
+    "total_conversions",
+    "total_conversion_value",
+)
 
 
 class CampaignRepository:
     """Repository for campaign data access operations."""
 
-    def __init__(self, db: Session):
-        """Initialize repository with database session."""
+    def __init__(self, db: Session, uow: Optional["UnitOfWork"] = None):
+        """
+        Initialize repository with database session.
+
+        With a unit of work, writes are flushed and left for ``uow.commit()``.
+        """
         self.db = db
+        self.uow = uow
 
     def create(
         self,
@@ -32,12 +55,20 @@ class CampaignRepository:
             campaign_type=campaign_type,
             status=status,
             objective=objective,
-            daily_budget=daily_budget,
+            daily_budget=Decimal(str(daily_budget)).quantize(Decimal("0.01")),
             product_categories=product_categories,
             platform_campaign_id=platform_campaign_id,
         )
         self.db.add(campaign)
+        if self.uow is not None:
+            # The INSERT returns the generated ID; no refresh needed
+            self.db.flush()
+            self.uow.mark_dirty()
+            return campaign
+        version = DataVersionRepository(self.db).bump()
         self.db.commit()
+        dashboard_cache.invalidate()
+        metric_cube.advance(version)
         self.db.refresh(campaign)
         return campaign
 
@@ -45,8 +76,14 @@ class CampaignRepository:
         self,
         platform: Optional[Platform] = None,
         status: Optional[CampaignStatus] = None,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[datetime, int]] = None,
     ) -> List[Campaign]:
-        """Get all campaigns with optional filters."""
+        """
+        Get all campaigns with optional filters.
+        Pass ``limit`` and the (created_at, id) of the last row seen as
+        ``after`` to page through results by keyset.
+        """
         query = self.db.query(Campaign)
         
         if platform:
@@ -54,7 +91,7 @@ class CampaignRepository:
         if status:
             query = query.filter(Campaign.status == status)
         
-        return query.order_by(Campaign.created_at.desc()).all()
+        return self._paginate(query, limit, after).all()
 
     def get_by_id(self, campaign_id: int) -> Optional[Campaign]:
         """Get a campaign by ID."""
@@ -66,15 +103,75 @@ class CampaignRepository:
         platform: Optional[Platform] = None,
         status: Optional[CampaignStatus] = None,
         campaign_type: Optional[CampaignType] = None,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[datetime, int]] = None,
+        data_version: Optional[int] = None,
     ) -> List[dict]:
         """
         Get campaigns with aggregated metrics for the last N days.
         Returns list of dictionaries with campaign data and aggregated metrics.
+        Supports the same keyset pagination as ``get_all``.
+
+        Metrics are summed from the campaign daily rollups in a single grouped
+        subquery and LEFT JOINed onto the filtered campaigns, so the number of
+        statements is constant and cost scales with days, not raw rows. With
+        METRICS_ENGINE=cube the sums come from the in-memory metric cube.
+        Results are cached in ``dashboard_cache`` until the next write, at
+        ``data_version`` (read here when not given): pass the version the
+        caller's ETag was built from so the two always match.
         """
-        from sqlalchemy import func, case
+        # Calculate date range
+        end_date = datetime.utcnow().date()
+        start_date = end_date - timedelta(days=days)
         
-        # Base query for campaigns
-        query = self.db.query(Campaign)
+        cache_key = (
+            "campaigns_with_metrics",
+            start_date,
+            end_date,
+            platform,
+            status,
+            campaign_type,
+            limit,
+            tuple(after) if after else None,
+        )
+        if dashboard_cache.enabled and data_version is None:
+            data_version = DataVersionRepository(self.db).current()
+        return dashboard_cache.get_or_compute(
+            cache_key,
+            lambda: self._get_with_metrics(start_date, end_date, platform, status, campaign_type, limit, after),
+            data_version,
+        )
+
+    def _get_with_metrics(
+        self,
+        start_date: date,
+        end_date: date,
+        platform: Optional[Platform],
+        status: Optional[CampaignStatus],
+        campaign_type: Optional[CampaignType],
+        limit: Optional[int],
+        after: Optional[Tuple[datetime, int]],
+    ) -> List[dict]:
+        """Uncached body of ``get_with_metrics``."""
+        if settings.METRICS_ENGINE == "cube":
+            return self._get_with_metrics_from_cube(
+                start_date, end_date, platform, status, campaign_type, limit, after
+            )
+        
+        # Windowed metric sums per campaign, read from the daily rollups
+        metrics_subquery = RollupRepository(self.db).campaign_totals_subquery(
+            start_date=start_date,
+            end_date=end_date,
+        )
+        
+        query = self.db.query(
+            Campaign,
+            metrics_subquery.c.total_spend,
+            metrics_subquery.c.total_impressions,
+            metrics_subquery.c.total_clicks,
+            metrics_subquery.c.total_conversions,
+            metrics_subquery.c.total_conversion_value,
+        ).outerjoin(metrics_subquery, metrics_subquery.c.campaign_id == Campaign.id)
         
         if platform:
             query = query.filter(Campaign.platform == platform)
@@ -83,61 +180,219 @@ class CampaignRepository:
         if campaign_type:
             query = query.filter(Campaign.campaign_type == campaign_type)
         
-        campaigns = query.order_by(Campaign.created_at.desc()).all()
+        rows = self._paginate(query, limit, after).all()
         
+        return [self._to_metrics_dict(campaign, metrics) for campaign, *metrics in rows]
+
+    def get_summary(
+        self,
+        days: int = 7,
+        platform: Optional[Platform] = None,
+        status: Optional[CampaignStatus] = None,
+        campaign_type: Optional[CampaignType] = None,
+    ) -> dict:
+        """
+        Get dashboard header totals for the last N days.
+        Returns overall totals plus totals per platform, campaign type and
+        status, over the same campaigns and window as ``get_with_metrics``.
+
+        Runs one statement: GROUP BY GROUPING SETS on PostgreSQL, and a
+        group by all three dimensions rolled up in Python elsewhere (at most
+        one row per platform/type/status combination).
+        """
         # Calculate date range
         end_date = datetime.utcnow().date()
         start_date = end_date - timedelta(days=days)
         
-        # For each campaign, aggregate metrics
-        result = []
-        for campaign in campaigns:
-            # Get metrics for this campaign within date range
-            metrics_query = self.db.query(
-                func.sum(CampaignMetric.spend).label('total_spend'),
-                func.sum(CampaignMetric.impressions).label('total_impressions'),
-                func.sum(CampaignMetric.clicks).label('total_clicks'),
-                func.sum(CampaignMetric.conversions).label('total_conversions'),
-                func.sum(CampaignMetric.conversion_value).label('total_conversion_value'),
-            ).filter(
-                and_(
-                    CampaignMetric.campaign_id == campaign.id,
-                    CampaignMetric.date >= start_date,
-                    CampaignMetric.date <= end_date,
+        metrics_subquery = RollupRepository(self.db).campaign_totals_subquery(
+            start_date=start_date,
+            end_date=end_date,
+        )
+        dimension_columns = {
+            "platform": Campaign.platform,
+            "type": Campaign.campaign_type,
+            "status": Campaign.status,
+        }
+        grouping_sets = self.db.get_bind().dialect.name == "postgresql"
+        
+        columns = [column.label(name) for name, column in dimension_columns.items()]
+        if grouping_sets:
+            columns += [
+                func.grouping(column).label(f"grouping_{name}")
+                for name, column in dimension_columns.items()
+            ]
+        
+        query = self.db.query(
+            *columns,
+            func.count(Campaign.id).label('campaign_count'),
+            func.sum(metrics_subquery.c.total_spend).label('total_spend'),
+            func.sum(metrics_subquery.c.total_impressions).label('total_impressions'),
+            func.sum(metrics_subquery.c.total_clicks).label('total_clicks'),
+            func.sum(metrics_subquery.c.total_conversions).label('total_conversions'),
+            func.sum(metrics_subquery.c.total_conversion_value).label('total_conversion_value'),
+        ).outerjoin(metrics_subquery, metrics_subquery.c.campaign_id == Campaign.id)
+        
+        if platform:
+            query = query.filter(Campaign.platform == platform)
+        if status:
+            query = query.filter(Campaign.status == status)
+        if campaign_type:
+            query = query.filter(Campaign.campaign_type == campaign_type)
+        
+        if grouping_sets:
+            query = query.group_by(func.grouping_sets(
+                *[tuple_(column) for column in dimension_columns.values()],
+                tuple_(),
+            ))
+        else:
+            query = query.group_by(*dimension_columns.values())
+        
+        total = [0] * len(SUMMARY_MEASURES)
+        groups = {name: {} for name in dimension_columns}
+        
+        for row in query.all():
+            values = [getattr(row, measure) or 0 for measure in SUMMARY_MEASURES]
+        
+            if grouping_sets:
+                # Each row belongs to exactly one grouping set
+                names = [name for name in dimension_columns if getattr(row, f"grouping_{name}") == 0]
+                targets = [groups[name].setdefault(getattr(row, name).value, [0] * len(values)) for name in names]
+                if not names:
+                    targets = [total]
+            else:
+                targets = [total] + [
+                    groups[name].setdefault(getattr(row, name).value, [0] * len(values))
+                    for name in dimension_columns
+                ]
+        
+            for target in targets:
+                for i, value in enumerate(values):
+                    target[i] += value
+        
+        return {
+            "total": self._to_summary_dict(total),
+            "byPlatform": [dict(key=key, **self._to_summary_dict(v)) for key, v in sorted(groups["platform"].items())],
+            "byType": [dict(key=key, **self._to_summary_dict(v)) for key, v in sorted(groups["type"].items())],
+            "byStatus": [dict(key=key, **self._to_summary_dict(v)) for key, v in sorted(groups["status"].items())],
+        }
+
+    def _get_with_metrics_from_cube(
+        self,
+        start_date: date,
+        end_date: date,
+        platform: Optional[Platform],
+        status: Optional[CampaignStatus],
+        campaign_type: Optional[CampaignType],
+        limit: Optional[int],
+        after: Optional[Tuple[datetime, int]],
+    ) -> List[dict]:
+        """Cube-backed variant of ``get_with_metrics``."""
+        query = self.db.query(Campaign)
+        
+        if platform:
+            query = query.filter(Campaign.platform == platform)
+        if status:
+            query = query.filter(Campaign.status == status)
+        if campaign_type:
+            query = query.filter(Campaign.campaign_type == campaign_type)
+        
+        campaigns = self._paginate(query, limit, after).all()
+        totals = metric_cube.campaign_totals(
+            self.db,
+            [campaign.id for campaign in campaigns],
+            start_date,
+            end_date,
+        )
+        empty = (None, None, None, None, None)
+        
+        return [self._to_metrics_dict(campaign, totals.get(campaign.id, empty)) for campaign in campaigns]
+
+    @staticmethod
+    def _paginate(query, limit: Optional[int], after: Optional[Tuple[datetime, int]]):
+        """Order newest first by (created_at, id) and apply an optional keyset page."""
+        if after:
+            after_created_at, after_id = after
+            query = query.filter(
+                or_(
+                    Campaign.created_at < after_created_at,
+                    and_(Campaign.created_at == after_created_at, Campaign.id < after_id),
                 )
             )
-            
-            metrics = metrics_query.first()
-            
-            # Calculate CTR and ROAS
-            total_impressions = metrics.total_impressions or 0
-            total_clicks = metrics.total_clicks or 0
-            total_spend = float(metrics.total_spend or 0)
-            total_conversion_value = float(metrics.total_conversion_value or 0)
-            
-            ctr = (total_clicks / total_impressions * 100) if total_impressions > 0 else 0.0
-            roas = (total_conversion_value / total_spend) if total_spend > 0 else 0.0
-            
-            result.append({
-                "id": campaign.id,
-                "name": campaign.name,
-                "platform": campaign.platform.value,
-                "type": campaign.campaign_type.value,
-                "status": campaign.status.value,
-                "objective": campaign.objective,
-                "dailyBudget": str(campaign.daily_budget),
-                "productCategories": campaign.product_categories,
-                "createdAt": campaign.created_at.isoformat() if campaign.created_at else None,
-                "totalSpend": total_spend,
-                "totalImpressions": metrics.total_impressions or 0,
-                "totalClicks": metrics.total_clicks or 0,
-                "totalConversions": metrics.total_conversions or 0,
-                "totalConversionValue": total_conversion_value,
-                "ctr": round(ctr, 2),
-                "roas": round(roas, 2),
-            })
-        
-        return result
+        
+        query = query.order_by(Campaign.created_at.desc(), Campaign.id.desc())
+        
+        if limit:
+            query = query.limit(limit)
+        return query
+
+    @staticmethod
+    def _to_metrics_dict(campaign: Campaign, metrics: list) -> dict:
+        """Build the dashboard dictionary for a campaign and its summed metrics."""
+        (
+            total_spend,
+            total_impressions,
+            total_clicks,
+            total_conversions,
+            total_conversion_value,
+        ) = metrics
+        
+        # Calculate CTR and ROAS
+        total_impressions = total_impressions or 0
+        total_clicks = total_clicks or 0
+        total_spend = float(total_spend or 0)
+        total_conversion_value = float(total_conversion_value or 0)
+        
+        ctr = (total_clicks / total_impressions * 100) if total_impressions > 0 else 0.0
+        roas = (total_conversion_value / total_spend) if total_spend > 0 else 0.0
+        
+        return {
+            "id": campaign.id,
+            "name": campaign.name,
+            "platform": campaign.platform.value,
+            "type": campaign.campaign_type.value,
+            "status": campaign.status.value,
+            "objective": campaign.objective,
+            "dailyBudget": str(campaign.daily_budget),
+            "productCategories": campaign.product_categories,
+            "createdAt": campaign.created_at.isoformat() if campaign.created_at else None,
+            "totalSpend": total_spend,
+            "totalImpressions": total_impressions,
+            "totalClicks": total_clicks,
+            "totalConversions": total_conversions or 0,
+            "totalConversionValue": total_conversion_value,
+            "ctr": round(ctr, 2),
+            "roas": round(roas, 2),
+        }
+
+    @staticmethod
+    def _to_summary_dict(measures: list) -> dict:
+        """Build the summary dictionary for one group of summed measures."""
+        (
+            campaign_count,
+            total_spend,
+            total_impressions,
+            total_clicks,
+            total_conversions,
+            total_conversion_value,
+        ) = measures
+        
+        # Calculate CTR and ROAS
+        total_spend = float(total_spend)
+        total_conversion_value = float(total_conversion_value)
+        
+        ctr = (total_clicks / total_impressions * 100) if total_impressions > 0 else 0.0
+        roas = (total_conversion_value / total_spend) if total_spend > 0 else 0.0
+        
+        return {
+            "campaignCount": int(campaign_count),
+            "totalSpend": round(total_spend, 2),
+            "totalImpressions": int(total_impressions),
+            "totalClicks": int(total_clicks),
+            "totalConversions": int(total_conversions),
+            "totalConversionValue": round(total_conversion_value, 2),
+            "ctr": round(ctr, 2),
+            "roas": round(roas, 2),
+        }
 
     def update_status(
         self,
@@ -149,8 +404,7 @@ class CampaignRepository:
         if campaign:
             campaign.status = status
             campaign.updated_at = datetime.utcnow()
-            self.db.commit()
-            self.db.refresh(campaign)
+            self._commit_update(campaign)
         return campaign
 
     def update_platform_campaign_id(
@@ -163,6 +417,36 @@ class CampaignRepository:
         if campaign:
             campaign.platform_campaign_id = platform_campaign_id
             campaign.updated_at = datetime.utcnow()
-            self.db.commit()
-            self.db.refresh(campaign)
+            self._commit_update(campaign)
         return campaign
+
+    def complete_pending(
+        self,
+        campaign_id: int,
+        name: str,
+        daily_budget: float,
+        platform_campaign_id: Optional[str],
+        status: CampaignStatus = CampaignStatus.ACTIVE,
+    ) -> Optional[Campaign]:
+        """Fill in a pending campaign once its platform has created it."""
+        campaign = self.get_by_id(campaign_id)
+        if campaign:
+            campaign.name = name
+            campaign.daily_budget = Decimal(str(daily_budget)).quantize(Decimal("0.01"))
+            campaign.platform_campaign_id = platform_campaign_id
+            campaign.status = status
+            campaign.updated_at = datetime.utcnow()
+            self._commit_update(campaign)
+        return campaign
+
+    def _commit_update(self, campaign: Campaign) -> None:
+        """Commit changes to a campaign, or flush them within a unit of work."""
+        if self.uow is not None:
+            self.db.flush()
+            self.uow.mark_dirty()
+            return
+        version = DataVersionRepository(self.db).bump()
+        self.db.commit()
+        dashboard_cache.invalidate()
+        metric_cube.advance(version)
+        self.db.refresh(campaign)
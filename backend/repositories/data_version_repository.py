@@ -0,0 +1,45 @@
+"""Data version repository for cheap change detection."""
+from sqlalchemy.orm import Session
+from sqlalchemy import select, update, insert
+from models.data_version import DataVersion
+
+# Primary key of the single counter row
+DATA_VERSION_ID = 1
+
+
+class DataVersionRepository:
+    """
+    Repository for the monotonically increasing data version.
+
+    Writers bump the version inside their own transaction, so it changes
+    exactly when their data commits and is shared by all workers. Readers
+    use it as a validator: an unchanged version means unchanged data.
+    Nothing here commits.
+    """
+
+    def __init__(self, db: Session):
+        """Initialize repository with database session."""
+        self.db = db
+
+    def current(self) -> int:
+        """Get the current data version."""
+        version = self.db.execute(
+            select(DataVersion.version).where(DataVersion.id == DATA_VERSION_ID)
+        ).scalar()
+        return version or 0
+
+    def bump(self) -> int:
+        """
+        Increment the data version as part of the caller's transaction.
+        Returns the version the transaction will commit; the UPDATE holds
+        the counter row until then, so no other writer can take it.
+        """
+        result = self.db.execute(
+            update(DataVersion)
+            .where(DataVersion.id == DATA_VERSION_ID)
+            .values(version=DataVersion.version + 1)
+        )
+        if result.rowcount == 0:
+            # Tables created without migrations have no counter row yet
+            self.db.execute(insert(DataVersion).values(id=DATA_VERSION_ID, version=1))
+        return self.current()
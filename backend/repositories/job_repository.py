@@ -0,0 +1,76 @@
+"""Job repository for background job bookkeeping."""
+from typing import TYPE_CHECKING, List, Optional
+from datetime import datetime
+from sqlalchemy.orm import Session
+from sqlalchemy import update
+from models.job import Job, JobStatus
+
+if TYPE_CHECKING:
+    from repositories.unit_of_work import UnitOfWork
+
+
+class JobRepository:
+    """Repository for background job records."""
+
+    def __init__(self, db: Session, uow: Optional["UnitOfWork"] = None):
+        """
+        Initialize repository with database session.
+
+        With a unit of work, new jobs are flushed and left for ``uow.commit()``.
+        """
+        self.db = db
+        self.uow = uow
+
+    def create(self, kind: str, payload: dict) -> Job:
+        """Create a queued job."""
+        job = Job(kind=kind, status=JobStatus.QUEUED, payload=payload)
+        self.db.add(job)
+        if self.uow is not None:
+            self.db.flush()
+            return job
+        self.db.commit()
+        self.db.refresh(job)
+        return job
+
+    def get_by_id(self, job_id: int) -> Optional[Job]:
+        """Get a job by ID."""
+        return self.db.query(Job).filter(Job.id == job_id).first()
+
+    def get_unfinished(self) -> List[Job]:
+        """Get queued and running jobs, oldest first."""
+        return (
+            self.db.query(Job)
+            .filter(Job.status.in_([JobStatus.QUEUED, JobStatus.RUNNING]))
+            .order_by(Job.id)
+            .all()
+        )
+
+    def claim(self, job_id: int) -> bool:
+        """
+        Move a queued job to running.
+
+        Returns False if the job is no longer queued, so a job is only ever
+        started once even if it was submitted twice.
+        """
+        result = self.db.execute(
+            update(Job)
+            .where(Job.id == job_id, Job.status == JobStatus.QUEUED)
+            .values(status=JobStatus.RUNNING, started_at=datetime.utcnow())
+        )
+        self.db.commit()
+        return result.rowcount == 1
+
+    def finish(
+        self,
+        job_id: int,
+        status: JobStatus,
+        result: Optional[dict] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        """Record a job's outcome."""
+        self.db.execute(
+            update(Job)
+            .where(Job.id == job_id)
+            .values(status=status, result=result, error=error, finished_at=datetime.utcnow())
+        )
+        self.db.commit()
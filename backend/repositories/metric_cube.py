@@ -0,0 +1,386 @@
+"""In-process columnar metric cube for fast dashboard aggregation."""
+import threading
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from config import settings
+from models.campaign import Campaign, Platform, CampaignType
+from models.metric import CampaignMetric
+from repositories.data_version_repository import DataVersionRepository
+from utils.logger import get_logger
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+logger = get_logger(__name__)
+
+EPOCH = date(1970, 1, 1)
+
+# Maximum number of campaign IDs per IN (...) clause when refreshing
+ID_CHUNK_SIZE = 500
+
+PLATFORMS = list(Platform)
+CAMPAIGN_TYPES = list(CampaignType)
+
+GROUP_DIMENSIONS = ("platform", "campaign_type", "campaign_id", "date")
+
+# Column name -> dtype of the metric arrays
+METRIC_COLUMNS = {
+    "campaign": "int32",      # index into the campaign arrays
+    "day": "int32",           # days since 1970-01-01
+    "spend": "int64",         # cents
+    "impressions": "int64",
+    "clicks": "int64",
+    "conversions": "int64",
+    "value": "int64",         # conversion value in cents
+}
+
+MEASURE_COLUMNS = ("spend", "impressions", "clicks", "conversions", "value")
+
+
+class MetricCube:
+    """
+    Columnar copy of campaign_metrics held in contiguous NumPy arrays.
+
+    Rows are keyed by (campaign, day); writes made through MetricRepository
+    refresh only the touched keys. Aggregations are vectorized reductions
+    over the arrays. The cube is per process and remembers the data
+    version it reflects: local writes advance it, and a query that finds a
+    newer version in the database (a write from another worker) reloads
+    the cube first, as does one after METRIC_CUBE_RELOAD_SECONDS.
+    """
+
+    def __init__(self):
+        """Initialize an empty, unloaded cube."""
+        self._lock = threading.RLock()
+        self._loaded_at: Optional[float] = None
+        self._version: Optional[int] = None
+        self._reset()
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the cube holds data that can be refreshed incrementally."""
+        return self._loaded_at is not None
+
+    def load(self, db: Session) -> None:
+        """Fully (re)load the cube from the database."""
+        _require_numpy()
+        started = time.monotonic()
+
+        with self._lock:
+            self._reset()
+            # Read before the rows, so the data is at least this version
+            self._version = DataVersionRepository(db).current()
+            for row in db.execute(select(Campaign.id, Campaign.platform, Campaign.campaign_type)):
+                self._campaign_slot(row.id, row.platform, row.campaign_type)
+
+            query = select(
+                CampaignMetric.campaign_id,
+                CampaignMetric.date,
+                CampaignMetric.spend,
+                CampaignMetric.impressions,
+                CampaignMetric.clicks,
+                CampaignMetric.conversions,
+                CampaignMetric.conversion_value,
+            ).execution_options(yield_per=10000)
+            self._apply_rows(db.execute(query))
+            self._loaded_at = time.monotonic()
+
+        logger.info(f"Loaded metric cube: {self._size} rows in {time.monotonic() - started:.2f}s")
+
+    def refresh(
+        self,
+        db: Session,
+        campaign_ids: Iterable[int],
+        dates: Iterable[date],
+        version: Optional[int] = None,
+    ) -> None:
+        """
+        Re-read the given (campaign, day) keys after a committed write at
+        data ``version``. Does nothing until the cube has been loaded.
+        """
+        if not self.is_loaded:
+            return
+
+        campaign_ids = sorted(set(campaign_ids))
+        dates = sorted(set(dates))
+        if not campaign_ids or not dates:
+            self.advance(version)
+            return
+
+        with self._lock:
+            for i in range(0, len(campaign_ids), ID_CHUNK_SIZE):
+                chunk = campaign_ids[i:i + ID_CHUNK_SIZE]
+                query = (
+                    select(
+                        CampaignMetric.campaign_id,
+                        CampaignMetric.date,
+                        CampaignMetric.spend,
+                        CampaignMetric.impressions,
+                        CampaignMetric.clicks,
+                        CampaignMetric.conversions,
+                        CampaignMetric.conversion_value,
+                        Campaign.platform,
+                        Campaign.campaign_type,
+                    )
+                    .join(Campaign, Campaign.id == CampaignMetric.campaign_id)
+                    .where(CampaignMetric.campaign_id.in_(chunk), CampaignMetric.date.in_(dates))
+                )
+                self._apply_rows(db.execute(query), with_campaign=True)
+            self.advance(version)
+
+    def advance(self, version: Optional[int]) -> None:
+        """
+        Record a committed local write at data ``version`` whose rows are
+        already applied (or that did not touch metrics). Only advances from
+        the version just before it; if another worker wrote in between, the
+        next query sees the gap and reloads.
+        """
+        if version is None:
+            return
+        with self._lock:
+            if self._version is not None and self._version == version - 1:
+                self._version = version
+
+    def invalidate(self) -> None:
+        """Drop all data; the next query reloads the cube."""
+        with self._lock:
+            self._reset()
+            self._loaded_at = None
+            self._version = None
+
+    def campaign_totals(
+        self,
+        db: Session,
+        campaign_ids: Sequence[int],
+        start_date: date,
+        end_date: date,
+    ) -> Dict[int, Tuple[Decimal, int, int, int, Decimal]]:
+        """
+        Sum metrics per campaign over a date range.
+        Returns {campaign_id: (spend, impressions, clicks, conversions, conversion_value)}
+        for the campaigns in ``campaign_ids`` that have metrics in range.
+        """
+        with self._lock:
+            self._ensure_fresh(db)
+            columns = self._view()
+            campaign_index = dict(self._campaign_index)
+            n_campaigns = len(campaign_index)
+
+        mask = (columns["day"] >= _day(start_date)) & (columns["day"] <= _day(end_date))
+        campaigns = columns["campaign"][mask]
+        sums = {
+            name: np.bincount(campaigns, weights=columns[name][mask], minlength=n_campaigns)
+            for name in MEASURE_COLUMNS
+        }
+        counts = np.bincount(campaigns, minlength=n_campaigns)
+
+        totals = {}
+        for campaign_id in campaign_ids:
+            idx = campaign_index.get(campaign_id)
+            if idx is None or counts[idx] == 0:
+                continue
+            totals[campaign_id] = (
+                Decimal(int(sums["spend"][idx])) / 100,
+                int(sums["impressions"][idx]),
+                int(sums["clicks"][idx]),
+                int(sums["conversions"][idx]),
+                Decimal(int(sums["value"][idx])) / 100,
+            )
+        return totals
+
+    def aggregate(
+        self,
+        db: Session,
+        group_by: Sequence[str],
+        start_date: date,
+        end_date: date,
+        platform: Optional[Platform] = None,
+        campaign_type: Optional[CampaignType] = None,
+    ) -> List[dict]:
+        """
+        Group metrics by any of platform, campaign_type, campaign_id and date.
+        Returns one dictionary per group with summed measures plus CTR and ROAS.
+        """
+        unknown = set(group_by) - set(GROUP_DIMENSIONS)
+        if unknown:
+            raise ValueError(f"Unknown group_by dimension(s): {', '.join(sorted(unknown))}")
+
+        with self._lock:
+            self._ensure_fresh(db)
+            columns = self._view()
+            campaign_platform = self._campaign_platform[:len(self._campaign_index)].copy()
+            campaign_type_codes = self._campaign_type[:len(self._campaign_index)].copy()
+            campaign_ids = self._campaign_ids[:len(self._campaign_index)].copy()
+
+        mask = (columns["day"] >= _day(start_date)) & (columns["day"] <= _day(end_date))
+        if platform:
+            mask &= campaign_platform[columns["campaign"]] == PLATFORMS.index(platform)
+        if campaign_type:
+            mask &= campaign_type_codes[columns["campaign"]] == CAMPAIGN_TYPES.index(campaign_type)
+
+        campaigns = columns["campaign"][mask]
+        dimension_values = {
+            "platform": campaign_platform[campaigns].astype("int64"),
+            "campaign_type": campaign_type_codes[campaigns].astype("int64"),
+            "campaign_id": campaign_ids[campaigns],
+            "date": columns["day"][mask].astype("int64"),
+        }
+
+        if group_by:
+            keys = np.stack([dimension_values[d] for d in group_by], axis=1)
+            groups, inverse = np.unique(keys, axis=0, return_inverse=True)
+            inverse = inverse.reshape(-1)
+        else:
+            groups = np.zeros((1 if campaigns.size else 0, 0), dtype="int64")
+            inverse = np.zeros(campaigns.size, dtype="int64")
+
+        sums = {
+            name: np.bincount(inverse, weights=columns[name][mask], minlength=len(groups))
+            for name in MEASURE_COLUMNS
+        }
+
+        result = []
+        for g, group in enumerate(groups):
+            row = {}
+            for dimension, value in zip(group_by, group):
+                value = int(value)
+                if dimension == "platform":
+                    row["platform"] = PLATFORMS[value].value
+                elif dimension == "campaign_type":
+                    row["campaign_type"] = CAMPAIGN_TYPES[value].value
+                elif dimension == "date":
+                    row["date"] = (EPOCH + timedelta(days=value)).isoformat()
+                else:
+                    row["campaign_id"] = value
+
+            total_spend = float(sums["spend"][g]) / 100
+            total_impressions = int(sums["impressions"][g])
+            total_clicks = int(sums["clicks"][g])
+            total_conversion_value = float(sums["value"][g]) / 100
+
+            # Calculate CTR and ROAS
+            ctr = (total_clicks / total_impressions * 100) if total_impressions > 0 else 0.0
+            roas = (total_conversion_value / total_spend) if total_spend > 0 else 0.0
+
+            row.update({
+                "total_spend": round(total_spend, 2),
+                "total_impressions": total_impressions,
+                "total_clicks": total_clicks,
+                "total_conversions": int(sums["conversions"][g]),
+                "total_conversion_value": round(total_conversion_value, 2),
+                "ctr": round(ctr, 2),
+                "roas": round(roas, 2),
+            })
+            result.append(row)
+
+        # Match the SQL engine's ordering by dimension value
+        result.sort(key=lambda item: tuple(item[d] for d in group_by))
+        return result
+
+    def _ensure_fresh(self, db: Session) -> None:
+        """Load the cube if it is empty, behind the data version or older than the reload interval."""
+        if (
+            self._loaded_at is None
+            or DataVersionRepository(db).current() != self._version
+            or time.monotonic() - self._loaded_at > settings.METRIC_CUBE_RELOAD_SECONDS
+        ):
+            self.load(db)
+
+    def _reset(self) -> None:
+        """Allocate empty arrays and indexes."""
+        self._campaign_index: Dict[int, int] = {}
+        self._row_index: Dict[Tuple[int, int], int] = {}
+        self._size = 0
+        if np is None:
+            return
+        self._campaign_ids = np.zeros(1024, dtype="int64")
+        self._campaign_platform = np.zeros(1024, dtype="int8")
+        self._campaign_type = np.zeros(1024, dtype="int8")
+        self._columns = {name: np.zeros(4096, dtype=dtype) for name, dtype in METRIC_COLUMNS.items()}
+
+    def _view(self) -> Dict[str, "np.ndarray"]:
+        """Copy the populated part of each metric column for lock-free reads."""
+        return {name: column[:self._size].copy() for name, column in self._columns.items()}
+
+    def _campaign_slot(self, campaign_id: int, platform: Platform, campaign_type: CampaignType) -> int:
+        """Return the array index for a campaign, registering it if new."""
+        idx = self._campaign_index.get(campaign_id)
+        if idx is not None:
+            return idx
+
+        idx = len(self._campaign_index)
+        if idx >= len(self._campaign_ids):
+            self._campaign_ids = _grow(self._campaign_ids)
+            self._campaign_platform = _grow(self._campaign_platform)
+            self._campaign_type = _grow(self._campaign_type)
+
+        self._campaign_ids[idx] = campaign_id
+        self._campaign_platform[idx] = PLATFORMS.index(platform)
+        self._campaign_type[idx] = CAMPAIGN_TYPES.index(campaign_type)
+        self._campaign_index[campaign_id] = idx
+        return idx
+
+    def _apply_rows(self, rows, with_campaign: bool = False) -> None:
+        """Insert or overwrite metric rows keyed by (campaign, day)."""
+        for row in rows:
+            if with_campaign:
+                campaign = self._campaign_slot(row.campaign_id, row.platform, row.campaign_type)
+            else:
+                campaign = self._campaign_index.get(row.campaign_id)
+                if campaign is None:
+                    continue
+
+            day = _day(row.date)
+            position = self._row_index.get((campaign, day))
+            if position is None:
+                position = self._size
+                if position >= len(self._columns["day"]):
+                    self._columns = {name: _grow(column) for name, column in self._columns.items()}
+                self._row_index[(campaign, day)] = position
+                self._size += 1
+
+            self._columns["campaign"][position] = campaign
+            self._columns["day"][position] = day
+            self._columns["spend"][position] = _cents(row.spend)
+            self._columns["impressions"][position] = row.impressions or 0
+            self._columns["clicks"][position] = row.clicks or 0
+            self._columns["conversions"][position] = row.conversions or 0
+            self._columns["value"][position] = _cents(row.conversion_value)
+
+
+def _require_numpy() -> None:
+    """Raise a clear error when the cube engine is used without NumPy."""
+    if np is None:
+        raise RuntimeError(
+            "The cube metrics engine requires NumPy. Install it with "
+            "`poetry install --extras cube` or set METRICS_ENGINE=sql."
+        )
+
+
+def _grow(array: "np.ndarray") -> "np.ndarray":
+    """Return a copy of ``array`` with doubled capacity."""
+    grown = np.zeros(len(array) * 2, dtype=array.dtype)
+    grown[:len(array)] = array
+    return grown
+
+
+def _day(value: date) -> int:
+    """Days since 1970-01-01."""
+    return (value - EPOCH).days
+
+
+def _cents(value) -> int:
+    """Convert a money amount to integer cents."""
+    if value is None:
+        return 0
+    return int((Decimal(str(value)) * 100).to_integral_value())
+
+
+# Process-wide cube shared by all repositories
+metric_cube = MetricCube()
@@ -1,18 +1,43 @@
 """Campaign metrics repository for data access operations."""
-from typing import List, Optional
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, Sequence, Tuple
 from datetime import date, datetime, timedelta
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
+from sqlalchemy import func, and_, or_, cast, Date
+from sqlalchemy.dialects import postgresql, sqlite
 from models.metric import CampaignMetric
-from models.campaign import Campaign
+from models.campaign import Campaign, Platform, CampaignType, CampaignStatus
+from models.rollup import CampaignDailyRollup, SegmentDailyRollup
+from config import settings
+from repositories.rollup_repository import RollupRepository
+from repositories.data_version_repository import DataVersionRepository
+from repositories.metric_cube import metric_cube, GROUP_DIMENSIONS
+from utils.cache import dashboard_cache
+
+if TYPE_CHECKING:
+    from repositories.unit_of_work import UnitOfWork
+
+# Rows per INSERT ... ON CONFLICT batch in upsert_bulk
+UPSERT_BATCH_SIZE = 5000
+
+# Bucket sizes supported by get_series
+SERIES_INTERVALS = ("day", "week", "month")
+
+# Columns overwritten when a (campaign_id, date) row already exists
+UPSERT_UPDATE_COLUMNS = ("spend", "impressions", "clicks", "conversions", "conversion_value", "currency")
 
 
 class MetricRepository:
     """Repository for campaign metrics data access operations."""
 
-    def __init__(self, db: Session):
-        """Initialize repository with database session."""
+    def __init__(self, db: Session, uow: Optional["UnitOfWork"] = None):
+        """
+        Initialize repository with database session.
+
+        With a unit of work, writes are flushed and left for ``uow.commit()``.
+        """
         self.db = db
+        self.uow = uow
+        self.rollup_repo = RollupRepository(db)
 
     def create(
         self,
@@ -37,8 +62,10 @@ class MetricRepository:
             currency=currency,
         )
         self.db.add(metric)
-        self.db.commit()
-        self.db.refresh(metric)
+        self.db.flush()
+        self._commit_write([campaign_id], [metric_date])
+        if self.uow is None:
+            self.db.refresh(metric)
         return metric
 
     def get_by_campaign(
@@ -59,6 +86,108 @@ class MetricRepository:
         
         return query.order_by(CampaignMetric.date.desc()).all()
 
+    def iter_daily_rows(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        platform: Optional[Platform] = None,
+        status: Optional[CampaignStatus] = None,
+        campaign_type: Optional[CampaignType] = None,
+        batch_size: int = 1000,
+    ) -> Iterator:
+        """
+        Iterate daily metric rows joined with their campaign attributes.
+
+        Runs one joined query over campaign_metrics and campaigns and fetches
+        it in batches of ``batch_size`` from a server-side cursor, yielding
+        lightweight rows instead of ORM objects. Rows are ordered like the
+        dashboard expects: newest campaigns first, then newest dates first.
+        """
+        query = self._daily_rows_query(
+            start_date=start_date,
+            end_date=end_date,
+            platform=platform,
+            status=status,
+            campaign_type=campaign_type,
+        )
+        
+        query = query.order_by(
+            Campaign.created_at.desc(),
+            Campaign.id.desc(),
+            CampaignMetric.date.desc(),
+        ).execution_options(yield_per=batch_size)
+        
+        yield from query
+
+    def get_daily_rows_page(
+        self,
+        limit: int,
+        after: Optional[Tuple[date, int]] = None,
+        campaign_id: Optional[int] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> List:
+        """
+        Get one keyset page of daily metric rows joined with their campaign.
+
+        Rows are ordered newest first by (date, campaign_id); pass the key of
+        the last row seen as ``after`` to fetch the next page. Backed by the
+        (date, campaign_id) index, so deep pages cost the same as the first.
+        """
+        query = self._daily_rows_query(start_date=start_date, end_date=end_date)
+        
+        if campaign_id:
+            query = query.filter(CampaignMetric.campaign_id == campaign_id)
+        if after:
+            after_date, after_campaign_id = after
+            query = query.filter(
+                or_(
+                    CampaignMetric.date < after_date,
+                    and_(CampaignMetric.date == after_date, CampaignMetric.campaign_id < after_campaign_id),
+                )
+            )
+        
+        return query.order_by(
+            CampaignMetric.date.desc(),
+            CampaignMetric.campaign_id.desc(),
+        ).limit(limit).all()
+
+    def _daily_rows_query(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        platform: Optional[Platform] = None,
+        status: Optional[CampaignStatus] = None,
+        campaign_type: Optional[CampaignType] = None,
+    ):
+        """Build the filtered campaign_metrics ⨝ campaigns row query."""
+        query = self.db.query(
+            CampaignMetric.campaign_id,
+            Campaign.name.label('campaign_name'),
+            Campaign.platform,
+            Campaign.campaign_type,
+            CampaignMetric.date,
+            CampaignMetric.spend,
+            CampaignMetric.impressions,
+            CampaignMetric.clicks,
+            CampaignMetric.conversions,
+            CampaignMetric.conversion_value,
+            CampaignMetric.currency,
+        ).join(Campaign, Campaign.id == CampaignMetric.campaign_id)
+        
+        if start_date:
+            query = query.filter(CampaignMetric.date >= start_date)
+        if end_date:
+            query = query.filter(CampaignMetric.date <= end_date)
+        if platform:
+            query = query.filter(Campaign.platform == platform)
+        if status:
+            query = query.filter(Campaign.status == status)
+        if campaign_type:
+            query = query.filter(Campaign.campaign_type == campaign_type)
+        
+        return query
+
     def aggregate_metrics(
         self,
         campaign_id: int,
@@ -104,6 +233,189 @@ class MetricRepository:
             "roas": round(roas, 2),
         }
 
+    def aggregate_by(
+        self,
+        group_by: Sequence[str],
+        start_date: date,
+        end_date: date,
+        platform: Optional[Platform] = None,
+        campaign_type: Optional[CampaignType] = None,
+    ) -> List[dict]:
+        """
+        Group metric totals by any of platform, campaign_type, campaign_id and date.
+
+        Returns one dictionary per group with summed measures plus CTR and
+        ROAS. Reads the daily rollups, or the in-memory metric cube when
+        METRICS_ENGINE=cube.
+        """
+        unknown = set(group_by) - set(GROUP_DIMENSIONS)
+        if unknown:
+            raise ValueError(f"Unknown group_by dimension(s): {', '.join(sorted(unknown))}")
+        
+        if settings.METRICS_ENGINE == "cube":
+            return metric_cube.aggregate(
+                self.db, group_by, start_date, end_date,
+                platform=platform, campaign_type=campaign_type,
+            )
+        
+        dimension_columns = {
+            "platform": Campaign.platform,
+            "campaign_type": Campaign.campaign_type,
+            "campaign_id": CampaignDailyRollup.campaign_id,
+            "date": CampaignDailyRollup.date,
+        }
+        group_columns = [dimension_columns[d].label(d) for d in group_by]
+        
+        query = self.db.query(
+            *group_columns,
+            func.sum(CampaignDailyRollup.spend).label('total_spend'),
+            func.sum(CampaignDailyRollup.impressions).label('total_impressions'),
+            func.sum(CampaignDailyRollup.clicks).label('total_clicks'),
+            func.sum(CampaignDailyRollup.conversions).label('total_conversions'),
+            func.sum(CampaignDailyRollup.conversion_value).label('total_conversion_value'),
+        ).join(Campaign, Campaign.id == CampaignDailyRollup.campaign_id).filter(
+            and_(
+                CampaignDailyRollup.date >= start_date,
+                CampaignDailyRollup.date <= end_date,
+            )
+        )
+        
+        if platform:
+            query = query.filter(Campaign.platform == platform)
+        if campaign_type:
+            query = query.filter(Campaign.campaign_type == campaign_type)
+        if group_columns:
+            query = query.group_by(*group_columns).order_by(*group_columns)
+        
+        result = []
+        for row in query.all():
+            if row.total_impressions is None:
+                # Ungrouped sum over no rows
+                continue
+            
+            item = {}
+            for dimension in group_by:
+                value = getattr(row, dimension)
+                if dimension in ("platform", "campaign_type"):
+                    value = value.value
+                elif dimension == "date":
+                    value = value.isoformat()
+                item[dimension] = value
+            
+            total_impressions = row.total_impressions or 0
+            total_clicks = row.total_clicks or 0
+            total_spend = float(row.total_spend or 0)
+            total_conversion_value = float(row.total_conversion_value or 0)
+            
+            # Calculate CTR and ROAS
+            ctr = (total_clicks / total_impressions * 100) if total_impressions > 0 else 0.0
+            roas = (total_conversion_value / total_spend) if total_spend > 0 else 0.0
+            
+            item.update({
+                "total_spend": round(total_spend, 2),
+                "total_impressions": total_impressions,
+                "total_clicks": total_clicks,
+                "total_conversions": row.total_conversions or 0,
+                "total_conversion_value": round(total_conversion_value, 2),
+                "ctr": round(ctr, 2),
+                "roas": round(roas, 2),
+            })
+            result.append(item)
+        
+        return result
+
+    def get_series(
+        self,
+        interval: str,
+        start_date: date,
+        end_date: date,
+        campaign_id: Optional[int] = None,
+        platform: Optional[Platform] = None,
+    ) -> List[dict]:
+        """
+        Get metric totals per day, week or month over a date range.
+
+        Buckets are computed in SQL by truncating the rollup date (weeks
+        start on Monday) and summed per bucket, so the result has one row per
+        bucket instead of one per campaign and day. Reads the campaign rollups
+        for a single campaign and the segment rollups otherwise. Buckets
+        without metrics are filled with zeros.
+        """
+        if interval not in SERIES_INTERVALS:
+            raise ValueError(f"Unknown interval: {interval}. Must be one of: {', '.join(SERIES_INTERVALS)}")
+
+        if campaign_id:
+            rollup = CampaignDailyRollup
+            filters = [CampaignDailyRollup.campaign_id == campaign_id]
+        else:
+            rollup = SegmentDailyRollup
+            filters = [SegmentDailyRollup.platform == platform] if platform else []
+
+        bucket = self._date_bucket(rollup.date, interval).label('bucket')
+
+        query = self.db.query(
+            bucket,
+            func.sum(rollup.spend).label('total_spend'),
+            func.sum(rollup.impressions).label('total_impressions'),
+            func.sum(rollup.clicks).label('total_clicks'),
+            func.sum(rollup.conversions).label('total_conversions'),
+            func.sum(rollup.conversion_value).label('total_conversion_value'),
+        ).filter(
+            rollup.date >= start_date,
+            rollup.date <= end_date,
+            *filters,
+        ).group_by(bucket)
+
+        rows = {}
+        for row in query.all():
+            bucket_date = row.bucket
+            if isinstance(bucket_date, datetime):
+                bucket_date = bucket_date.date()
+            elif isinstance(bucket_date, str):
+                bucket_date = date.fromisoformat(bucket_date)
+            rows[bucket_date] = row
+
+        result = []
+        for bucket_date in _iter_buckets(interval, start_date, end_date):
+            row = rows.get(bucket_date)
+
+            total_impressions = int(row.total_impressions or 0) if row else 0
+            total_clicks = int(row.total_clicks or 0) if row else 0
+            total_spend = float(row.total_spend or 0) if row else 0.0
+            total_conversion_value = float(row.total_conversion_value or 0) if row else 0.0
+
+            # Calculate CTR and ROAS
+            ctr = (total_clicks / total_impressions * 100) if total_impressions > 0 else 0.0
+            roas = (total_conversion_value / total_spend) if total_spend > 0 else 0.0
+
+            result.append({
+                "bucket": bucket_date.isoformat(),
+                "total_spend": round(total_spend, 2),
+                "total_impressions": total_impressions,
+                "total_clicks": total_clicks,
+                "total_conversions": int(row.total_conversions or 0) if row else 0,
+                "total_conversion_value": round(total_conversion_value, 2),
+                "ctr": round(ctr, 2),
+                "roas": round(roas, 2),
+            })
+
+        return result
+
+    def _date_bucket(self, column, interval: str):
+        """Truncate a date column to the start of its day, week or month."""
+        if interval == "day":
+            return column
+
+        dialect = self.db.get_bind().dialect.name
+        if dialect == "postgresql":
+            return cast(func.date_trunc(interval, column), Date)
+        if dialect == "sqlite":
+            if interval == "week":
+                # Next Sunday (or the day itself), then back to its Monday
+                return func.date(column, 'weekday 0', '-6 days')
+            return func.date(column, 'start of month')
+        raise NotImplementedError(f"Series bucketing is not supported on the {dialect} dialect")
+
     def create_bulk(
         self,
         metrics: List[dict],
@@ -123,9 +435,68 @@ class MetricRepository:
             for m in metrics
         ]
         self.db.bulk_save_objects(metric_objects)
-        self.db.commit()
+        self._commit_write(
+            [m.campaign_id for m in metric_objects],
+            [m.date for m in metric_objects],
+        )
         return metric_objects
 
+    def upsert_bulk(
+        self,
+        metrics: List[dict],
+        batch_size: int = UPSERT_BATCH_SIZE,
+    ) -> int:
+        """
+        Insert or update metric records keyed by (campaign_id, date).
+
+        Uses the dialect-native INSERT ... ON CONFLICT DO UPDATE in batches
+        of ``batch_size`` rows, so re-ingesting a day replaces its values
+        instead of duplicating them. Rollups are refreshed for every touched
+        key and everything is committed in one transaction.
+        Returns the number of rows written.
+        """
+        dialect = self.db.get_bind().dialect.name
+        if dialect == "postgresql":
+            dialect_insert = postgresql.insert
+        elif dialect == "sqlite":
+            dialect_insert = sqlite.insert
+        else:
+            raise NotImplementedError(f"upsert_bulk is not supported on the {dialect} dialect")
+        
+        stmt = dialect_insert(CampaignMetric)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[CampaignMetric.campaign_id, CampaignMetric.date],
+            set_={column: getattr(stmt.excluded, column) for column in UPSERT_UPDATE_COLUMNS},
+        )
+        
+        campaign_ids = set()
+        dates = set()
+        written = 0
+        
+        for i in range(0, len(metrics), batch_size):
+            rows = [
+                {
+                    "campaign_id": m["campaign_id"],
+                    "date": m["date"],
+                    "spend": m.get("spend", 0.0),
+                    "impressions": m.get("impressions", 0),
+                    "clicks": m.get("clicks", 0),
+                    "conversions": m.get("conversions"),
+                    "conversion_value": m.get("conversion_value"),
+                    "currency": m.get("currency", "USD"),
+                    "created_at": datetime.utcnow(),
+                }
+                for m in metrics[i:i + batch_size]
+            ]
+            self.db.execute(stmt, rows)
+            
+            campaign_ids.update(row["campaign_id"] for row in rows)
+            dates.update(row["date"] for row in rows)
+            written += len(rows)
+        
+        self._commit_write(campaign_ids, dates)
+        return written
+
     def generate_mock_metrics(
         self,
         campaign_id: int,
@@ -165,5 +536,51 @@ class MetricRepository:
             metrics.append(metric)
         
         self.db.bulk_save_objects(metrics)
-        self.db.commit()
+        self._commit_write([campaign_id], [m.date for m in metrics])
         return metrics
+
+    def _commit_write(
+        self,
+        campaign_ids: Iterable[int],
+        dates: Iterable[date],
+    ) -> None:
+        """
+        Commit flushed metric rows for the given campaigns and days.
+        Refreshes the rollups and bumps the data version in the same
+        transaction, then the in-memory metric cube and the dashboard cache
+        once the commit has succeeded. Within a unit of work, only records
+        the write; ``uow.commit()`` does all of this once.
+        """
+        campaign_ids = set(campaign_ids)
+        dates = set(dates)
+        if self.uow is not None:
+            self.db.flush()
+            self.uow.track_metrics(campaign_ids, dates)
+            return
+        self.rollup_repo.refresh(campaign_ids, dates)
+        version = DataVersionRepository(self.db).bump()
+        self.db.commit()
+        dashboard_cache.invalidate()
+        metric_cube.refresh(self.db, campaign_ids, dates, version)
+
+
+def _bucket_start(interval: str, value: date) -> date:
+    """First day of the day, week (Monday) or month bucket containing ``value``."""
+    if interval == "week":
+        return value - timedelta(days=value.weekday())
+    if interval == "month":
+        return value.replace(day=1)
+    return value
+
+
+def _iter_buckets(interval: str, start_date: date, end_date: date) -> Iterator[date]:
+    """Yield the start of every bucket overlapping [start_date, end_date]."""
+    current = _bucket_start(interval, start_date)
+    while current <= end_date:
+        yield current
+        if interval == "day":
+            current += timedelta(days=1)
+        elif interval == "week":
+            current += timedelta(days=7)
+        else:
+            current = (current.replace(day=28) + timedelta(days=4)).replace(day=1)
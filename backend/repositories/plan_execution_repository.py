@@ -0,0 +1,103 @@
+"""Plan execution repository for idempotent plan execution."""
+from typing import Optional
+from datetime import datetime, timedelta
+from sqlalchemy.orm import Session
+from sqlalchemy import and_, delete, or_, update
+from sqlalchemy.exc import IntegrityError
+from models.plan_execution import PlanExecution, PlanExecutionStatus
+
+
+class PlanExecutionRepository:
+    """
+    Repository for stored plan execution responses.
+
+    A record is claimed (inserted as in progress) before a plan runs; the
+    unique key makes the claim atomic across workers. Completed records
+    are replayed until they expire; in-progress records are abandoned once
+    older than the lock timeout, e.g. after a crash. ``purge_expired``
+    deletes expired records of every key so the table stays small.
+    """
+
+    def __init__(self, db: Session):
+        """Initialize repository with database session."""
+        self.db = db
+
+    def get_active(self, idempotency_key: str, ttl_seconds: float, lock_seconds: float) -> Optional[PlanExecution]:
+        """Get the unexpired record for a key, if any."""
+        return (
+            self.db.query(PlanExecution)
+            .filter(PlanExecution.idempotency_key == idempotency_key)
+            .filter(self._unexpired(ttl_seconds, lock_seconds))
+            .first()
+        )
+
+    def claim(self, idempotency_key: str, request_hash: str, ttl_seconds: float, lock_seconds: float) -> bool:
+        """
+        Insert an in-progress record for a key, replacing an expired one.
+
+        Returns False if another request holds an unexpired record.
+        """
+        self.db.execute(
+            delete(PlanExecution)
+            .where(PlanExecution.idempotency_key == idempotency_key)
+            .where(~self._unexpired(ttl_seconds, lock_seconds))
+        )
+        self.db.add(PlanExecution(
+            idempotency_key=idempotency_key,
+            request_hash=request_hash,
+            status=PlanExecutionStatus.IN_PROGRESS,
+        ))
+        try:
+            self.db.commit()
+        except IntegrityError:
+            self.db.rollback()
+            return False
+        return True
+
+    def purge_expired(self, key_prefix: str, ttl_seconds: float, lock_seconds: float) -> int:
+        """Delete expired records whose key starts with ``key_prefix``; returns how many."""
+        result = self.db.execute(
+            delete(PlanExecution)
+            .where(PlanExecution.idempotency_key.startswith(key_prefix, autoescape=True))
+            .where(~self._unexpired(ttl_seconds, lock_seconds))
+        )
+        self.db.commit()
+        return result.rowcount
+
+    def complete(self, idempotency_key: str, status_code: int, body: dict, headers: dict) -> None:
+        """Store the response of a claimed execution."""
+        self.db.execute(
+            update(PlanExecution)
+            .where(PlanExecution.idempotency_key == idempotency_key)
+            .values(
+                status=PlanExecutionStatus.COMPLETED,
+                status_code=status_code,
+                response_body=body,
+                response_headers=headers,
+                completed_at=datetime.utcnow(),
+            )
+        )
+        self.db.commit()
+
+    def release(self, idempotency_key: str) -> None:
+        """Drop an in-progress claim so the request can be retried."""
+        self.db.execute(
+            delete(PlanExecution)
+            .where(PlanExecution.idempotency_key == idempotency_key)
+            .where(PlanExecution.status == PlanExecutionStatus.IN_PROGRESS)
+        )
+        self.db.commit()
+
+    @staticmethod
+    def _unexpired(ttl_seconds: float, lock_seconds: float):
+        now = datetime.utcnow()
+        return or_(
+            and_(
+                PlanExecution.status == PlanExecutionStatus.COMPLETED,
+                PlanExecution.created_at >= now - timedelta(seconds=ttl_seconds),
+            ),
+            and_(
+                PlanExecution.status == PlanExecutionStatus.IN_PROGRESS,
+                PlanExecution.created_at >= now - timedelta(seconds=lock_seconds),
+            ),
+        )
@@ -0,0 +1,164 @@
+"""Daily rollup repository for maintaining pre-aggregated dashboard KPIs."""
+from typing import Iterable, Optional
+from datetime import date
+from sqlalchemy.orm import Session
+from sqlalchemy import select, delete, insert, func, and_, true
+from models.metric import CampaignMetric
+from models.campaign import Campaign
+from models.rollup import CampaignDailyRollup, SegmentDailyRollup
+from repositories.data_version_repository import DataVersionRepository
+
+# Maximum number of campaign IDs per IN (...) clause
+ID_CHUNK_SIZE = 500
+
+MEASURES = ("spend", "impressions", "clicks", "conversions", "conversion_value")
+
+
+class RollupRepository:
+    """
+    Repository for the daily rollup tables.
+
+    Rollups are refreshed for the (campaign, day) keys touched by a write,
+    inside the caller's transaction: affected rows are deleted and
+    re-derived from their source with a grouped INSERT ... SELECT. This
+    keeps them exact for inserts, re-ingestion and corrections alike.
+    Nothing here commits unless stated otherwise.
+    """
+
+    def __init__(self, db: Session):
+        """Initialize repository with database session."""
+        self.db = db
+
+    def refresh(
+        self,
+        campaign_ids: Iterable[int],
+        dates: Iterable[date],
+    ) -> None:
+        """
+        Re-derive rollups for the given campaigns and days.
+
+        Must be called after the raw metric rows have been flushed.
+        """
+        campaign_ids = sorted(set(campaign_ids))
+        dates = sorted(set(dates))
+        if not campaign_ids or not dates:
+            return
+
+        for i in range(0, len(campaign_ids), ID_CHUNK_SIZE):
+            chunk = campaign_ids[i:i + ID_CHUNK_SIZE]
+            self._refresh_campaign_rollups(
+                and_(CampaignMetric.campaign_id.in_(chunk), CampaignMetric.date.in_(dates)),
+                and_(CampaignDailyRollup.campaign_id.in_(chunk), CampaignDailyRollup.date.in_(dates)),
+            )
+
+        platforms = set()
+        for i in range(0, len(campaign_ids), ID_CHUNK_SIZE):
+            chunk = campaign_ids[i:i + ID_CHUNK_SIZE]
+            platforms.update(
+                row.platform
+                for row in self.db.execute(
+                    select(Campaign.platform).where(Campaign.id.in_(chunk)).distinct()
+                )
+            )
+
+        self._refresh_segment_rollups(
+            and_(SegmentDailyRollup.date.in_(dates), SegmentDailyRollup.platform.in_(platforms)),
+            and_(CampaignDailyRollup.date.in_(dates), Campaign.platform.in_(platforms)),
+        )
+
+    def rebuild(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> None:
+        """
+        Rebuild all rollups, optionally limited to a date range, and commit.
+        Used for backfills and after out-of-band changes to raw metrics.
+        """
+        metric_filters = []
+        campaign_rollup_filters = []
+        segment_rollup_filters = []
+
+        if start_date:
+            metric_filters.append(CampaignMetric.date >= start_date)
+            campaign_rollup_filters.append(CampaignDailyRollup.date >= start_date)
+            segment_rollup_filters.append(SegmentDailyRollup.date >= start_date)
+        if end_date:
+            metric_filters.append(CampaignMetric.date <= end_date)
+            campaign_rollup_filters.append(CampaignDailyRollup.date <= end_date)
+            segment_rollup_filters.append(SegmentDailyRollup.date <= end_date)
+
+        self._refresh_campaign_rollups(and_(true(), *metric_filters), and_(true(), *campaign_rollup_filters))
+        self._refresh_segment_rollups(and_(true(), *segment_rollup_filters), and_(true(), *campaign_rollup_filters))
+        DataVersionRepository(self.db).bump()
+        self.db.commit()
+
+    def campaign_totals_subquery(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ):
+        """
+        Build a subquery of per-campaign totals over a date range.
+        Columns: campaign_id, total_spend, total_impressions, total_clicks,
+        total_conversions, total_conversion_value.
+        """
+        query = self.db.query(
+            CampaignDailyRollup.campaign_id.label('campaign_id'),
+            func.sum(CampaignDailyRollup.spend).label('total_spend'),
+            func.sum(CampaignDailyRollup.impressions).label('total_impressions'),
+            func.sum(CampaignDailyRollup.clicks).label('total_clicks'),
+            func.sum(CampaignDailyRollup.conversions).label('total_conversions'),
+            func.sum(CampaignDailyRollup.conversion_value).label('total_conversion_value'),
+        )
+
+        if start_date:
+            query = query.filter(CampaignDailyRollup.date >= start_date)
+        if end_date:
+            query = query.filter(CampaignDailyRollup.date <= end_date)
+
+        return query.group_by(CampaignDailyRollup.campaign_id).subquery()
+
+    def _refresh_campaign_rollups(self, metric_filter, rollup_filter) -> None:
+        """Replace campaign rollups matching ``rollup_filter`` from raw metrics."""
+        self.db.execute(delete(CampaignDailyRollup).where(rollup_filter))
+
+        source = (
+            select(
+                CampaignMetric.campaign_id,
+                CampaignMetric.date,
+                func.sum(CampaignMetric.spend),
+                func.sum(CampaignMetric.impressions),
+                func.sum(CampaignMetric.clicks),
+                func.coalesce(func.sum(CampaignMetric.conversions), 0),
+                func.coalesce(func.sum(CampaignMetric.conversion_value), 0),
+            )
+            .where(metric_filter)
+            .group_by(CampaignMetric.campaign_id, CampaignMetric.date)
+        )
+        self.db.execute(
+            insert(CampaignDailyRollup).from_select(["campaign_id", "date", *MEASURES], source)
+        )
+
+    def _refresh_segment_rollups(self, rollup_filter, source_filter) -> None:
+        """Replace segment rollups matching ``rollup_filter`` from campaign rollups."""
+        self.db.execute(delete(SegmentDailyRollup).where(rollup_filter))
+
+        source = (
+            select(
+                Campaign.platform,
+                Campaign.campaign_type,
+                CampaignDailyRollup.date,
+                func.sum(CampaignDailyRollup.spend),
+                func.sum(CampaignDailyRollup.impressions),
+                func.sum(CampaignDailyRollup.clicks),
+                func.sum(CampaignDailyRollup.conversions),
+                func.sum(CampaignDailyRollup.conversion_value),
+            )
+            .join(Campaign, Campaign.id == CampaignDailyRollup.campaign_id)
+            .where(source_filter)
+            .group_by(Campaign.platform, Campaign.campaign_type, CampaignDailyRollup.date)
+        )
+        self.db.execute(
+            insert(SegmentDailyRollup).from_select(["platform", "campaign_type", "date", *MEASURES], source)
+        )
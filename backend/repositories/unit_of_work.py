@@ -0,0 +1,82 @@
+"""Unit of work for grouping repository writes into one transaction."""
+from typing import Iterable, Set
+from datetime import date
+from sqlalchemy.orm import Session
+from repositories.campaign_repository import CampaignRepository
+from repositories.metric_repository import MetricRepository
+from repositories.data_version_repository import DataVersionRepository
+from repositories.job_repository import JobRepository
+from repositories.metric_cube import metric_cube
+from utils.cache import dashboard_cache
+
+
+class UnitOfWork:
+    """
+    One transaction shared by the repositories it hands out.
+
+    Repositories created with ``uow=`` flush instead of committing, so
+    generated IDs come back from the INSERT itself, and report what they
+    wrote here. ``commit`` then refreshes the rollups for all written
+    metrics, bumps the data version once and commits once. Used as a
+    context manager it commits on success and rolls back on error,
+    including an error raised by the commit itself.
+    """
+
+    def __init__(self, db: Session):
+        """Initialize unit of work on a database session."""
+        self.db = db
+        self.campaigns = CampaignRepository(db, uow=self)
+        self.metrics = MetricRepository(db, uow=self)
+        self.jobs = JobRepository(db, uow=self)
+        self._dirty = False
+        self._metric_campaign_ids: Set[int] = set()
+        self._metric_dates: Set[date] = set()
+
+    def __enter__(self) -> "UnitOfWork":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None:
+            self.rollback()
+            return
+        try:
+            self.commit()
+        except Exception:
+            # Leave the session usable for the caller's next transaction
+            self.rollback()
+            raise
+
+    def mark_dirty(self) -> None:
+        """Record that rows were written in this unit of work."""
+        self._dirty = True
+
+    def track_metrics(self, campaign_ids: Iterable[int], dates: Iterable[date]) -> None:
+        """Record metric rows whose rollups must be refreshed before commit."""
+        self._dirty = True
+        self._metric_campaign_ids.update(campaign_ids)
+        self._metric_dates.update(dates)
+
+    def commit(self) -> None:
+        """Commit everything written so far in a single transaction."""
+        if not self._dirty:
+            self.db.commit()
+            return
+
+        campaign_ids, dates = self._metric_campaign_ids, self._metric_dates
+        self.db.flush()
+        self.metrics.rollup_repo.refresh(campaign_ids, dates)
+        version = DataVersionRepository(self.db).bump()
+        self.db.commit()
+        dashboard_cache.invalidate()
+        metric_cube.refresh(self.db, campaign_ids, dates, version)
+        self._reset()
+
+    def rollback(self) -> None:
+        """Discard everything written so far."""
+        self.db.rollback()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._dirty = False
+        self._metric_campaign_ids = set()
+        self._metric_dates = set()
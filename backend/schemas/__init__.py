@@ -1,6 +1,18 @@
 """Pydantic schemas module."""
 from .plan import PlanInput, GeneratedPlan, CreativePack, TargetingHints
-from .campaign import CampaignResponse, CampaignWithMetricsResponse, CampaignCreateResponse
+from .campaign import (
+    CampaignResponse,
+    CampaignWithMetricsResponse,
+    CampaignCreateResponse,
+    CampaignBatchExecuteRequest,
+    CampaignBatchPlanResult,
+    CampaignBatchExecuteResponse,
+    CampaignSummaryTotals,
+    CampaignSummaryGroup,
+    CampaignSummaryResponse,
+)
+from .job import JobResponse, JobAcceptedResponse
+from .metric import BulkIngestBatchResult, BulkIngestResponse, MetricSeriesPoint
 
 __all__ = [
     "PlanInput",
@@ -10,4 +22,15 @@ __all__ = [
     "CampaignResponse",
     "CampaignWithMetricsResponse",
     "CampaignCreateResponse",
+    "CampaignBatchExecuteRequest",
+    "CampaignBatchPlanResult",
+    "CampaignBatchExecuteResponse",
+    "CampaignSummaryTotals",
+    "CampaignSummaryGroup",
+    "CampaignSummaryResponse",
+    "JobResponse",
+    "JobAcceptedResponse",
+    "BulkIngestBatchResult",
+    "BulkIngestResponse",
+    "MetricSeriesPoint",
 ]
@@ -1,7 +1,8 @@
 """Pydantic schemas for campaigns."""
 from typing import List, Optional
 from datetime import datetime
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+from schemas.plan import GeneratedPlan
 
 
 class CampaignResponse(BaseModel):
@@ -47,3 +48,48 @@ class CampaignCreateResponse(BaseModel):
     """Response schema for campaign creation."""
     message: str
     campaigns: List[CampaignResponse]
+
+
+class CampaignBatchExecuteRequest(BaseModel):
+    """Request schema for executing many plans at once."""
+    plans: List[GeneratedPlan] = Field(min_length=1)
+
+
+class CampaignBatchPlanResult(BaseModel):
+    """Outcome of one plan in a batch execution."""
+    index: int
+    campaigns: List[CampaignResponse]
+    errors: List[str] = []
+
+
+class CampaignBatchExecuteResponse(BaseModel):
+    """Response schema for batch plan execution."""
+    message: str
+    succeeded: int
+    failed: int
+    results: List[CampaignBatchPlanResult]
+
+
+class CampaignSummaryTotals(BaseModel):
+    """Summed metrics over a group of campaigns."""
+    campaignCount: int
+    totalSpend: float
+    totalImpressions: int
+    totalClicks: int
+    totalConversions: int
+    totalConversionValue: float
+    ctr: float
+    roas: float
+
+
+class CampaignSummaryGroup(CampaignSummaryTotals):
+    """Summed metrics for one platform, campaign type or status."""
+    key: str
+
+
+class CampaignSummaryResponse(BaseModel):
+    """Dashboard header totals, overall and per dimension."""
+    total: CampaignSummaryTotals
+    byPlatform: List[CampaignSummaryGroup]
+    byType: List[CampaignSummaryGroup]
+    byStatus: List[CampaignSummaryGroup]
@@ -0,0 +1,24 @@
+"""Pydantic schemas for background jobs."""
+from typing import List, Optional
+from pydantic import BaseModel
+from schemas.campaign import CampaignResponse
+
+
+class JobResponse(BaseModel):
+    """Status and, once finished, outcome of a background job."""
+    id: int
+    kind: str
+    status: str
+    createdAt: Optional[str] = None
+    startedAt: Optional[str] = None
+    finishedAt: Optional[str] = None
+    result: Optional[dict] = None
+    error: Optional[str] = None
+
+
+class JobAcceptedResponse(BaseModel):
+    """Response schema for a plan execution queued as a background job."""
+    jobId: int
+    status: str
+    statusUrl: str
+    campaigns: List[CampaignResponse]
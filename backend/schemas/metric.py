@@ -0,0 +1,30 @@
+"""Pydantic schemas for campaign metrics."""
+from typing import List
+from pydantic import BaseModel
+
+
+class BulkIngestBatchResult(BaseModel):
+    """Outcome of one validated and written batch of metric rows."""
+    batch: int
+    accepted: int
+    rejected: int
+    errors: List[str] = []
+
+
+class BulkIngestResponse(BaseModel):
+    """Response schema for bulk metric ingestion."""
+    accepted: int
+    rejected: int
+    batches: List[BulkIngestBatchResult]
+
+
+class MetricSeriesPoint(BaseModel):
+    """Metric totals for one day, week or month bucket."""
+    bucket: str
+    total_spend: float
+    total_impressions: int
+    total_clicks: int
+    total_conversions: int
+    total_conversion_value: float
+    ctr: float
+    roas: float
@@ -0,0 +1,106 @@
+"""Compare concurrent throughput of the sync and async dashboard read paths.
+
+Runs the same CampaignRepository.get_with_metrics query many times at a
+given concurrency, once through sync sessions on a bounded threadpool (how
+plain ``def`` routes run) and once through async sessions on the event loop.
+The dashboard cache is disabled so every call reaches the database.
+
+Usage:
+    python -m scripts.benchmark_async [--requests N] [--concurrency N] [--threads N] [--days N]
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Awaitable, Callable, List
+import anyio
+from database import SessionLocal, AsyncSessionLocal, get_async_engine
+from repositories import CampaignRepository, AsyncCampaignRepository
+from utils.cache import dashboard_cache
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def sync_call(days: int) -> None:
+    """One dashboard read on a sync session."""
+    db = SessionLocal()
+    try:
+        CampaignRepository(db).get_with_metrics(days=days)
+    finally:
+        db.close()
+
+
+async def async_call(days: int) -> None:
+    """One dashboard read on an async session."""
+    async with AsyncSessionLocal() as db:
+        await AsyncCampaignRepository(db).get_with_metrics(days=days)
+
+
+async def run(call: Callable[[], Awaitable[None]], requests: int, concurrency: int) -> dict:
+    """Issue ``requests`` calls with at most ``concurrency`` in flight."""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+
+    async def one() -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            await call()
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "throughput": requests / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+    }
+
+
+async def benchmark(requests: int, concurrency: int, threads: int, days: int) -> None:
+    """Run both paths after a warm-up call each and log the results."""
+    limiter = anyio.CapacityLimiter(threads)
+
+    async def threaded_call() -> None:
+        await anyio.to_thread.run_sync(sync_call, days, limiter=limiter)
+
+    async def event_loop_call() -> None:
+        await async_call(days)
+
+    await threaded_call()
+    await event_loop_call()
+
+    for name, call in (("sync (threadpool)", threaded_call), ("async (event loop)", event_loop_call)):
+        result = await run(call, requests, concurrency)
+        logger.info(
+            f"{name:<20} {result['throughput']:8.1f} req/s  "
+            f"p50 {result['p50_ms']:7.1f} ms  p95 {result['p95_ms']:7.1f} ms"
+        )
+
+    await get_async_engine().dispose()
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark sync vs async dashboard reads.")
+    parser.add_argument("--requests", type=int, default=500, help="Total calls per path")
+    parser.add_argument("--concurrency", type=int, default=50, help="Calls in flight at once")
+    parser.add_argument("--threads", type=int, default=40, help="Threadpool size for the sync path (FastAPI default: 40)")
+    parser.add_argument("--days", type=int, default=7, help="Metrics window passed to get_with_metrics")
+    args = parser.parse_args()
+
+    # Measure the database path, not the response cache
+    dashboard_cache.ttl = 0
+
+    logger.info(
+        f"Benchmarking {args.requests} calls at concurrency {args.concurrency} "
+        f"({args.threads} threads for the sync path)..."
+    )
+    asyncio.run(benchmark(args.requests, args.concurrency, args.threads, args.days))
+
+
+if __name__ == "__main__":
+    main()
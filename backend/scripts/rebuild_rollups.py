@@ -0,0 +1,32 @@
+"""Rebuild the daily rollup tables from raw campaign metrics.
+
+Usage:
+    python -m scripts.rebuild_rollups [--start YYYY-MM-DD] [--end YYYY-MM-DD]
+"""
+import argparse
+from datetime import date
+from database import SessionLocal
+from repositories import RollupRepository
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def main() -> None:
+    """Parse arguments and rebuild rollups for the requested date range."""
+    parser = argparse.ArgumentParser(description="Rebuild daily rollup tables.")
+    parser.add_argument("--start", type=date.fromisoformat, default=None, help="First day to rebuild (inclusive)")
+    parser.add_argument("--end", type=date.fromisoformat, default=None, help="Last day to rebuild (inclusive)")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        logger.info(f"Rebuilding rollups (start={args.start}, end={args.end})...")
+        RollupRepository(db).rebuild(start_date=args.start, end_date=args.end)
+        logger.info("Rollup rebuild complete")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
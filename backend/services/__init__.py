@@ -4,6 +4,8 @@ from .google_service import GoogleService
 from .meta_service import MetaService
 from .amazon_service import AmazonService
 from .campaign_execution_service import CampaignExecutionService
+from .metric_ingestion_service import MetricIngestionService
+from .idempotency_service import IdempotencyService
 
 __all__ = [
     "PlanService",
@@ -11,4 +13,6 @@ __all__ = [
     "MetaService",
     "AmazonService",
     "CampaignExecutionService",
+    "MetricIngestionService",
+    "IdempotencyService",
 ]
@@ -4,6 +4,8 @@ from datetime import datetime
 from schemas.plan import GeneratedPlan
 from models.campaign import Platform, CampaignType, CampaignStatus
 from config import settings
+from utils.errors import PlatformServiceError
+from utils.http_client import PlatformHttpClient, platform_http
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -12,6 +14,9 @@ logger = get_logger(__name__)
 class AmazonService:
     """Service for Amazon Ads Sponsored Brands campaign creation."""
 
+    # Shared keep-alive connection pools for the platform API
+    http: PlatformHttpClient = platform_http
+
     @staticmethod
     def create_campaign(plan: GeneratedPlan) -> dict:
         """
@@ -86,6 +91,6 @@ class AmazonService:
                 "payload": campaign_payload,  # Include for debugging
             }
         else:
-            # Real API call would go here
-            logger.warning("Amazon Ads API integration not yet implemented. Using mock mode.")
-            return AmazonService.create_campaign(plan)  # Recursive call with mock mode
+            # Real API calls go through the shared pooled client (``http``)
+            # once this integration is written
+            raise PlatformServiceError(Platform.AMAZON.value, "Amazon Ads API integration not implemented")
@@ -1,54 +1,149 @@
 """Campaign execution service for creating campaigns across all platforms."""
-from typing import List, Tuple
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Dict, List, Optional, Sequence, Tuple, Type
 from sqlalchemy.orm import Session
 from schemas.plan import GeneratedPlan
-from models.campaign import Platform, CampaignType, CampaignStatus
-from repositories import CampaignRepository, MetricRepository
+from models.campaign import Campaign, Platform, CampaignType, CampaignStatus
+from models.job import Job
+from repositories import CampaignRepository, MetricRepository, UnitOfWork
 from services.google_service import GoogleService
 from services.meta_service import MetaService
 from services.amazon_service import AmazonService
+from services.job_runner import JobFailedError, job_runner
+from config import settings
+from utils.circuit_breaker import CircuitBreakerRegistry, platform_breakers
+from utils.errors import CircuitOpenError
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# (name, service class, platform, campaign type) for each platform a plan launches on
+PLATFORMS: List[Tuple[str, Type, Platform, CampaignType]] = [
+    ("google", GoogleService, Platform.GOOGLE, CampaignType.PMAX),
+    ("meta", MetaService, Platform.META, CampaignType.SHOPPING),
+    ("amazon", AmazonService, Platform.AMAZON, CampaignType.SPONSORED_BRANDS),
+]
+
+# Job kind for plans executed in the background
+EXECUTE_PLAN_JOB = "execute_plan"
+
+# Process-wide pool for blocking platform API calls. A call that times out
+# keeps its thread until the platform answers; its result is discarded.
+platform_executor = ThreadPoolExecutor(
+    max_workers=settings.PLATFORM_MAX_WORKERS,
+    thread_name_prefix="platform",
+)
+
 
 class CampaignExecutionService:
     """Service for executing plans and creating campaigns across platforms."""
 
-    def __init__(self, db: Session):
-        """Initialize service with database session."""
+    def __init__(
+        self,
+        db: Session,
+        platforms: Optional[Sequence[Tuple[str, Type, Platform, CampaignType]]] = None,
+        breakers: Optional[CircuitBreakerRegistry] = None,
+    ):
+        """
+        Initialize service with database session and optionally the platforms
+        to launch on and the circuit breakers guarding them.
+        """
         self.db = db
         self.campaign_repo = CampaignRepository(db)
         self.metric_repo = MetricRepository(db)
+        self.platforms = list(platforms) if platforms is not None else PLATFORMS
+        self.breakers = breakers if breakers is not None else platform_breakers
 
     def execute_plan(self, plan: GeneratedPlan) -> Tuple[List[dict], List[str]]:
         """
         Execute a plan by creating campaigns across all platforms.
         
+        Platform calls run concurrently, each bounded by
+        PLATFORM_CALL_TIMEOUT_SECONDS and all by PLAN_EXECUTION_DEADLINE_SECONDS;
+        the created campaigns and their seed metrics are then saved in one
+        transaction.
+        
         Returns:
             Tuple of (created_campaigns, errors)
             - created_campaigns: List of successfully created campaign dictionaries
             - errors: List of error messages for failed platforms
         """
+        with UnitOfWork(self.db) as uow:
+            return self.stage_plan(plan, uow)
+
+    def execute_plans(
+        self,
+        plans: Sequence[GeneratedPlan],
+        concurrency: Optional[int] = None,
+        commit_size: Optional[int] = None,
+    ) -> List[Tuple[List[dict], List[str]]]:
+        """
+        Execute many plans, returning ``(created_campaigns, errors)`` per plan.
+
+        Up to ``concurrency`` plans call their platforms at once (capped so
+        their calls fit in the platform pool). Results are saved in order,
+        ``commit_size`` plans per transaction; a transaction is only opened
+        once all of its plans have their platform results, so no write lock
+        is held while waiting on a platform. If a transaction fails, each of
+        its plans reports the database error.
+        """
+        concurrency = min(
+            concurrency or settings.BATCH_EXECUTE_CONCURRENCY,
+            max(settings.PLATFORM_MAX_WORKERS // max(len(self.platforms), 1), 1),
+        )
+        commit_size = commit_size or settings.BATCH_EXECUTE_COMMIT_SIZE
+
+        results = []
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="plan") as plan_executor:
+            futures = [plan_executor.submit(self._create_on_platforms, plan) for plan in plans]
+            for i in range(0, len(plans), commit_size):
+                chunk = [
+                    (plan, future.result())
+                    for plan, future in zip(plans[i:i + commit_size], futures[i:i + commit_size])
+                ]
+                try:
+                    with UnitOfWork(self.db) as uow:
+                        staged = [self.stage_plan(plan, uow, platform_results) for plan, platform_results in chunk]
+                except Exception as e:
+                    logger.error(f"Failed to save plans {i + 1}-{i + len(chunk)}: {str(e)}", exc_info=True)
+                    staged = [([], [f"Failed to save plan: {str(e)}"]) for _ in chunk]
+                results.extend(staged)
+        return results
+
+    def stage_plan(
+        self,
+        plan: GeneratedPlan,
+        uow: UnitOfWork,
+        platform_results: Optional[Dict[str, object]] = None,
+    ) -> Tuple[List[dict], List[str]]:
+        """
+        Create a plan's campaigns on all platforms and add them to ``uow``.
+
+        Nothing is committed, so several plans can share one transaction.
+        A failing platform is reported in the errors while the others
+        proceed; a database error propagates so the caller rolls back.
+        Pass ``platform_results`` from ``_create_on_platforms`` to skip
+        calling the platforms again.
+        """
         created_campaigns = []
         errors = []
 
-        # Create campaigns for each platform
-        platforms = [
-            ("google", GoogleService, Platform.GOOGLE, CampaignType.PMAX),
-            ("meta", MetaService, Platform.META, CampaignType.SHOPPING),
-            ("amazon", AmazonService, Platform.AMAZON, CampaignType.SPONSORED_BRANDS),
-        ]
+        if platform_results is None:
+            platform_results = self._create_on_platforms(plan)
+
+        campaigns = []
+        for platform_name, _, platform_enum, campaign_type_enum in self.platforms:
+            platform_result = platform_results[platform_name]
+            if isinstance(platform_result, BaseException):
+                error_msg = f"Failed to create {platform_name} campaign: {str(platform_result)}"
+                logger.error(error_msg, exc_info=platform_result)
+                errors.append(error_msg)
+                # Continue with other platforms even if one fails
+                continue
 
-        for platform_name, service_class, platform_enum, campaign_type_enum in platforms:
             try:
-                logger.info(f"Creating {platform_name} campaign...")
-                
-                # Create campaign via platform service
-                platform_result = service_class.create_campaign(plan)
-                
-                # Save to database
-                campaign = self.campaign_repo.create(
+                campaign = uow.campaigns.create(
                     name=platform_result["name"],
                     platform=platform_enum,
                     campaign_type=campaign_type_enum,
@@ -58,30 +153,191 @@ class CampaignExecutionService:
                     platform_campaign_id=platform_result.get("platform_campaign_id"),
                     status=CampaignStatus.CREATED,
                 )
-                
-                # Generate initial mock metrics
-                self.metric_repo.generate_mock_metrics(campaign.id, days=7)
-                
-                # Convert to response format
-                campaign_dict = {
-                    "id": campaign.id,
-                    "name": campaign.name,
-                    "platform": campaign.platform.value,
-                    "type": campaign.campaign_type.value,
-                    "status": campaign.status.value,
-                    "objective": campaign.objective,
-                    "dailyBudget": str(campaign.daily_budget),
-                    "productCategories": campaign.product_categories,
-                    "createdAt": campaign.created_at.isoformat() if campaign.created_at else None,
-                }
-                
-                created_campaigns.append(campaign_dict)
-                logger.info(f"Successfully created {platform_name} campaign: {campaign.id}")
-                
-            except Exception as e:
+            except (KeyError, TypeError, ValueError) as e:
+                # Malformed platform response
                 error_msg = f"Failed to create {platform_name} campaign: {str(e)}"
                 logger.error(error_msg, exc_info=True)
                 errors.append(error_msg)
-                # Continue with other platforms even if one fails
+                continue
+            campaigns.append((platform_name, campaign))
+
+        for platform_name, campaign in campaigns:
+            # Generate initial mock metrics
+            uow.metrics.generate_mock_metrics(campaign.id, days=7)
+            
+            created_campaigns.append(self._to_response_dict(campaign))
+            logger.info(f"Successfully created {platform_name} campaign: {campaign.id}")
 
         return created_campaigns, errors
+
+    def enqueue_plan(self, plan: GeneratedPlan) -> Tuple[int, List[dict]]:
+        """
+        Save a plan's campaigns as pending and queue a job to create them.
+
+        The pending campaigns and the job are committed together, then the
+        job is handed to the job runner. Returns the job ID and the pending
+        campaign dictionaries.
+        """
+        with UnitOfWork(self.db) as uow:
+            campaign_ids = {}
+            pending_campaigns = []
+            for platform_name, _, platform_enum, campaign_type_enum in self.platforms:
+                campaign = uow.campaigns.create(
+                    name=f"{platform_name} campaign (pending)",
+                    platform=platform_enum,
+                    campaign_type=campaign_type_enum,
+                    objective=plan.objective,
+                    daily_budget=0,
+                    product_categories=plan.product_categories,
+                    status=CampaignStatus.PENDING,
+                )
+                campaign_ids[platform_name] = campaign.id
+                pending_campaigns.append(self._to_response_dict(campaign))
+            job = uow.jobs.create(
+                EXECUTE_PLAN_JOB,
+                {"plan": plan.model_dump(mode="json"), "campaign_ids": campaign_ids},
+            )
+            job_id = job.id
+
+        job_runner.submit(job_id)
+        return job_id, pending_campaigns
+
+    def complete_pending_plan(
+        self,
+        plan: GeneratedPlan,
+        campaign_ids: Dict[str, int],
+    ) -> Tuple[List[dict], List[str]]:
+        """
+        Create a plan's pending campaigns on their platforms.
+
+        Campaigns move to ACTIVE, with seed metrics, or to FAILED, all in one
+        transaction. Returns the same ``(created_campaigns, errors)`` as
+        ``execute_plan``.
+        """
+        created_campaigns = []
+        errors = []
+
+        platform_results = self._create_on_platforms(plan)
+
+        with UnitOfWork(self.db) as uow:
+            for platform_name, _, _, _ in self.platforms:
+                if platform_name not in campaign_ids:
+                    continue
+                campaign_id = campaign_ids[platform_name]
+                platform_result = platform_results[platform_name]
+                if not isinstance(platform_result, BaseException):
+                    try:
+                        campaign = uow.campaigns.complete_pending(
+                            campaign_id,
+                            name=platform_result["name"],
+                            daily_budget=platform_result["daily_budget"],
+                            platform_campaign_id=platform_result.get("platform_campaign_id"),
+                        )
+                    except (KeyError, TypeError, ValueError) as e:
+                        # Malformed platform response
+                        platform_result = e
+                    else:
+                        if campaign is None:
+                            # Deleted while its platform call was in flight
+                            platform_result = LookupError(f"pending campaign {campaign_id} no longer exists")
+                if isinstance(platform_result, BaseException):
+                    error_msg = f"Failed to create {platform_name} campaign: {str(platform_result)}"
+                    logger.error(error_msg, exc_info=platform_result)
+                    errors.append(error_msg)
+                    uow.campaigns.update_status(campaign_id, CampaignStatus.FAILED)
+                    continue
+
+                uow.metrics.generate_mock_metrics(campaign.id, days=7)
+                created_campaigns.append(self._to_response_dict(campaign))
+                logger.info(f"Successfully created {platform_name} campaign: {campaign.id}")
+
+        return created_campaigns, errors
+
+    @staticmethod
+    def _to_response_dict(campaign: Campaign) -> dict:
+        """Convert a campaign to the campaign response format."""
+        return {
+            "id": campaign.id,
+            "name": campaign.name,
+            "platform": campaign.platform.value,
+            "type": campaign.campaign_type.value,
+            "status": campaign.status.value,
+            "objective": campaign.objective,
+            "dailyBudget": str(campaign.daily_budget),
+            "productCategories": campaign.product_categories,
+            "createdAt": campaign.created_at.isoformat() if campaign.created_at else None,
+        }
+
+    def _create_on_platforms(self, plan: GeneratedPlan) -> Dict[str, object]:
+        """
+        Call every platform's ``create_campaign`` concurrently.
+
+        Returns a mapping of platform name to its result dictionary, or to the
+        exception it raised (a ``TimeoutError`` if it missed its timeout or
+        the plan deadline). A platform whose circuit breaker is open is not
+        called and maps to ``CircuitOpenError``; exceptions and timeouts count
+        as failures towards opening it.
+        """
+        plan_deadline = time.monotonic() + settings.PLAN_EXECUTION_DEADLINE_SECONDS
+        futures: Dict[str, Future] = {}
+        call_deadlines: Dict[str, float] = {}
+        generations: Dict[str, int] = {}
+        results: Dict[str, object] = {}
+        for platform_name, service_class, _, _ in self.platforms:
+            try:
+                generations[platform_name] = self.breakers.get(platform_name).before_call()
+            except CircuitOpenError as e:
+                logger.warning(f"Skipping {platform_name}: {str(e)}")
+                results[platform_name] = e
+                continue
+            logger.info(f"Creating {platform_name} campaign...")
+            futures[platform_name] = platform_executor.submit(service_class.create_campaign, plan)
+            call_deadlines[platform_name] = time.monotonic() + settings.PLATFORM_CALL_TIMEOUT_SECONDS
+
+        for platform_name, future in futures.items():
+            breaker = self.breakers.get(platform_name)
+            # Each call gets its own timeout, cut short by the shared plan deadline
+            deadline = min(call_deadlines[platform_name], plan_deadline)
+            try:
+                results[platform_name] = future.result(timeout=max(deadline - time.monotonic(), 0))
+            except FutureTimeoutError:
+                future.cancel()
+                breaker.record_failure(generations[platform_name])
+                if call_deadlines[platform_name] <= plan_deadline:
+                    message = f"{platform_name} did not respond within {settings.PLATFORM_CALL_TIMEOUT_SECONDS:g} seconds"
+                else:
+                    message = (
+                        f"{platform_name} did not respond before the "
+                        f"{settings.PLAN_EXECUTION_DEADLINE_SECONDS:g} second plan deadline"
+                    )
+                results[platform_name] = TimeoutError(message)
+            except Exception as e:
+                breaker.record_failure(generations[platform_name])
+                results[platform_name] = e
+            else:
+                breaker.record_success(generations[platform_name])
+        return results
+
+
+def run_plan_job(db: Session, job: Job) -> dict:
+    """Job handler: create the pending campaigns of a queued plan."""
+    plan = GeneratedPlan(**job.payload["plan"])
+    created_campaigns, errors = CampaignExecutionService(db).complete_pending_plan(
+        plan, job.payload["campaign_ids"]
+    )
+    result = {"campaigns": created_campaigns, "errors": errors}
+    if not created_campaigns:
+        raise JobFailedError("Failed to create any campaigns. All platforms failed.", result)
+    return result
+
+
+def fail_plan_job(db: Session, job: Job, error: str) -> None:
+    """Failure cleanup: mark the job's still-pending campaigns as failed."""
+    with UnitOfWork(db) as uow:
+        for campaign_id in job.payload["campaign_ids"].values():
+            campaign = uow.campaigns.get_by_id(campaign_id)
+            if campaign is not None and campaign.status == CampaignStatus.PENDING:
+                uow.campaigns.update_status(campaign_id, CampaignStatus.FAILED)
+
+
+job_runner.register(EXECUTE_PLAN_JOB, run_plan_job, on_failure=fail_plan_job)
@@ -4,6 +4,8 @@ from datetime import datetime
 from schemas.plan import GeneratedPlan
 from models.campaign import Platform, CampaignType, CampaignStatus
 from config import settings
+from utils.errors import PlatformServiceError
+from utils.http_client import PlatformHttpClient, platform_http
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -12,6 +14,9 @@ logger = get_logger(__name__)
 class GoogleService:
     """Service for Google Ads Performance Max campaign creation."""
 
+    # Shared keep-alive connection pools for the platform API
+    http: PlatformHttpClient = platform_http
+
     @staticmethod
     def create_campaign(plan: GeneratedPlan) -> dict:
         """
@@ -79,7 +84,6 @@ class GoogleService:
                 "payload": campaign_payload,  # Include for debugging
             }
         else:
-            # Real API call would go here
-            # For now, we'll still use mock mode
-            logger.warning("Google Ads API integration not yet implemented. Using mock mode.")
-            return GoogleService.create_campaign(plan)  # Recursive call with mock mode
+            # Real API calls go through the shared pooled client (``http``)
+            # once this integration is written
+            raise PlatformServiceError(Platform.GOOGLE.value, "Google Ads API integration not implemented")
@@ -0,0 +1,99 @@
+"""Idempotency service for replaying plan execution responses."""
+import hashlib
+import json
+from typing import Optional, Tuple
+from sqlalchemy.orm import Session
+from config import settings
+from models.plan_execution import PlanExecutionStatus
+from repositories.plan_execution_repository import PlanExecutionRepository
+from schemas.plan import GeneratedPlan
+from utils.errors import IdempotencyConflictError, IdempotencyKeyReuseError
+
+# Request header carrying the client's idempotency key
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+
+# Response header set when a stored response is replayed
+IDEMPOTENT_REPLAYED_HEADER = "Idempotent-Replayed"
+
+# Storage key prefixes for requests with and without an Idempotency-Key header
+HEADER_KEY_PREFIX = "key:"
+FINGERPRINT_KEY_PREFIX = "plan:"
+
+# (status code, JSON body, headers) of a stored or fresh response
+StoredResponse = Tuple[int, dict, dict]
+
+
+def plan_fingerprint(plan: GeneratedPlan, *qualifiers: str) -> str:
+    """SHA-256 of the plan's canonical JSON, plus anything else that changes the response."""
+    canonical = json.dumps(
+        [plan.model_dump(mode="json"), list(qualifiers)],
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class IdempotencyService:
+    """
+    Record plan executions so a retried request replays the first response.
+
+    Requests are keyed by their ``Idempotency-Key`` header, or without one
+    by the plan fingerprint with a shorter retention, so that re-running
+    the same plan on purpose later still works.
+    """
+
+    def __init__(self, db: Session):
+        """Initialize service with database session."""
+        self.repo = PlanExecutionRepository(db)
+
+    @staticmethod
+    def resolve_key(idempotency_key: Optional[str], fingerprint: str) -> Tuple[str, float]:
+        """Storage key and retention in seconds for a request."""
+        if idempotency_key:
+            return f"{HEADER_KEY_PREFIX}{idempotency_key}", settings.IDEMPOTENCY_KEY_TTL_SECONDS
+        return f"{FINGERPRINT_KEY_PREFIX}{fingerprint}", settings.IDEMPOTENCY_FINGERPRINT_TTL_SECONDS
+
+    def begin(self, key: str, fingerprint: str, ttl_seconds: float) -> Optional[StoredResponse]:
+        """
+        Claim ``key`` for a new execution, or return the stored response.
+
+        Returns None if the caller now owns the key and must execute, then
+        ``complete`` or ``release`` it.
+
+        Raises:
+            IdempotencyConflictError: If another request holds the key and
+                has not finished yet
+            IdempotencyKeyReuseError: If the key was used for a different plan
+        """
+        lock_seconds = settings.IDEMPOTENCY_LOCK_SECONDS
+        self.purge_expired()
+        for _ in range(2):
+            if self.repo.claim(key, fingerprint, ttl_seconds, lock_seconds):
+                return None
+            record = self.repo.get_active(key, ttl_seconds, lock_seconds)
+            if record is None:
+                # Expired between the claim and the read; claim again
+                continue
+            if record.request_hash != fingerprint:
+                raise IdempotencyKeyReuseError(key)
+            if record.status == PlanExecutionStatus.IN_PROGRESS:
+                raise IdempotencyConflictError(key)
+            return record.status_code, record.response_body, record.response_headers or {}
+        raise IdempotencyConflictError(key)
+
+    def purge_expired(self) -> int:
+        """Delete records past their retention; returns how many."""
+        lock_seconds = settings.IDEMPOTENCY_LOCK_SECONDS
+        return (
+            self.repo.purge_expired(HEADER_KEY_PREFIX, settings.IDEMPOTENCY_KEY_TTL_SECONDS, lock_seconds)
+            + self.repo.purge_expired(FINGERPRINT_KEY_PREFIX, settings.IDEMPOTENCY_FINGERPRINT_TTL_SECONDS, lock_seconds)
+        )
+
+    def complete(self, key: str, response: StoredResponse) -> None:
+        """Store the response for replay."""
+        status_code, body, headers = response
+        self.repo.complete(key, status_code, body, headers)
+
+    def release(self, key: str) -> None:
+        """Give up the key after a failed execution so the client can retry."""
+        self.repo.release(key)
@@ -0,0 +1,160 @@
+"""In-process background job runner backed by the jobs table."""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional, Tuple
+from sqlalchemy.orm import Session
+from config import settings
+from database import SessionLocal
+from models.job import Job, JobStatus
+from repositories import JobRepository
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Runs a job on its own session and returns its JSON-serializable result
+JobHandler = Callable[[Session, Job], dict]
+# Cleans up after a failed or interrupted job, given the error message
+FailureHandler = Callable[[Session, Job, str], None]
+
+
+class JobFailedError(Exception):
+    """Raised by a job handler to fail its job while still recording a result."""
+
+    def __init__(self, message: str, result: Optional[dict] = None):
+        super().__init__(message)
+        self.result = result
+
+
+class JobRunner:
+    """
+    Run jobs from the jobs table on a bounded pool of worker threads.
+
+    Jobs are committed as queued before they are submitted, so they survive
+    a restart: ``start`` resubmits queued jobs and fails jobs that were
+    running when the process stopped, since their side effects are unknown.
+    At most ``max_workers`` jobs run at once; the rest wait their turn.
+    Recovery assumes a single runner process per database.
+    """
+
+    def __init__(self, max_workers: int):
+        """Initialize runner; threads are started on first use."""
+        self.max_workers = max_workers
+        self._handlers: Dict[str, Tuple[JobHandler, Optional[FailureHandler]]] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._submitted = 0
+        self._running = 0
+        self.succeeded = 0
+        self.failed = 0
+
+    def register(self, kind: str, handler: JobHandler, on_failure: Optional[FailureHandler] = None) -> None:
+        """Register the handler, and optional failure cleanup, for a job kind."""
+        self._handlers[kind] = (handler, on_failure)
+
+    def start(self) -> None:
+        """Start the worker threads and pick up jobs left over from a previous run."""
+        self._get_executor()
+        self.recover()
+
+    def recover(self) -> None:
+        """Resubmit queued jobs and fail jobs interrupted while running."""
+        queued_ids = []
+        db = SessionLocal()
+        try:
+            for job in JobRepository(db).get_unfinished():
+                if job.status == JobStatus.RUNNING:
+                    logger.warning(f"Job {job.id} was interrupted by a restart; marking it failed")
+                    self._fail(db, job, "Interrupted by a restart before it finished")
+                else:
+                    queued_ids.append(job.id)
+        finally:
+            db.close()
+
+        for job_id in queued_ids:
+            self.submit(job_id)
+        if queued_ids:
+            logger.info(f"Resubmitted {len(queued_ids)} queued job(s)")
+
+    def submit(self, job_id: int) -> None:
+        """Queue a committed job for execution."""
+        executor = self._get_executor()
+        with self._lock:
+            self._submitted += 1
+        executor.submit(self._run, job_id)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop accepting work, waiting for running jobs if ``wait``.
+        Jobs not yet started stay queued and are resubmitted on the next start.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    def stats(self) -> dict:
+        """Counters for observing the worker pool."""
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "running": self._running,
+                "waiting": self._submitted - self._running,
+                "succeeded": self.succeeded,
+                "failed": self.failed,
+            }
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="job")
+            return self._executor
+
+    def _run(self, job_id: int) -> None:
+        """Claim and run one job on its own session, recording the outcome."""
+        with self._lock:
+            self._running += 1
+        db = SessionLocal()
+        try:
+            jobs = JobRepository(db)
+            if not jobs.claim(job_id):
+                return
+            job = jobs.get_by_id(job_id)
+            try:
+                handler, _ = self._handlers[job.kind]
+                result = handler(db, job)
+            except JobFailedError as e:
+                db.rollback()
+                logger.error(f"Job {job_id} ({job.kind}) failed: {str(e)}")
+                self._fail(db, job, str(e), e.result)
+            except Exception as e:
+                db.rollback()
+                logger.error(f"Job {job_id} ({job.kind}) failed: {str(e)}", exc_info=True)
+                self._fail(db, job, str(e))
+            else:
+                jobs.finish(job_id, JobStatus.SUCCEEDED, result=result)
+                with self._lock:
+                    self.succeeded += 1
+        except Exception:
+            logger.error(f"Could not run job {job_id}", exc_info=True)
+        finally:
+            db.close()
+            with self._lock:
+                self._running -= 1
+                self._submitted -= 1
+
+    def _fail(self, db: Session, job: Job, error: str, result: Optional[dict] = None) -> None:
+        """Run the kind's failure cleanup, then mark the job failed."""
+        _, on_failure = self._handlers.get(job.kind, (None, None))
+        if on_failure is not None:
+            try:
+                on_failure(db, job, error)
+            except Exception:
+                db.rollback()
+                logger.error(f"Failure cleanup for job {job.id} failed", exc_info=True)
+        JobRepository(db).finish(job.id, JobStatus.FAILED, result=result, error=error)
+        with self._lock:
+            self.failed += 1
+
+
+# Process-wide runner for background jobs
+job_runner = JobRunner(settings.JOB_MAX_CONCURRENCY)
@@ -0,0 +1,194 @@
+"""Metric ingestion service for high-throughput bulk loads."""
+import csv
+import json
+from datetime import date
+from decimal import Decimal, InvalidOperation
+from typing import AsyncIterator, List, Optional, Tuple
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from config import settings
+from models.campaign import Campaign
+from repositories import MetricRepository
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Maximum number of error messages reported per batch
+MAX_ERRORS_PER_BATCH = 20
+
+# (line number, parsed record or None, parse error or None)
+ParsedLine = Tuple[int, Optional[dict], Optional[str]]
+
+
+class MetricIngestionService:
+    """Service for validating and writing daily metric rows in batches."""
+
+    def __init__(self, db: Session):
+        """Initialize service with database session."""
+        self.db = db
+        self.metric_repo = MetricRepository(db)
+
+    def ingest_batch(self, batch_number: int, lines: List[ParsedLine]) -> dict:
+        """
+        Validate and upsert one batch of parsed lines.
+
+        Rows are checked with plain conversions rather than one Pydantic
+        model per row, and unknown campaign IDs are rejected with a single
+        lookup per batch. Valid rows are written with one executemany upsert;
+        when a batch repeats a campaign day, the last row wins.
+        """
+        errors = []
+        valid = []
+
+        for line_number, record, parse_error in lines:
+            if parse_error is None:
+                try:
+                    valid.append((line_number, self._validate_record(record)))
+                    continue
+                except (KeyError, TypeError, ValueError, InvalidOperation) as e:
+                    parse_error = _describe_error(e)
+            errors.append(f"line {line_number}: {parse_error}")
+
+        # Reject rows referencing campaigns that do not exist
+        campaign_ids = {row["campaign_id"] for _, row in valid}
+        known_ids = set()
+        if campaign_ids:
+            known_ids = set(
+                self.db.execute(
+                    select(Campaign.id).where(Campaign.id.in_(campaign_ids))
+                ).scalars()
+            )
+
+        rows = []
+        for line_number, row in valid:
+            if row["campaign_id"] in known_ids:
+                rows.append(row)
+            else:
+                errors.append(f"line {line_number}: unknown campaign_id {row['campaign_id']}")
+
+        if rows:
+            # One ON CONFLICT statement cannot update the same key twice, so
+            # a day repeated within the batch keeps its last row
+            unique_rows = {(row["campaign_id"], row["date"]): row for row in rows}
+            self.metric_repo.upsert_bulk(list(unique_rows.values()), batch_size=len(unique_rows))
+
+        logger.info(f"Ingested metric batch {batch_number}: {len(rows)} accepted, {len(errors)} rejected")
+
+        return {
+            "batch": batch_number,
+            "accepted": len(rows),
+            "rejected": len(errors),
+            "errors": errors[:MAX_ERRORS_PER_BATCH],
+        }
+
+    @staticmethod
+    def _validate_record(record: dict) -> dict:
+        """Convert and validate one raw record into an upsert row."""
+        campaign_id = int(record["campaign_id"])
+        metric_date = date.fromisoformat(str(record["date"]).strip())
+
+        spend = Decimal(str(_value_or(record.get("spend"), 0)))
+        impressions = int(_value_or(record.get("impressions"), 0))
+        clicks = int(_value_or(record.get("clicks"), 0))
+        conversions = _value_or(record.get("conversions"), None)
+        conversion_value = _value_or(record.get("conversion_value"), None)
+        currency = str(_value_or(record.get("currency"), "USD")).strip().upper()
+
+        if spend < 0 or impressions < 0 or clicks < 0:
+            raise ValueError("spend, impressions and clicks must be non-negative")
+        if len(currency) != 3:
+            raise ValueError(f"invalid currency: {currency}")
+
+        conversions = int(conversions) if conversions is not None else None
+        conversion_value = Decimal(str(conversion_value)) if conversion_value is not None else None
+        if (conversions is not None and conversions < 0) or (conversion_value is not None and conversion_value < 0):
+            raise ValueError("conversions and conversion_value must be non-negative")
+
+        return {
+            "campaign_id": campaign_id,
+            "date": metric_date,
+            "spend": spend,
+            "impressions": impressions,
+            "clicks": clicks,
+            "conversions": conversions,
+            "conversion_value": conversion_value,
+            "currency": currency,
+        }
+
+
+async def iter_parsed_batches(
+    chunks: AsyncIterator[bytes],
+    fmt: str,
+    batch_size: int = settings.METRICS_INGEST_BATCH_SIZE,
+) -> AsyncIterator[List[ParsedLine]]:
+    """
+    Incrementally parse an NDJSON or CSV byte stream into batches of lines.
+
+    Only the current batch and one partial line are held in memory. CSV
+    input must start with a header row; quoted fields spanning lines are
+    not supported.
+    """
+    header = None
+    line_number = 0
+    batch: List[ParsedLine] = []
+
+    async for line in _iter_lines(chunks):
+        line_number += 1
+        if not line.strip():
+            continue
+
+        if fmt == "csv" and header is None:
+            header = [field.strip() for field in next(csv.reader([line]))]
+            missing = {"campaign_id", "date"} - set(header)
+            if missing:
+                raise ValueError(f"CSV header is missing required columns: {', '.join(sorted(missing))}")
+            continue
+
+        try:
+            if fmt == "csv":
+                values = next(csv.reader([line]))
+                if len(values) != len(header):
+                    raise ValueError(f"expected {len(header)} columns, got {len(values)}")
+                record = dict(zip(header, values))
+            else:
+                record = json.loads(line)
+                if not isinstance(record, dict):
+                    raise ValueError("expected a JSON object")
+            batch.append((line_number, record, None))
+        except ValueError as e:
+            batch.append((line_number, None, _describe_error(e)))
+
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+
+    if batch:
+        yield batch
+
+
+async def _iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Split a byte stream into decoded lines without buffering it all."""
+    pending = b""
+    async for chunk in chunks:
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            yield line.rstrip(b"\r").decode("utf-8-sig")
+    if pending:
+        yield pending.rstrip(b"\r").decode("utf-8-sig")
+
+
+def _value_or(value, default):
+    """Treat missing values and empty CSV cells as ``default``."""
+    if value is None or (isinstance(value, str) and not value.strip()):
+        return default
+    return value
+
+
+def _describe_error(error: Exception) -> str:
+    """Short, client-safe description of a validation error."""
+    if isinstance(error, KeyError):
+        return f"missing field {error}"
+    if isinstance(error, InvalidOperation):
+        return "invalid decimal value"
+    return str(error)
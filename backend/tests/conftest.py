@@ -0,0 +1,89 @@
+"""Shared fixtures for the backend test suite."""
+import os
+import tempfile
+
+# Settings are read at import time, so point them at a throwaway SQLite
+# database and mock mode before any application module is imported
+_db_dir = tempfile.mkdtemp(prefix="coretas-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_db_dir}/test.db"
+os.environ["ENVIRONMENT"] = "test"
+for _key in ("GOOGLE_ADS_API_KEY", "META_ACCESS_TOKEN", "AMAZON_CLIENT_ID"):
+    os.environ[_key] = ""
+
+import time  # noqa: E402
+import pytest  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from app import app  # noqa: E402
+from database import Base, SessionLocal, engine  # noqa: E402
+import models  # noqa: E402,F401 - registers every table on Base.metadata
+from models.campaign import Platform, CampaignType  # noqa: E402
+from repositories import CampaignRepository, MetricRepository, metric_cube  # noqa: E402
+from schemas.plan import GeneratedPlan, PlanInput  # noqa: E402
+from services.plan_service import PlanService  # noqa: E402
+from utils.cache import dashboard_cache  # noqa: E402
+
+
+@pytest.fixture
+def db():
+    """Session on freshly created tables, with process-wide caches cleared."""
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    dashboard_cache.invalidate()
+    metric_cube.invalidate()
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def client(db):
+    """Test client for the API, on the same fresh tables as ``db``."""
+    return TestClient(app)
+
+
+@pytest.fixture
+def make_campaign(db):
+    """Create a campaign with ``days`` of mock metrics."""
+    def make(platform: Platform = Platform.GOOGLE, campaign_type: CampaignType = CampaignType.PMAX, days: int = 7):
+        campaign = CampaignRepository(db).create(
+            name=f"{platform.value} campaign",
+            platform=platform,
+            campaign_type=campaign_type,
+            objective="Sales",
+            daily_budget=100,
+            product_categories=["shoes"],
+        )
+        MetricRepository(db).generate_mock_metrics(campaign.id, days=days)
+        return campaign
+    return make
+
+
+class FakePlatformService:
+    """Platform service double that counts its calls and can fail or be slow."""
+
+    def __init__(self, failing: bool = False, delay: float = 0.0):
+        self.calls = 0
+        self.failing = failing
+        self.delay = delay
+
+    def create_campaign(self, plan: GeneratedPlan) -> dict:
+        self.calls += 1
+        if self.delay:
+            time.sleep(self.delay)
+        if self.failing:
+            raise RuntimeError("platform down")
+        return {"name": "Fake campaign", "daily_budget": 10.0, "platform_campaign_id": f"fake_{self.calls}"}
+
+
+@pytest.fixture
+def plan() -> GeneratedPlan:
+    """A generated sales plan."""
+    return PlanService.generate_plan(PlanInput(objective="Sales", dailyBudget=100, productCategories="shoes"))
+
+
+@pytest.fixture
+def make_platform_service():
+    """Create a ``FakePlatformService`` to pass to ``CampaignExecutionService``."""
+    return FakePlatformService
@@ -0,0 +1,81 @@
+"""Tests for CampaignExecutionService."""
+import pytest
+from config import settings
+from models.campaign import Campaign, CampaignStatus, Platform, CampaignType
+from repositories.data_version_repository import DataVersionRepository
+from services.campaign_execution_service import CampaignExecutionService
+from utils.circuit_breaker import CircuitBreakerRegistry
+
+
+@pytest.mark.parametrize("call_timeout, plan_deadline, expected", [
+    (0.1, 5.0, "slow did not respond within 0.1 seconds"),
+    (5.0, 0.1, "slow did not respond before the 0.1 second plan deadline"),
+])
+def test_slow_platform_times_out_on_the_tighter_limit(
+    db, plan, make_platform_service, monkeypatch, call_timeout, plan_deadline, expected
+):
+    monkeypatch.setattr(settings, "PLATFORM_CALL_TIMEOUT_SECONDS", call_timeout)
+    monkeypatch.setattr(settings, "PLAN_EXECUTION_DEADLINE_SECONDS", plan_deadline)
+    service = CampaignExecutionService(
+        db,
+        platforms=[
+            ("fast", make_platform_service(), Platform.GOOGLE, CampaignType.PMAX),
+            ("slow", make_platform_service(delay=0.3), Platform.META, CampaignType.SHOPPING),
+        ],
+        breakers=CircuitBreakerRegistry(failure_threshold=5, recovery_timeout=30),
+    )
+
+    created, errors = service.execute_plan(plan)
+
+    assert len(created) == 1
+    assert errors == [f"Failed to create slow campaign: {expected}"]
+
+
+def test_complete_pending_plan_reports_deleted_campaign(db, make_campaign, make_platform_service, plan):
+    service = CampaignExecutionService(
+        db,
+        platforms=[
+            ("google", make_platform_service(), Platform.GOOGLE, CampaignType.PMAX),
+            ("meta", make_platform_service(), Platform.META, CampaignType.SHOPPING),
+        ],
+    )
+    kept = make_campaign(Platform.GOOGLE, days=0)
+    kept.status = CampaignStatus.PENDING
+    db.commit()
+
+    created, errors = service.complete_pending_plan(plan, {"google": kept.id, "meta": kept.id + 1000})
+
+    assert [c["id"] for c in created] == [kept.id]
+    assert errors == [f"Failed to create meta campaign: pending campaign {kept.id + 1000} no longer exists"]
+    assert db.get(Campaign, kept.id).status == CampaignStatus.ACTIVE
+
+
+def test_execute_plans_commits_each_chunk_separately(db, plan, make_platform_service, monkeypatch):
+    service = CampaignExecutionService(
+        db,
+        platforms=[
+            ("google", make_platform_service(), Platform.GOOGLE, CampaignType.PMAX),
+            ("meta", make_platform_service(failing=True), Platform.META, CampaignType.SHOPPING),
+        ],
+        breakers=CircuitBreakerRegistry(failure_threshold=100, recovery_timeout=30),
+    )
+    bump = DataVersionRepository.bump
+    bumps = 0
+
+    def bump_failing_second_chunk(self):
+        nonlocal bumps
+        bumps += 1
+        if bumps == 2:
+            raise RuntimeError("disk full")
+        return bump(self)
+
+    monkeypatch.setattr(DataVersionRepository, "bump", bump_failing_second_chunk)
+
+    results = service.execute_plans([plan] * 5, concurrency=2, commit_size=2)
+
+    assert [len(created) for created, _ in results] == [1, 1, 0, 0, 1]
+    assert results[2][1] == results[3][1] == ["Failed to save plan: disk full"]
+    for index in (0, 1, 4):
+        assert results[index][1] == ["Failed to create meta campaign: platform down"]
+    saved_ids = sorted(c.id for c in db.query(Campaign).all())
+    assert saved_ids == sorted(created[0]["id"] for created, _ in results if created)
@@ -0,0 +1,54 @@
+"""Tests for CampaignRepository."""
+from contextlib import contextmanager
+from typing import Iterator, List
+import pytest
+from sqlalchemy import event
+from database import engine
+from models.campaign import Platform, CampaignType, CampaignStatus
+from repositories import CampaignRepository
+from utils.cache import dashboard_cache
+
+
+@contextmanager
+def count_statements() -> Iterator[List[str]]:
+    """Collect every SQL statement executed on the engine."""
+    statements: List[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def test_get_with_metrics_statement_count_is_constant(db, make_campaign):
+    make_campaign()
+    with count_statements() as one:
+        result = CampaignRepository(db).get_with_metrics(days=7)
+    assert len(result) == 1
+
+    for _ in range(9):
+        make_campaign(Platform.META, CampaignType.SHOPPING)
+    dashboard_cache.invalidate()
+    with count_statements() as many:
+        result = CampaignRepository(db).get_with_metrics(days=7)
+    assert len(result) == 10
+
+    assert len(one) == len(many)
+
+
+def test_get_with_metrics_filters_and_derives_ratios(db, make_campaign):
+    google = make_campaign()
+    make_campaign(Platform.META, CampaignType.SHOPPING)
+    CampaignRepository(db).update_status(google.id, CampaignStatus.ACTIVE)
+
+    result = CampaignRepository(db).get_with_metrics(days=30, platform=Platform.GOOGLE, status=CampaignStatus.ACTIVE)
+
+    assert [row["id"] for row in result] == [google.id]
+    row = result[0]
+    assert row["totalImpressions"] > 0
+    assert row["ctr"] == pytest.approx(row["totalClicks"] / row["totalImpressions"] * 100, abs=0.01)
+    assert row["roas"] == pytest.approx(row["totalConversionValue"] / row["totalSpend"], abs=0.01)
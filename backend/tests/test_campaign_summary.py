@@ -0,0 +1,56 @@
+"""Tests for the dashboard summary totals."""
+import pytest
+from models.campaign import CampaignType, Platform
+
+
+@pytest.fixture
+def campaigns(make_campaign):
+    return [
+        make_campaign(days=3),
+        make_campaign(days=5),
+        make_campaign(Platform.META, CampaignType.SHOPPING, days=4),
+    ]
+
+
+def summed(campaigns: list) -> dict:
+    return {
+        field: sum(c[field] for c in campaigns)
+        for field in ("totalSpend", "totalImpressions", "totalClicks", "totalConversions", "totalConversionValue")
+    }
+
+
+def totals_of(group: dict) -> dict:
+    return {field: group[field] for field in summed([])}
+
+
+def test_summary_matches_campaign_list(client, campaigns):
+    listed = client.get("/api/campaigns", params={"days": 7}).json()
+
+    summary = client.get("/api/campaigns/summary", params={"days": 7}).json()
+
+    assert summary["total"]["campaignCount"] == 3
+    assert totals_of(summary["total"]) == pytest.approx(summed(listed), abs=0.01)
+    total = summary["total"]
+    assert total["ctr"] == pytest.approx(total["totalClicks"] / total["totalImpressions"] * 100, abs=0.01)
+    assert total["roas"] == pytest.approx(total["totalConversionValue"] / total["totalSpend"], abs=0.01)
+
+
+def test_summary_groups_by_platform_type_and_status(client, campaigns):
+    listed = client.get("/api/campaigns", params={"days": 7}).json()
+
+    summary = client.get("/api/campaigns/summary", params={"days": 7}).json()
+
+    by_platform = {group["key"]: group for group in summary["byPlatform"]}
+    assert {key: group["campaignCount"] for key, group in by_platform.items()} == {"google": 2, "meta": 1}
+    for key, group in by_platform.items():
+        assert totals_of(group) == pytest.approx(summed([c for c in listed if c["platform"] == key]), abs=0.01)
+    assert {group["key"]: group["campaignCount"] for group in summary["byType"]} == {"pmax": 2, "shopping": 1}
+    assert sum(group["campaignCount"] for group in summary["byStatus"]) == 3
+
+
+def test_summary_applies_filters(client, campaigns):
+    summary = client.get("/api/campaigns/summary", params={"platform": "meta"}).json()
+
+    assert summary["total"]["campaignCount"] == 1
+    assert [group["key"] for group in summary["byPlatform"]] == ["meta"]
+    assert client.get("/api/campaigns/summary", params={"platform": "tiktok"}).status_code == 400
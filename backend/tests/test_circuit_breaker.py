@@ -0,0 +1,102 @@
+"""Tests for the per-platform circuit breakers in plan execution."""
+import pytest
+from models.campaign import Platform, CampaignType
+from services.campaign_execution_service import CampaignExecutionService
+from utils.circuit_breaker import CircuitBreaker, CircuitBreakerRegistry, CLOSED, OPEN, HALF_OPEN
+from utils.errors import CircuitOpenError
+
+
+class FakeClock:
+    """Monotonic clock advanced by hand."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def breakers(clock):
+    return CircuitBreakerRegistry(failure_threshold=2, recovery_timeout=30, clock=clock)
+
+
+@pytest.fixture
+def fake(make_platform_service):
+    return make_platform_service(failing=True)
+
+
+@pytest.fixture
+def service(db, fake, breakers):
+    return CampaignExecutionService(
+        db,
+        platforms=[("fake", fake, Platform.GOOGLE, CampaignType.PMAX)],
+        breakers=breakers,
+    )
+
+
+def test_breaker_cycles_closed_open_half_open_closed(service, fake, breakers, clock, plan):
+    breaker = breakers.get("fake")
+
+    service.execute_plan(plan)
+    assert breaker.state == CLOSED
+    service.execute_plan(plan)
+    assert breaker.state == OPEN
+
+    clock.now += 30
+    assert breaker.state == HALF_OPEN
+
+    fake.failing = False
+    created, errors = service.execute_plan(plan)
+    assert breaker.state == CLOSED
+    assert len(created) == 1 and errors == []
+    assert fake.calls == 3
+
+
+def test_failed_trial_reopens_breaker(service, fake, breakers, clock, plan):
+    service.execute_plan(plan)
+    service.execute_plan(plan)
+    clock.now += 30
+
+    service.execute_plan(plan)
+
+    assert breakers.get("fake").state == OPEN
+    assert fake.calls == 3
+
+
+def test_open_breaker_fails_fast_without_calling_platform(service, fake, breakers, plan):
+    service.execute_plan(plan)
+    service.execute_plan(plan)
+    assert fake.calls == 2
+
+    created, errors = service.execute_plan(plan)
+
+    assert fake.calls == 2
+    assert created == []
+    assert len(errors) == 1 and "circuit is open" in errors[0]
+    assert breakers.get("fake").snapshot()["rejected"] == 1
+
+
+def test_late_success_does_not_close_open_breaker(clock):
+    breaker = CircuitBreaker("fake", failure_threshold=1, recovery_timeout=30, clock=clock)
+    slow_call = breaker.before_call()
+    breaker.record_failure(breaker.before_call())
+    assert breaker.state == OPEN
+
+    breaker.record_success(slow_call)
+    assert breaker.state == OPEN
+
+    clock.now += 30
+    trial = breaker.before_call()
+    breaker.record_success(slow_call)
+    assert breaker.state == HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    breaker.record_success(trial)
+    assert breaker.state == CLOSED
@@ -0,0 +1,48 @@
+"""Tests for connection pool configuration and SQLite tuning."""
+import pytest
+from sqlalchemy import exc, text
+from config import settings
+from database import InstrumentedQueuePool, _create_sync_engine, _engine_options, engine
+
+
+def test_file_database_uses_configured_instrumented_pool():
+    assert isinstance(engine.pool, InstrumentedQueuePool)
+    assert engine.pool.size() == settings.DB_POOL_SIZE
+    assert _engine_options("sqlite://", InstrumentedQueuePool) == {}
+    assert _engine_options("sqlite:///:memory:", InstrumentedQueuePool) == {}
+
+
+def test_sqlite_connections_are_tuned():
+    with engine.connect() as connection:
+        assert connection.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert connection.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+        assert connection.execute(text("PRAGMA busy_timeout")).scalar() == int(settings.SQLITE_BUSY_TIMEOUT_MS)
+
+
+def test_pool_records_checkouts_and_timeouts(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "DB_POOL_SIZE", 1)
+    monkeypatch.setattr(settings, "DB_MAX_OVERFLOW", 0)
+    monkeypatch.setattr(settings, "DB_POOL_TIMEOUT_SECONDS", 0.05)
+    small_engine = _create_sync_engine(f"sqlite:///{tmp_path / 'pool.db'}")
+
+    try:
+        with small_engine.connect():
+            with pytest.raises(exc.TimeoutError):
+                small_engine.connect()
+            stats = small_engine.pool.stats.snapshot(small_engine.pool)
+            assert stats["checked_out"] == 1
+    finally:
+        small_engine.dispose()
+
+    assert stats["checkouts"] == 1
+    assert stats["timeouts"] == 1
+    assert stats["max_wait_ms"] >= 50
+
+
+def test_pool_stats_endpoint_reports_sync_and_async_pools(client):
+    client.get("/api/campaigns")
+
+    stats = client.get("/api/db/pool/stats").json()
+
+    assert stats["sync"]["size"] == settings.DB_POOL_SIZE
+    assert stats["async"]["checkouts"] >= 1
@@ -0,0 +1,49 @@
+"""Tests for data-version ETags and conditional dashboard reads."""
+import pytest
+from starlette.requests import Request
+from api.routes import _etag_matches
+from repositories import CampaignRepository
+from models.campaign import CampaignStatus
+
+ETAG = 'W/"5-2026-03-01"'
+
+
+def request_with(if_none_match: str = None) -> Request:
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match is not None else []
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+@pytest.mark.parametrize("if_none_match, matches", [
+    (None, False),
+    ("", False),
+    ("*", True),
+    (" * ", True),
+    (ETAG, True),
+    ('"5-2026-03-01"', True),  # weak comparison ignores W/
+    ('W/"4-2026-03-01", W/"5-2026-03-01"', True),
+    ('"4-2026-03-01" ,  "5-2026-03-01"', True),
+    ('W/"4-2026-03-01"', False),
+    ('W/"5-2026-02-28"', False),
+    ('"*"', False),
+])
+def test_etag_matches_uses_weak_comparison(if_none_match, matches):
+    assert _etag_matches(request_with(if_none_match), ETAG) is matches
+
+
+@pytest.mark.parametrize("path", ["/api/campaigns", "/api/metrics", "/api/metrics?campaign_id=1", "/api/metrics?limit=5"])
+def test_matching_if_none_match_gets_304_until_data_changes(client, db, make_campaign, path):
+    campaign = make_campaign(days=2)
+    first = client.get(path)
+    etag = first.headers["ETag"]
+
+    cached = client.get(path, headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["ETag"] == etag
+    assert cached.content == b""
+    assert client.get(path, headers={"If-None-Match": "*"}).status_code == 304
+
+    CampaignRepository(db).update_status(campaign.id, CampaignStatus.FAILED)
+
+    changed = client.get(path, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
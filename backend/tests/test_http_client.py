@@ -0,0 +1,101 @@
+"""Tests for PlatformHttpClient against local HTTP servers."""
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import httpx
+import pytest
+from utils.http_client import PlatformHttpClient
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Keep-alive handler answering ``/slow`` after a delay and anything else at once."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.server.connections.add(self.client_address)
+        if self.path == "/slow":
+            time.sleep(0.5)
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # the client gave up waiting
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def start_server():
+    servers = []
+
+    def start() -> ThreadingHTTPServer:
+        server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+        server.daemon_threads = True
+        server.connections = set()
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def http():
+    client = PlatformHttpClient(
+        timeout=httpx.Timeout(connect=1.0, read=0.1, write=1.0, pool=1.0),
+        max_connections=4,
+        max_keepalive_connections=4,
+        keepalive_expiry=30.0,
+        max_retries=0,
+    )
+    yield client
+    client.close()
+
+
+def url_of(server: ThreadingHTTPServer, path: str = "/") -> str:
+    host, port = server.server_address
+    return f"http://{host}:{port}{path}"
+
+
+def test_sequential_requests_reuse_one_connection(start_server, http):
+    server = start_server()
+
+    for _ in range(5):
+        assert http.request("meta", "GET", url_of(server)).json() == {"ok": True}
+
+    counters = http.stats()["hosts"][url_of(server).rstrip("/")]
+    assert counters["requests"] == 5
+    assert counters["connections_opened"] == 1
+    assert len(server.connections) == 1
+
+
+def test_each_host_gets_its_own_pool(start_server, http):
+    first, second = start_server(), start_server()
+
+    http.request("google", "GET", url_of(first))
+    http.request("amazon", "GET", url_of(second))
+    http.request("google", "GET", url_of(first))
+
+    assert http.client(url_of(first)) is not http.client(url_of(second))
+    hosts = http.stats()["hosts"]
+    assert hosts[url_of(first).rstrip("/")]["connections_opened"] == 1
+    assert hosts[url_of(second).rstrip("/")]["connections_opened"] == 1
+    assert hosts[url_of(first).rstrip("/")]["requests"] == 2
+
+
+def test_read_timeout_applies(start_server, http):
+    server = start_server()
+
+    with pytest.raises(httpx.ReadTimeout):
+        http.request("meta", "GET", url_of(server, "/slow"))
+
+    assert http.stats()["hosts"][url_of(server).rstrip("/")]["errors"] == 1
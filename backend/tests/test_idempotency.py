@@ -0,0 +1,54 @@
+"""Tests for idempotent plan execution."""
+import asyncio
+from datetime import datetime, timedelta
+import httpx
+from app import app
+from models.plan_execution import PlanExecution, PlanExecutionStatus
+from schemas.plan import PlanInput
+from services.idempotency_service import IdempotencyService, IDEMPOTENCY_KEY_HEADER, IDEMPOTENT_REPLAYED_HEADER
+from services.plan_service import PlanService
+
+
+def plan_json(budget: float) -> dict:
+    plan = PlanService.generate_plan(PlanInput(objective="Sales", dailyBudget=budget, productCategories="shoes"))
+    return plan.model_dump(mode="json")
+
+
+async def post_concurrently(*requests):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await asyncio.gather(*(
+            client.post("/api/campaigns/execute", json=body, headers={IDEMPOTENCY_KEY_HEADER: key})
+            for key, body in requests
+        ))
+
+
+def test_concurrent_duplicate_gets_replayed_response(db):
+    first, second = asyncio.run(post_concurrently(("k1", plan_json(100)), ("k1", plan_json(100))))
+
+    assert first.status_code == second.status_code == 201
+    assert first.json() == second.json()
+    replayed = [r.headers.get(IDEMPOTENT_REPLAYED_HEADER) for r in (first, second)]
+    assert replayed.count("true") == 1
+    assert db.query(PlanExecution).count() == 1
+
+
+def test_concurrent_different_plan_with_same_key_is_rejected(db):
+    first, second = asyncio.run(post_concurrently(("k2", plan_json(100)), ("k2", plan_json(200))))
+
+    assert sorted([first.status_code, second.status_code]) == [201, 422]
+
+
+def test_begin_purges_expired_records(db):
+    old = datetime.utcnow() - timedelta(days=30)
+    db.add_all([
+        PlanExecution(idempotency_key="key:old", request_hash="a", status=PlanExecutionStatus.COMPLETED, created_at=old),
+        PlanExecution(idempotency_key="plan:old", request_hash="b", status=PlanExecutionStatus.COMPLETED, created_at=old),
+        PlanExecution(idempotency_key="key:fresh", request_hash="c", status=PlanExecutionStatus.COMPLETED),
+    ])
+    db.commit()
+
+    assert IdempotencyService(db).begin("key:new", "d", ttl_seconds=60) is None
+
+    keys = {record.idempotency_key for record in db.query(PlanExecution).all()}
+    assert keys == {"key:fresh", "key:new"}
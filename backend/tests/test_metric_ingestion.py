@@ -0,0 +1,31 @@
+"""Tests for bulk metric ingestion."""
+import json
+from datetime import date
+from models.metric import CampaignMetric
+from repositories import MetricRepository
+
+
+def test_repeated_campaign_day_in_one_batch_keeps_last_row(client, db, make_campaign, monkeypatch):
+    campaign = make_campaign(days=0)
+    written = []
+    upsert_bulk = MetricRepository.upsert_bulk
+
+    def spy(self, metrics, batch_size):
+        written.append([(m["campaign_id"], m["date"]) for m in metrics])
+        return upsert_bulk(self, metrics, batch_size)
+
+    monkeypatch.setattr(MetricRepository, "upsert_bulk", spy)
+    body = "\n".join(json.dumps(row) for row in [
+        {"campaign_id": campaign.id, "date": "2026-01-01", "spend": 10, "impressions": 100, "clicks": 1},
+        {"campaign_id": campaign.id, "date": "2026-01-02", "spend": 20, "impressions": 200, "clicks": 2},
+        {"campaign_id": campaign.id, "date": "2026-01-01", "spend": 30, "impressions": 300, "clicks": 3},
+    ])
+
+    response = client.post("/api/metrics/bulk?format=ndjson", content=body)
+
+    assert response.status_code == 200
+    assert response.json()["accepted"] == 3
+    assert written == [[(campaign.id, date(2026, 1, 1)), (campaign.id, date(2026, 1, 2))]]
+    db.expire_all()
+    row = db.query(CampaignMetric).filter_by(campaign_id=campaign.id, date=date(2026, 1, 1)).one()
+    assert (row.spend, row.impressions, row.clicks) == (30, 300, 3)
@@ -0,0 +1,90 @@
+"""Tests for bucketed metric series."""
+from datetime import date
+import pytest
+from models.campaign import CampaignType, Platform
+from repositories import MetricRepository
+
+
+@pytest.fixture
+def metrics(db, make_campaign):
+    """Google metrics on Sat 28 Feb, Sun 1 Mar and Mon 2 Mar 2026, and one Meta day."""
+    google = make_campaign(days=0)
+    meta = make_campaign(Platform.META, CampaignType.SHOPPING, days=0)
+    rows = [
+        (google.id, date(2026, 2, 28), 10),
+        (google.id, date(2026, 3, 1), 20),
+        (google.id, date(2026, 3, 2), 30),
+        (meta.id, date(2026, 3, 2), 40),
+    ]
+    MetricRepository(db).upsert_bulk([
+        {
+            "campaign_id": campaign_id,
+            "date": day,
+            "spend": spend,
+            "impressions": spend * 10,
+            "clicks": spend,
+            "conversions": 1,
+            "conversion_value": spend * 3,
+        }
+        for campaign_id, day, spend in rows
+    ])
+    return google, meta
+
+
+def spend_by_bucket(series: list) -> dict:
+    return {point["bucket"]: point["total_spend"] for point in series}
+
+
+def test_day_buckets_fill_gaps_with_zeros(db, metrics):
+    series = MetricRepository(db).get_series("day", date(2026, 2, 27), date(2026, 3, 3))
+
+    assert spend_by_bucket(series) == {
+        "2026-02-27": 0.0,
+        "2026-02-28": 10.0,
+        "2026-03-01": 20.0,
+        "2026-03-02": 70.0,
+        "2026-03-03": 0.0,
+    }
+    assert series[1]["ctr"] == 10.0
+    assert series[1]["roas"] == 3.0
+
+
+def test_week_buckets_start_on_monday(db, metrics):
+    series = MetricRepository(db).get_series("week", date(2026, 2, 25), date(2026, 3, 4))
+
+    assert spend_by_bucket(series) == {"2026-02-23": 30.0, "2026-03-02": 70.0}
+
+
+def test_month_buckets_and_filters(db, metrics):
+    google, meta = metrics
+    repo = MetricRepository(db)
+
+    assert spend_by_bucket(repo.get_series("month", date(2026, 2, 1), date(2026, 3, 31))) == {
+        "2026-02-01": 10.0,
+        "2026-03-01": 90.0,
+    }
+    assert spend_by_bucket(repo.get_series("month", date(2026, 2, 1), date(2026, 3, 31), campaign_id=meta.id)) == {
+        "2026-02-01": 0.0,
+        "2026-03-01": 40.0,
+    }
+    assert spend_by_bucket(repo.get_series("month", date(2026, 2, 1), date(2026, 3, 31), platform=Platform.GOOGLE)) == {
+        "2026-02-01": 10.0,
+        "2026-03-01": 50.0,
+    }
+
+
+@pytest.mark.parametrize("params", [
+    {"interval": "hour"},
+    {"campaign_id": 1, "platform": "google"},
+])
+def test_series_route_rejects_bad_parameters(client, params):
+    assert client.get("/api/metrics/series", params=params).status_code == 400
+
+
+def test_series_route_returns_one_point_per_day(client, make_campaign):
+    make_campaign(days=3)
+
+    series = client.get("/api/metrics/series", params={"days": 6}).json()
+
+    assert len(series) == 7
+    assert sum(point["total_spend"] > 0 for point in series) == 3
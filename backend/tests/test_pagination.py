@@ -0,0 +1,78 @@
+"""Tests for keyset pagination cursors."""
+from datetime import date, datetime
+import pytest
+from utils.pagination import NEXT_CURSOR_HEADER, decode_cursor, encode_cursor
+
+
+def test_cursor_round_trips_key_types():
+    created_at = datetime(2026, 3, 1, 12, 30, 15)
+
+    cursor = encode_cursor(created_at, 42)
+
+    assert decode_cursor(cursor, (datetime, int)) == [created_at, 42]
+    assert decode_cursor(encode_cursor(date(2026, 3, 1), 7), (date, int)) == [date(2026, 3, 1), 7]
+
+
+@pytest.mark.parametrize("cursor", [
+    "not base64!",
+    "é",
+    encode_cursor("2026-03-01")[:-2],
+    "eyJhIjoxfQ",  # a JSON object, not a list
+    encode_cursor("2026-03-01"),  # too few components
+    encode_cursor("2026-03-01", 1, 2),  # too many components
+    encode_cursor("yesterday", 1),  # not an ISO date
+    encode_cursor("2026-03-01", "abc"),  # not an int
+    encode_cursor(None, 1),
+])
+def test_malformed_cursor_raises_value_error(cursor):
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_cursor(cursor, (date, int))
+
+
+def test_campaign_pages_follow_next_cursor(client, make_campaign):
+    ids = {make_campaign(days=1).id for _ in range(5)}
+
+    seen = []
+    cursor = None
+    for _ in range(5):
+        params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+        response = client.get("/api/campaigns", params=params)
+        assert response.status_code == 200
+        seen.extend(c["id"] for c in response.json())
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if cursor is None:
+            break
+
+    assert sorted(seen) == sorted(ids)
+    assert seen == sorted(seen, reverse=True)
+
+
+def test_invalid_cursor_is_rejected_with_400(client):
+    for path in ("/api/campaigns", "/api/metrics"):
+        response = client.get(path, params={"limit": 2, "cursor": "garbage"})
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Invalid cursor"
+
+
+def test_metric_pages_cover_every_row_once(client, make_campaign):
+    make_campaign(days=3)
+    make_campaign(days=3)
+    everything = client.get("/api/metrics", params={"days": 7}).json()
+
+    pages = []
+    cursor = None
+    while True:
+        params = {"days": 7, "limit": 4, **({"cursor": cursor} if cursor else {})}
+        response = client.get("/api/metrics", params=params)
+        pages.append(response.json())
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if cursor is None:
+            break
+
+    assert [len(page) for page in pages] == [4, 2]
+    paged = [row for page in pages for row in page]
+    assert sorted(map(row_key, paged)) == sorted(map(row_key, everything))
+
+
+def row_key(row: dict) -> tuple:
+    return row["date"], row["campaign_id"]
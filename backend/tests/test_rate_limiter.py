@@ -0,0 +1,105 @@
+"""Tests for the client-side token-bucket rate limiters."""
+import asyncio
+import threading
+import time
+import pytest
+from utils.errors import RateLimitTimeoutError
+from utils.rate_limiter import PlatformRateLimiters, TokenBucket
+
+
+class FrozenClock:
+    """Clock that stands still unless moved by hand, so tokens never refill by themselves."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_waiters_are_served_in_arrival_order():
+    bucket = TokenBucket("test", rate=100, burst=1, clock=FrozenClock())
+    served = []
+
+    async def caller(n: int) -> float:
+        wait = await bucket.aacquire()
+        served.append(n)
+        return wait
+
+    async def main():
+        return await asyncio.gather(*(caller(n) for n in range(5)))
+
+    waits = asyncio.run(main())
+
+    assert served == [0, 1, 2, 3, 4]
+    assert waits == pytest.approx([0.0, 0.01, 0.02, 0.03, 0.04])
+
+
+def test_wait_longer_than_timeout_is_refused():
+    clock = FrozenClock()
+    bucket = TokenBucket("test", rate=1, burst=1, clock=clock)
+    bucket.acquire()
+
+    with pytest.raises(RateLimitTimeoutError):
+        bucket.acquire(timeout=0.5)
+
+    stats = bucket.stats()
+    assert stats["timeouts"] == 1
+    assert stats["acquired"] == 1
+    clock.now += 1
+    assert bucket.acquire(timeout=0.5) == 0.0
+
+
+def test_cancelled_waiter_refunds_its_token():
+    bucket = TokenBucket("test", rate=1, burst=1, clock=FrozenClock())
+    bucket.acquire()
+
+    async def main():
+        waiter = asyncio.create_task(bucket.aacquire())
+        await asyncio.sleep(0.01)
+        assert bucket.stats()["queue_depth"] == 1
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+    asyncio.run(main())
+
+    stats = bucket.stats()
+    assert stats["queue_depth"] == 0
+    assert stats["acquired"] == 1
+    assert stats["tokens_available"] == 0
+    # The next caller waits one token, not two
+    with pytest.raises(RateLimitTimeoutError) as exc_info:
+        bucket.acquire(timeout=0.5)
+    assert exc_info.value.wait == pytest.approx(1.0)
+
+
+def test_stats_endpoint_reports_queue_depth_and_waits(client, monkeypatch):
+    limiters = PlatformRateLimiters(
+        rates={"meta": 10},
+        accounts={"meta": lambda: "act_1"},
+        burst_seconds=0.1,
+        max_wait=None,
+    )
+    monkeypatch.setattr("api.routes.platform_rate_limiters", limiters)
+    limiters.acquire("meta")
+    callers = [threading.Thread(target=limiters.acquire, args=("meta",)) for _ in range(2)]
+    for caller in callers:
+        caller.start()
+    bucket = limiters.get("meta")
+    deadline = time.monotonic() + 1
+    while bucket.stats()["queue_depth"] < 2 and time.monotonic() < deadline:
+        time.sleep(0.005)
+
+    queued = client.get("/api/rate-limits/stats").json()["meta:act_1"]
+    for caller in callers:
+        caller.join()
+    drained = client.get("/api/rate-limits/stats").json()["meta:act_1"]
+
+    assert queued["queue_depth"] == 2
+    assert queued["acquired"] == 3
+    assert queued["delayed"] == 2
+    # The second waiter queues one token behind the first
+    assert 100 < queued["max_wait_ms"] <= 200
+    assert 0 < queued["avg_wait_ms"] < queued["max_wait_ms"]
+    assert drained["queue_depth"] == 0
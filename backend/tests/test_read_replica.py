@@ -0,0 +1,94 @@
+"""Tests for routing reporting reads to a read replica."""
+import json
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# Runs in a fresh interpreter, since the engines are created from the
+# environment at import time
+SCRIPT = textwrap.dedent("""
+    import json
+    from fastapi.testclient import TestClient
+    from app import app
+    from database import Base, SessionLocal, ReadSessionLocal, engine, read_engine
+    import models  # noqa: F401 - registers every table on Base.metadata
+    from models.campaign import Campaign, Platform, CampaignType
+    from repositories import CampaignRepository
+    from schemas.plan import PlanInput
+    from services.plan_service import PlanService
+
+    for bind in {engine, read_engine}:
+        Base.metadata.create_all(bind)
+    for session_factory, name in ((SessionLocal, "primary"), (ReadSessionLocal, "replica")):
+        db = session_factory()
+        if db.query(Campaign).count() == 0:
+            CampaignRepository(db).create(
+                name=name,
+                platform=Platform.GOOGLE,
+                campaign_type=CampaignType.PMAX,
+                objective="Sales",
+                daily_budget=100,
+                product_categories=["shoes"],
+            )
+        db.close()
+
+    client = TestClient(app)
+    listed = [c["name"] for c in client.get("/api/campaigns").json()]
+    plan = PlanService.generate_plan(PlanInput(objective="Sales", dailyBudget=100, productCategories="shoes"))
+    executed = client.post("/api/campaigns/execute", json=plan.model_dump(mode="json")).status_code
+
+    counts = {}
+    for session_factory, name in ((SessionLocal, "primary"), (ReadSessionLocal, "replica")):
+        db = session_factory()
+        counts[name] = db.query(Campaign).count()
+        db.close()
+    print(json.dumps({"listed": listed, "executed": executed, "counts": counts}))
+""")
+
+
+def run_app(database_url: str, read_database_url: str = "") -> dict:
+    env = {
+        **os.environ,
+        "DATABASE_URL": database_url,
+        "READ_DATABASE_URL": read_database_url,
+        "ASYNC_READ_DATABASE_URL": "",
+    }
+    result = subprocess.run(
+        [sys.executable, "-c", SCRIPT],
+        cwd=BACKEND_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+@pytest.fixture
+def sqlite_urls(tmp_path):
+    return f"sqlite:///{tmp_path / 'primary.db'}", f"sqlite:///{tmp_path / 'replica.db'}"
+
+
+def test_reports_read_replica_and_plans_write_primary(sqlite_urls):
+    primary, replica = sqlite_urls
+
+    result = run_app(primary, replica)
+
+    assert result["listed"] == ["replica"]
+    assert result["executed"] == 201
+    assert result["counts"]["primary"] > 1
+    assert result["counts"]["replica"] == 1
+
+
+def test_reads_fall_back_to_primary_without_replica(sqlite_urls):
+    primary, _ = sqlite_urls
+
+    result = run_app(primary)
+
+    assert result["listed"] == ["primary"]
+    assert result["counts"]["primary"] == result["counts"]["replica"] > 1
@@ -0,0 +1,165 @@
+"""Tests for RetryPolicy and RetryBudget."""
+import asyncio
+import random
+import pytest
+from utils.retry import RetryBudget, RetryPolicy
+
+
+class FakeClock:
+    """Monotonic clock that only moves when something sleeps on it."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class FixedRandom(random.Random):
+    """RNG whose uniform draws land at a fixed fraction of the range."""
+
+    def __init__(self, fraction: float):
+        super().__init__()
+        self.fraction = fraction
+
+    def uniform(self, a: float, b: float) -> float:
+        return a + (b - a) * self.fraction
+
+
+class Flaky:
+    """Callable that raises ``error`` for its first ``failures`` calls."""
+
+    def __init__(self, failures: int, error: Exception = None):
+        self.failures = failures
+        self.error = error or ConnectionError("flaky")
+        self.calls = 0
+
+    def __call__(self) -> str:
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise self.error
+        return "ok"
+
+
+class ResponseError(Exception):
+    """Error carrying an HTTP-like response with headers."""
+
+    def __init__(self, headers: dict):
+        super().__init__("429 Too Many Requests")
+        self.response = type("Response", (), {"status_code": 429, "headers": headers})()
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def budget(clock):
+    return RetryBudget(ratio=1.0, min_retries=100, window=60, clock=clock)
+
+
+def make_policy(clock, budget, rng, **kwargs) -> RetryPolicy:
+    options = {"max_retries": 10, "initial_delay": 1.0, "backoff_factor": 3.0, "max_delay": 30.0}
+    options.update(kwargs)
+    return RetryPolicy(budget=budget, name="test", clock=clock, sleep=clock.sleep, rng=rng, **options)
+
+
+def test_jittered_delays_stay_within_bounds(clock, budget):
+    policy = make_policy(clock, budget, random.Random(42), max_delay=20.0)
+
+    assert policy.call(Flaky(10)) == "ok"
+
+    previous = 0.0
+    for delay in clock.sleeps:
+        assert 1.0 <= delay <= min(max(previous * 3.0, 1.0), 20.0)
+        previous = delay
+    assert len(set(clock.sleeps)) > 1
+
+
+def test_delay_upper_bound_grows_and_caps_at_max_delay(clock, budget):
+    policy = make_policy(clock, budget, FixedRandom(1.0), max_retries=5, max_delay=20.0)
+
+    policy.call(Flaky(5))
+
+    assert clock.sleeps == [1.0, 3.0, 9.0, 20.0, 20.0]
+
+
+def test_retry_after_overrides_shorter_computed_delay(clock, budget):
+    policy = make_policy(clock, budget, FixedRandom(0.0))
+
+    policy.call(Flaky(1, ResponseError({"Retry-After": "7"})))
+
+    assert clock.sleeps == [7.0]
+
+
+def test_stops_when_next_attempt_would_pass_deadline(clock, budget):
+    policy = make_policy(clock, budget, FixedRandom(1.0), deadline=10.0)
+    func = Flaky(10)
+
+    with pytest.raises(ConnectionError):
+        policy.call(func)
+
+    assert func.calls == 3
+    assert clock.sleeps == [1.0, 3.0]
+
+
+def test_exhausted_budget_stops_retries(clock):
+    budget = RetryBudget(ratio=0.0, min_retries=1, window=60, clock=clock)
+    policy = make_policy(clock, budget, FixedRandom(0.0))
+    first, second = Flaky(10), Flaky(10)
+
+    with pytest.raises(ConnectionError):
+        policy.call(first)
+    with pytest.raises(ConnectionError):
+        policy.call(second)
+
+    assert first.calls == 2
+    assert second.calls == 1
+    assert budget.stats() == {"requests": 2, "retries": 1}
+
+
+def test_budget_refills_after_window(clock):
+    budget = RetryBudget(ratio=0.0, min_retries=1, window=60, clock=clock)
+
+    assert budget.try_spend()
+    assert not budget.try_spend()
+    clock.now += 61
+    assert budget.try_spend()
+
+
+def test_acall_sleeps_without_blocking_event_loop(budget):
+    policy = RetryPolicy(max_retries=2, initial_delay=0.05, max_delay=0.05, budget=budget, name="test", rng=FixedRandom(0.0))
+    attempts = 0
+    ticks = 0
+
+    async def flaky() -> str:
+        nonlocal attempts
+        attempts += 1
+        if attempts <= 2:
+            raise ConnectionError("flaky")
+        return "ok"
+
+    async def ticker(done: asyncio.Event) -> None:
+        nonlocal ticks
+        while not done.is_set():
+            ticks += 1
+            await asyncio.sleep(0.005)
+
+    async def main() -> str:
+        done = asyncio.Event()
+        ticking = asyncio.create_task(ticker(done))
+        try:
+            return await policy.acall(flaky)
+        finally:
+            done.set()
+            await ticking
+
+    assert asyncio.run(main()) == "ok"
+    assert attempts == 3
+    assert ticks >= 10
@@ -0,0 +1,50 @@
+"""Tests for the daily rollup tables."""
+from datetime import date
+from models.campaign import CampaignType, Platform
+from models.rollup import CampaignDailyRollup, SegmentDailyRollup
+from repositories import MetricRepository
+
+DAY = date(2026, 3, 2)
+
+
+def metric(campaign_id: int, spend: float, impressions: int, clicks: int, day: date = DAY) -> dict:
+    return {
+        "campaign_id": campaign_id,
+        "date": day,
+        "spend": spend,
+        "impressions": impressions,
+        "clicks": clicks,
+        "conversions": 1,
+        "conversion_value": spend * 2,
+    }
+
+
+def test_upsert_refreshes_campaign_and_segment_rollups(db, make_campaign):
+    first, second = make_campaign(days=0), make_campaign(days=0)
+    meta = make_campaign(Platform.META, CampaignType.SHOPPING, days=0)
+
+    MetricRepository(db).upsert_bulk([
+        metric(first.id, 10, 100, 5),
+        metric(second.id, 20, 200, 10),
+        metric(meta.id, 30, 300, 15),
+    ])
+
+    campaign_rollup = db.get(CampaignDailyRollup, (first.id, DAY))
+    assert (float(campaign_rollup.spend), campaign_rollup.impressions, campaign_rollup.clicks) == (10, 100, 5)
+    google = db.get(SegmentDailyRollup, (Platform.GOOGLE, CampaignType.PMAX, DAY))
+    assert (float(google.spend), google.impressions, google.clicks, google.conversions) == (30, 300, 15, 2)
+    assert float(google.conversion_value) == 60
+    assert db.get(SegmentDailyRollup, (Platform.META, CampaignType.SHOPPING, DAY)).impressions == 300
+
+
+def test_reingesting_a_day_replaces_its_rollup(db, make_campaign):
+    campaign = make_campaign(days=0)
+    repo = MetricRepository(db)
+
+    repo.upsert_bulk([metric(campaign.id, 10, 100, 5)])
+    repo.upsert_bulk([metric(campaign.id, 12, 120, 6)])
+    db.expire_all()
+
+    assert db.get(CampaignDailyRollup, (campaign.id, DAY)).impressions == 120
+    assert db.get(SegmentDailyRollup, (Platform.GOOGLE, CampaignType.PMAX, DAY)).impressions == 120
+    assert db.get(CampaignDailyRollup, (campaign.id, date(2026, 3, 3))) is None
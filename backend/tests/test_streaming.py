@@ -0,0 +1,99 @@
+"""Tests for streamed JSON, NDJSON and CSV responses."""
+import csv
+import gzip
+import io
+import json
+import pytest
+from models.campaign import CampaignType, Platform
+from models.metric import CampaignMetric
+from utils.streaming import gzip_stream, stream_csv, stream_json_array, stream_ndjson
+
+
+@pytest.mark.parametrize("count, chunk_size", [(0, 3), (1, 3), (3, 3), (7, 3), (7, 1)])
+def test_json_array_chunks_join_to_valid_json(count, chunk_size):
+    items = [{"n": n} for n in range(count)]
+
+    chunks = list(stream_json_array(iter(items), chunk_size=chunk_size))
+
+    assert json.loads("".join(chunks)) == items
+    assert len(chunks) == count // chunk_size + 1
+
+
+def test_json_array_pulls_items_lazily():
+    pulled = []
+
+    def items():
+        for n in range(10):
+            pulled.append(n)
+            yield {"n": n}
+
+    chunks = stream_json_array(items(), chunk_size=2)
+    next(chunks)
+
+    assert pulled == [0, 1]
+
+
+def test_all_campaign_metrics_stream_every_row_with_campaign_fields(client, db, make_campaign):
+    google = make_campaign(days=3)
+    make_campaign(Platform.META, CampaignType.SHOPPING, days=2)
+
+    response = client.get("/api/metrics", params={"days": 7})
+
+    assert response.status_code == 200
+    rows = response.json()
+    assert len(rows) == db.query(CampaignMetric).count() == 5
+    google_rows = [row for row in rows if row["campaign_id"] == str(google.id)]
+    assert len(google_rows) == 3
+    assert {row["campaign_name"] for row in google_rows} == {google.name}
+    assert {row["platform"] for row in google_rows} == {"google"}
+    assert {row["platform"] for row in rows if row not in google_rows} == {"meta"}
+
+
+def test_ndjson_and_csv_chunks_round_trip():
+    items = [{"a": n, "b": f"x,{n}"} for n in range(5)]
+
+    ndjson = "".join(stream_ndjson(iter(items), chunk_size=2))
+    table = "".join(stream_csv(iter(items), ["a", "b"], chunk_size=2))
+
+    assert [json.loads(line) for line in ndjson.splitlines()] == items
+    assert list(csv.DictReader(io.StringIO(table))) == [{"a": str(i["a"]), "b": i["b"]} for i in items]
+
+
+def test_gzip_stream_decompresses_to_input():
+    chunks = ["header\n"] + [f"row {n}\n" for n in range(100)]
+
+    assert gzip.decompress(b"".join(gzip_stream(iter(chunks)))).decode() == "".join(chunks)
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_export_streams_filtered_csv(client, make_campaign, compress):
+    make_campaign(days=3)
+    make_campaign(Platform.META, CampaignType.SHOPPING, days=2)
+
+    response = client.get("/api/metrics/export", params={"format": "csv", "platform": "meta", "gzip": compress})
+
+    assert response.status_code == 200
+    assert response.headers["content-disposition"] == 'attachment; filename="metrics.csv"'
+    # The test client decodes Content-Encoding: gzip transparently
+    assert (response.headers.get("content-encoding") == "gzip") is compress
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert len(rows) == 2
+    assert {row["platform"] for row in rows} == {"meta"}
+
+
+def test_export_ndjson_honours_date_range(client, make_campaign):
+    make_campaign(days=5)
+    everything = client.get("/api/metrics/export", params={"format": "ndjson"}).text.splitlines()
+    days = sorted(json.loads(line)["date"] for line in everything)
+
+    response = client.get("/api/metrics/export", params={"format": "ndjson", "start_date": days[1], "end_date": days[3]})
+
+    assert sorted(json.loads(line)["date"] for line in response.text.splitlines()) == days[1:4]
+
+
+@pytest.mark.parametrize("params", [
+    {"format": "xml"},
+    {"start_date": "2026-03-02", "end_date": "2026-03-01"},
+])
+def test_export_rejects_bad_parameters(client, params):
+    assert client.get("/api/metrics/export", params=params).status_code == 400
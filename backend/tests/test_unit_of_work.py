@@ -0,0 +1,32 @@
+"""Tests for UnitOfWork."""
+import pytest
+from models.campaign import Campaign, Platform, CampaignType
+from repositories import UnitOfWork
+from repositories.data_version_repository import DataVersionRepository
+
+
+def create_campaign(uow: UnitOfWork, name: str) -> Campaign:
+    return uow.campaigns.create(
+        name=name,
+        platform=Platform.GOOGLE,
+        campaign_type=CampaignType.PMAX,
+        objective="Sales",
+        daily_budget=100,
+        product_categories=["shoes"],
+    )
+
+
+def test_failed_commit_rolls_back_and_leaves_session_usable(db, monkeypatch):
+    def failing_bump(self):
+        raise RuntimeError("version bump failed")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(DataVersionRepository, "bump", failing_bump)
+        with pytest.raises(RuntimeError):
+            with UnitOfWork(db) as uow:
+                create_campaign(uow, "lost")
+
+    with UnitOfWork(db) as uow:
+        create_campaign(uow, "kept")
+
+    assert [c.name for c in db.query(Campaign).all()] == ["kept"]
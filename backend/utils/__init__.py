@@ -1,6 +1,20 @@
 """Utility functions module."""
 from .errors import CampaignNotFoundError, PlatformServiceError, PlanGenerationError
-from .retry import retry_with_backoff, retry_on_http_error
+from .retry import (
+    retry_with_backoff,
+    retry_on_http_error,
+    RetryPolicy,
+    RetryBudget,
+    default_retry_budget,
+    retry_stats,
+)
+from .pagination import encode_cursor, decode_cursor, NEXT_CURSOR_HEADER
+from .streaming import stream_json_array, stream_ndjson, stream_csv, gzip_stream
+from .cache import TTLCache, dashboard_cache
+from .singleflight import AsyncSingleFlight, dashboard_flights
+from .circuit_breaker import CircuitBreaker, CircuitBreakerRegistry, platform_breakers
+from .rate_limiter import TokenBucket, PlatformRateLimiters, platform_rate_limiters
+from .http_client import PlatformHttpClient, platform_http
 
 __all__ = [
     "CampaignNotFoundError",
@@ -8,4 +22,27 @@ __all__ = [
     "PlanGenerationError",
     "retry_with_backoff",
     "retry_on_http_error",
+    "RetryPolicy",
+    "RetryBudget",
+    "default_retry_budget",
+    "retry_stats",
+    "encode_cursor",
+    "decode_cursor",
+    "NEXT_CURSOR_HEADER",
+    "stream_json_array",
+    "stream_ndjson",
+    "stream_csv",
+    "gzip_stream",
+    "TTLCache",
+    "dashboard_cache",
+    "AsyncSingleFlight",
+    "dashboard_flights",
+    "CircuitBreaker",
+    "CircuitBreakerRegistry",
+    "platform_breakers",
+    "TokenBucket",
+    "PlatformRateLimiters",
+    "platform_rate_limiters",
+    "PlatformHttpClient",
+    "platform_http",
 ]
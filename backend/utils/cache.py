@@ -0,0 +1,129 @@
+"""Bounded in-process TTL cache for dashboard reads."""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+from config import settings
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire after a fixed TTL.
+
+    ``invalidate`` drops every entry and bumps a generation counter;
+    ``get_or_compute`` only stores a value if no invalidation happened while
+    it was being computed, so a write that commits mid-computation can never
+    leave a stale entry behind. A TTL of 0 disables caching.
+
+    Entries can also carry the data version they were computed at; a
+    lookup with a different version is a miss and drops the entry, so a
+    cached value always describes the snapshot its caller validated, even
+    when another worker wrote since it was stored.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        """Initialize an empty cache holding at most ``maxsize`` entries."""
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Tuple[float, Optional[int], Any]]" = OrderedDict()
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether entries are stored at all."""
+        return self.ttl > 0 and self.maxsize > 0
+
+    @property
+    def generation(self) -> int:
+        """Number of invalidations so far; compare before storing a value."""
+        return self._generation
+
+    def get(self, key: Hashable, version: Optional[int] = None) -> Tuple[bool, Any]:
+        """
+        Return (found, value) for ``key``, counting a hit or a miss.
+        An entry stored at a different data ``version`` is dropped.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, entry_version, value = entry
+                if expires_at > time.monotonic() and entry_version == version:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return True, value
+                del self._entries[key]
+            self.misses += 1
+            return False, None
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        generation: Optional[int] = None,
+        version: Optional[int] = None,
+    ) -> None:
+        """
+        Store ``value`` under ``key`` at data ``version``, evicting the least
+        recently used entry when full. Ignored if ``generation`` is given and
+        the cache has been invalidated since it was read.
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._entries[key] = (time.monotonic() + self.ttl, version, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any], version: Optional[int] = None) -> Any:
+        """
+        Return the cached value for ``key`` at data ``version``, computing
+        and storing it on a miss.
+        """
+        if not self.enabled:
+            return compute()
+        found, value = self.get(key, version)
+        if found:
+            return value
+        generation = self._generation
+        value = compute()
+        self.set(key, value, generation, version)
+        return value
+
+    def invalidate(self) -> None:
+        """Drop all entries, e.g. after a committed write."""
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+            self.invalidations += 1
+
+    def stats(self) -> dict:
+        """Counters for sizing the cache."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+# Process-wide cache for dashboard aggregates, invalidated by repository writes
+# and keyed to the data version so it never outlives a write in another worker
+dashboard_cache = TTLCache(
+    maxsize=settings.DASHBOARD_CACHE_MAX_ENTRIES,
+    ttl=settings.DASHBOARD_CACHE_TTL_SECONDS,
+)
@@ -0,0 +1,204 @@
+"""Circuit breakers for failing fast on unhealthy dependencies."""
+import threading
+import time
+from typing import Callable, Dict, Optional
+from config import settings
+from utils.errors import CircuitOpenError
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Breaker states
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Closed / open / half-open circuit breaker for one dependency.
+
+    Closed, calls go through and consecutive failures are counted; at
+    ``failure_threshold`` the breaker opens and ``before_call`` raises
+    ``CircuitOpenError`` for ``recovery_timeout`` seconds. It then turns
+    half-open and lets ``half_open_max_calls`` trial calls through: a
+    success closes it, a failure opens it again.
+
+    Callers wrap each call in ``before_call`` and ``record_success`` /
+    ``record_failure``, so a call abandoned on timeout can be counted as a
+    failure without waiting for it to finish. ``before_call`` returns the
+    breaker's generation, which changes on every state change; passing it
+    back means the outcome of a slow call admitted in an earlier state is
+    ignored, so it cannot close an open breaker or reopen a recovered one.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int,
+        recovery_timeout: float,
+        half_open_max_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize a closed breaker."""
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_calls = 0
+        self._generation = 0
+        self.rejected = 0
+        self.times_opened = 0
+
+    @property
+    def state(self) -> str:
+        """Current state, turning open into half-open once the cool-down has passed."""
+        with self._lock:
+            return self._current_state()
+
+    def before_call(self) -> int:
+        """
+        Admit a call or fail fast.
+
+        Returns:
+            The generation to pass to ``record_success`` / ``record_failure``
+
+        Raises:
+            CircuitOpenError: If the breaker is open, or half-open with its
+                trial calls already in flight
+        """
+        with self._lock:
+            state = self._current_state()
+            if state == CLOSED:
+                return self._generation
+            if state == HALF_OPEN and self._trial_calls < self.half_open_max_calls:
+                self._trial_calls += 1
+                return self._generation
+            self.rejected += 1
+            retry_in = max(self._opened_at + self.recovery_timeout - self._clock(), 0)
+        raise CircuitOpenError(self.name, retry_in)
+
+    def record_success(self, generation: Optional[int] = None) -> None:
+        """
+        Record a successful call; closes a half-open breaker. Ignored for a
+        call admitted in an earlier ``generation``, and never closes an
+        open breaker.
+        """
+        with self._lock:
+            state = self._current_state()
+            if (generation is not None and generation != self._generation) or state == OPEN:
+                return
+            if state == HALF_OPEN:
+                logger.info(f"Circuit {self.name} closed after a successful trial call")
+                self._transition(CLOSED)
+            self._failures = 0
+
+    def record_failure(self, generation: Optional[int] = None) -> None:
+        """
+        Record a failed call; opens the breaker at the threshold or after a
+        failed trial. Ignored for a call admitted in an earlier ``generation``.
+        """
+        with self._lock:
+            state = self._current_state()
+            if (generation is not None and generation != self._generation) or state == OPEN:
+                return
+            self._failures += 1
+            if state == HALF_OPEN or self._failures >= self.failure_threshold:
+                self.times_opened += 1
+                logger.warning(
+                    f"Circuit {self.name} opened after {self._failures} consecutive failure(s); "
+                    f"failing fast for {self.recovery_timeout:g}s"
+                )
+                self._transition(OPEN)
+                self._opened_at = self._clock()
+
+    def reset(self) -> None:
+        """Force the breaker closed."""
+        with self._lock:
+            self._transition(CLOSED)
+            self._failures = 0
+
+    def snapshot(self) -> dict:
+        """State and counters for observation."""
+        with self._lock:
+            state = self._current_state()
+            return {
+                "state": state,
+                "consecutive_failures": self._failures,
+                "failure_threshold": self.failure_threshold,
+                "recovery_timeout_seconds": self.recovery_timeout,
+                "retry_in_seconds": (
+                    round(max(self._opened_at + self.recovery_timeout - self._clock(), 0), 3)
+                    if state == OPEN else 0.0
+                ),
+                "times_opened": self.times_opened,
+                "rejected": self.rejected,
+            }
+
+    def _current_state(self) -> str:
+        if self._state == OPEN and self._clock() - self._opened_at >= self.recovery_timeout:
+            self._transition(HALF_OPEN)
+        return self._state
+
+    def _transition(self, state: str) -> None:
+        """Enter ``state``, starting a new generation."""
+        self._state = state
+        self._trial_calls = 0
+        self._generation += 1
+
+
+class CircuitBreakerRegistry:
+    """Breakers by name, created on first use with shared settings."""
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        recovery_timeout: float,
+        half_open_max_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize an empty registry."""
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def get(self, name: str) -> CircuitBreaker:
+        """Get the breaker for ``name``, creating it closed on first use."""
+        with self._lock:
+            breaker = self._breakers.get(name)
+            if breaker is None:
+                breaker = self._breakers[name] = CircuitBreaker(
+                    name,
+                    failure_threshold=self.failure_threshold,
+                    recovery_timeout=self.recovery_timeout,
+                    half_open_max_calls=self.half_open_max_calls,
+                    clock=self.clock,
+                )
+            return breaker
+
+    def find(self, name: str) -> Optional[CircuitBreaker]:
+        """Get the breaker for ``name`` if it exists."""
+        with self._lock:
+            return self._breakers.get(name)
+
+    def stats(self) -> dict:
+        """Snapshot of every breaker."""
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return {breaker.name: breaker.snapshot() for breaker in breakers}
+
+
+# Process-wide breakers for the ad platforms, one per platform name
+platform_breakers = CircuitBreakerRegistry(
+    failure_threshold=settings.CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    recovery_timeout=settings.CIRCUIT_BREAKER_RECOVERY_SECONDS,
+    half_open_max_calls=settings.CIRCUIT_BREAKER_HALF_OPEN_CALLS,
+)
@@ -22,3 +22,33 @@ class PlanGenerationError(Exception):
     def __init__(self, message: str):
         self.message = message
         super().__init__(f"Plan generation error: {message}")
+
+
+class IdempotencyConflictError(Exception):
+    """Raised when a request with the same idempotency key is still in progress."""
+    def __init__(self, idempotency_key: str):
+        self.idempotency_key = idempotency_key
+        super().__init__(f"A request with idempotency key {idempotency_key} is already in progress")
+
+
+class IdempotencyKeyReuseError(Exception):
+    """Raised when an idempotency key is reused with a different request."""
+    def __init__(self, idempotency_key: str):
+        self.idempotency_key = idempotency_key
+        super().__init__(f"Idempotency key {idempotency_key} was already used for a different request")
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a dependency whose circuit breaker is open."""
+    def __init__(self, name: str, retry_in: float):
+        self.name = name
+        self.retry_in = retry_in
+        super().__init__(f"{name} circuit is open after repeated failures; next attempt in {retry_in:.1f}s")
+
+
+class RateLimitTimeoutError(Exception):
+    """Raised when a rate-limited call would have to wait longer than allowed."""
+    def __init__(self, name: str, wait: float):
+        self.name = name
+        self.wait = wait
+        super().__init__(f"{name} rate limit would delay this call by {wait:.2f}s")
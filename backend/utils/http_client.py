@@ -0,0 +1,195 @@
+"""Shared keep-alive HTTP clients for platform APIs."""
+import threading
+from collections import defaultdict
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+import httpx
+from config import settings
+from utils.rate_limiter import PlatformRateLimiters, platform_rate_limiters
+from utils.retry import RETRYABLE_STATUS_CODES, RetryPolicy, status_code_of
+from utils.logger import get_logger
+
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx
+    HTTP2_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    HTTP2_AVAILABLE = False
+
+logger = get_logger(__name__)
+
+# Methods safe to resend after the server may have acted on them
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Statuses that mean the request was not processed, so any method may be resent
+NOT_PROCESSED_STATUS_CODES = (429, 503)
+
+
+class PlatformHttpClient:
+    """
+    Pooled HTTP clients, one per host.
+
+    Each host gets its own ``httpx.Client`` and therefore its own connection
+    pool, so a slow platform cannot starve the others of connections.
+    Connections are kept alive for ``keepalive_expiry`` seconds and reused
+    by later calls; HTTP/2 is negotiated when ``h2`` is installed. Requests
+    are retried with ``RetryPolicy``: idempotent methods on transport errors
+    and retryable statuses, other methods only when the server cannot have
+    processed the request (connect failures, 429 and 503). Every attempt,
+    retries included, first waits for a slot from the platform account's
+    rate limiter, so calls run at the quota ceiling instead of bouncing
+    off it.
+
+    Clients are thread-safe and created on first use; ``close`` releases
+    every pool.
+    """
+
+    def __init__(
+        self,
+        timeout: httpx.Timeout,
+        max_connections: int,
+        max_keepalive_connections: int,
+        keepalive_expiry: float,
+        http2: bool = True,
+        max_retries: int = 2,
+        retry_deadline: Optional[float] = None,
+        rate_limiters: Optional[PlatformRateLimiters] = None,
+    ):
+        """Initialize without opening any connection."""
+        self.timeout = timeout
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = http2 and HTTP2_AVAILABLE
+        self.max_retries = max_retries
+        self.retry_deadline = retry_deadline
+        self.rate_limiters = rate_limiters
+        self._lock = threading.Lock()
+        self._clients: Dict[str, httpx.Client] = {}
+        self._policies: Dict[str, RetryPolicy] = {}
+        self._counters: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+
+    def client(self, url: str) -> httpx.Client:
+        """Get the pooled client for ``url``'s host, creating it on first use."""
+        host = _host_of(url)
+        with self._lock:
+            client = self._clients.get(host)
+            if client is None:
+                client = self._clients[host] = httpx.Client(
+                    timeout=self.timeout,
+                    limits=self.limits,
+                    http2=self.http2,
+                )
+            return client
+
+    def request(self, platform: str, method: str, url: str, **kwargs) -> httpx.Response:
+        """
+        Send a request through the host's pool, with retries.
+
+        Raises:
+            httpx.HTTPStatusError: If the final response is an error status
+            httpx.TransportError: If the host could not be reached
+            RateLimitTimeoutError: If the platform's rate limit would delay
+                the call too long
+        """
+        method = method.upper()
+        host = _host_of(url)
+        client = self.client(url)
+
+        def trace(event: str, info: dict) -> None:
+            if event == "connection.connect_tcp.complete":
+                self._incr(host, "connections_opened")
+
+        def send() -> httpx.Response:
+            if self.rate_limiters is not None:
+                self.rate_limiters.acquire(platform)
+            self._incr(host, "requests")
+            response = client.request(method, url, extensions={"trace": trace}, **kwargs)
+            self._incr(host, response.http_version)
+            response.raise_for_status()
+            return response
+
+        policy = self._policy(platform, method in IDEMPOTENT_METHODS)
+        try:
+            return policy.call(send)
+        except Exception:
+            self._incr(host, "errors")
+            raise
+
+    def stats(self) -> dict:
+        """Requests, connections opened and errors per host, with the pool settings."""
+        with self._lock:
+            hosts = {host: dict(counters) for host, counters in self._counters.items()}
+        return {
+            "http2": self.http2,
+            "max_connections_per_host": self.limits.max_connections,
+            "max_keepalive_per_host": self.limits.max_keepalive_connections,
+            "keepalive_expiry_seconds": self.limits.keepalive_expiry,
+            "hosts": hosts,
+        }
+
+    def close(self) -> None:
+        """Close every pooled connection; clients are recreated on next use."""
+        with self._lock:
+            clients, self._clients = list(self._clients.values()), {}
+        for client in clients:
+            client.close()
+
+    def _policy(self, platform: str, idempotent: bool) -> RetryPolicy:
+        """Retry policy per platform and method kind, so retry metrics are per platform."""
+        name = f"{platform}_api" if idempotent else f"{platform}_api_write"
+        with self._lock:
+            policy = self._policies.get(name)
+            if policy is None:
+                policy = self._policies[name] = RetryPolicy(
+                    max_retries=self.max_retries,
+                    initial_delay=0.5,
+                    max_delay=5.0,
+                    deadline=self.retry_deadline,
+                    retry_if=_retryable if idempotent else _not_processed,
+                    name=name,
+                )
+            return policy
+
+    def _incr(self, host: str, counter: str) -> None:
+        with self._lock:
+            self._counters[host][counter] += 1
+
+
+def _host_of(url: str) -> str:
+    """Scheme and authority of a URL, e.g. ``https://graph.facebook.com``."""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def _retryable(exc: BaseException) -> bool:
+    """Whether an idempotent request may be resent after ``exc``."""
+    if isinstance(exc, httpx.TransportError):
+        return True
+    return status_code_of(exc) in RETRYABLE_STATUS_CODES
+
+
+def _not_processed(exc: BaseException) -> bool:
+    """Whether ``exc`` shows the server did not act on the request."""
+    if isinstance(exc, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)):
+        return True
+    return status_code_of(exc) in NOT_PROCESSED_STATUS_CODES
+
+
+# Process-wide clients for the ad platform APIs; closed by the app lifespan
+platform_http = PlatformHttpClient(
+    timeout=httpx.Timeout(
+        connect=settings.HTTP_CONNECT_TIMEOUT_SECONDS,
+        read=settings.HTTP_READ_TIMEOUT_SECONDS,
+        write=settings.HTTP_WRITE_TIMEOUT_SECONDS,
+        pool=settings.HTTP_POOL_TIMEOUT_SECONDS,
+    ),
+    max_connections=settings.HTTP_MAX_CONNECTIONS_PER_HOST,
+    max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_PER_HOST,
+    keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY_SECONDS,
+    http2=settings.HTTP2_ENABLED,
+    max_retries=settings.HTTP_MAX_RETRIES,
+    retry_deadline=settings.PLATFORM_CALL_TIMEOUT_SECONDS,
+    rate_limiters=platform_rate_limiters,
+)
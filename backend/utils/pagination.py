@@ -0,0 +1,52 @@
+"""Opaque cursor helpers for keyset pagination."""
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, List, Tuple
+
+# Response header carrying the cursor for the next page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(*values: Any) -> str:
+    """
+    Encode the sort key of the last row of a page as an opaque cursor.
+    Dates and datetimes are stored as ISO strings.
+    """
+    payload = [v.isoformat() if isinstance(v, (date, datetime)) else v for v in values]
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, types: Tuple[type, ...]) -> List[Any]:
+    """
+    Decode a cursor produced by ``encode_cursor``.
+
+    Args:
+        cursor: Opaque cursor string
+        types: Expected type of each key component (int, str, date or datetime)
+
+    Raises:
+        ValueError: If the cursor is malformed or does not match ``types``
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+    if not isinstance(values, list) or len(values) != len(types):
+        raise ValueError("Invalid cursor")
+
+    decoded = []
+    for value, expected in zip(values, types):
+        try:
+            if expected is datetime:
+                decoded.append(datetime.fromisoformat(value))
+            elif expected is date:
+                decoded.append(date.fromisoformat(value))
+            else:
+                decoded.append(expected(value))
+        except (TypeError, ValueError) as e:
+            raise ValueError("Invalid cursor") from e
+    return decoded
@@ -0,0 +1,197 @@
+"""Client-side token-bucket rate limiting for platform API quotas."""
+import asyncio
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+from config import settings
+from utils.errors import RateLimitTimeoutError
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class TokenBucket:
+    """
+    Token bucket allowing ``rate`` calls per second with bursts of ``burst``.
+
+    Waiters queue in arrival order: each caller reserves the next token
+    under the lock, letting the balance go negative, and then sleeps until
+    its token is due. Later callers are scheduled behind earlier ones, so
+    nobody is starved and calls go out at exactly the quota ceiling. A
+    caller whose token is further away than ``timeout`` gets
+    ``RateLimitTimeoutError`` straight away instead of queueing.
+
+    ``acquire`` sleeps the calling thread; ``aacquire`` sleeps with
+    ``asyncio.sleep``. Both draw from the same bucket.
+    """
+
+    def __init__(self, name: str, rate: float, burst: float, clock: Callable[[], float] = time.monotonic):
+        """Initialize a full bucket."""
+        self.name = name
+        self.rate = rate
+        self.burst = max(burst, 1.0)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tokens = self.burst
+        self._updated = clock()
+        self._waiting = 0
+        self.acquired = 0
+        self.delayed = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def acquire(self, timeout: Optional[float] = None) -> float:
+        """
+        Take a token, blocking until it is due.
+
+        Returns:
+            Seconds waited
+
+        Raises:
+            RateLimitTimeoutError: If the token is due in more than ``timeout`` seconds
+        """
+        wait = self._reserve(timeout)
+        if wait > 0:
+            try:
+                time.sleep(wait)
+            finally:
+                self._done_waiting()
+        return wait
+
+    async def aacquire(self, timeout: Optional[float] = None) -> float:
+        """Take a token without blocking the event loop; see ``acquire``."""
+        wait = self._reserve(timeout)
+        if wait > 0:
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                self._refund()
+                raise
+            finally:
+                self._done_waiting()
+        return wait
+
+    def stats(self) -> dict:
+        """Queue depth, wait times and counters for observation."""
+        with self._lock:
+            self._refill()
+            return {
+                "rate_per_second": self.rate,
+                "burst": self.burst,
+                "tokens_available": round(max(self._tokens, 0.0), 3),
+                "queue_depth": self._waiting,
+                "acquired": self.acquired,
+                "delayed": self.delayed,
+                "timeouts": self.timeouts,
+                "avg_wait_ms": round(self.total_wait / self.acquired * 1000, 3) if self.acquired else 0.0,
+                "max_wait_ms": round(self.max_wait * 1000, 3),
+            }
+
+    def _reserve(self, timeout: Optional[float]) -> float:
+        """Reserve the next token and return how long until it is due."""
+        with self._lock:
+            self._refill()
+            wait = max(1.0 - self._tokens, 0.0) / self.rate
+            if timeout is not None and wait > timeout:
+                self.timeouts += 1
+                raise RateLimitTimeoutError(self.name, wait)
+            self._tokens -= 1.0
+            self.acquired += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+            if wait > 0:
+                self.delayed += 1
+                self._waiting += 1
+            return wait
+
+    def _refund(self) -> None:
+        """Give back a reserved token whose caller gave up waiting."""
+        with self._lock:
+            self._tokens += 1.0
+            self.acquired -= 1
+
+    def _done_waiting(self) -> None:
+        with self._lock:
+            self._waiting -= 1
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self._tokens + (now - self._updated) * self.rate, self.burst)
+        self._updated = now
+
+
+class PlatformRateLimiters:
+    """
+    Token buckets keyed by platform and account, created on first use.
+
+    Each platform's quota applies per account, so every account gets its
+    own bucket; the account defaults to the one configured in ``Settings``.
+    A platform with a rate of 0 is not limited.
+    """
+
+    def __init__(
+        self,
+        rates: Dict[str, float],
+        accounts: Dict[str, Callable[[], str]],
+        burst_seconds: float,
+        max_wait: Optional[float],
+    ):
+        """Initialize with per-platform rates and default account lookups."""
+        self.rates = rates
+        self.accounts = accounts
+        self.burst_seconds = burst_seconds
+        self.max_wait = max_wait
+        self._lock = threading.Lock()
+        self._buckets: Dict[Tuple[str, str], TokenBucket] = {}
+
+    def get(self, platform: str, account: Optional[str] = None) -> Optional[TokenBucket]:
+        """Get the bucket for a platform account, or None if the platform is not limited."""
+        rate = self.rates.get(platform, 0)
+        if rate <= 0:
+            return None
+        if account is None:
+            account = self.accounts[platform]() if platform in self.accounts else ""
+        key = (platform, account)
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = TokenBucket(
+                    f"{platform}:{account}" if account else platform,
+                    rate=rate,
+                    burst=rate * self.burst_seconds,
+                )
+            return bucket
+
+    def acquire(self, platform: str, account: Optional[str] = None) -> float:
+        """Wait for a call slot on a platform account; returns seconds waited."""
+        bucket = self.get(platform, account)
+        return bucket.acquire(self.max_wait) if bucket is not None else 0.0
+
+    async def aacquire(self, platform: str, account: Optional[str] = None) -> float:
+        """Wait for a call slot without blocking the event loop; returns seconds waited."""
+        bucket = self.get(platform, account)
+        return await bucket.aacquire(self.max_wait) if bucket is not None else 0.0
+
+    def stats(self) -> dict:
+        """Snapshot of every bucket, by platform account."""
+        with self._lock:
+            buckets = list(self._buckets.values())
+        return {bucket.name: bucket.stats() for bucket in buckets}
+
+
+# Process-wide limiters for the ad platform APIs, sized to their per-account quotas
+platform_rate_limiters = PlatformRateLimiters(
+    rates={
+        "google": settings.GOOGLE_ADS_RATE_LIMIT_QPS,
+        "meta": settings.META_RATE_LIMIT_QPS,
+        "amazon": settings.AMAZON_ADS_RATE_LIMIT_QPS,
+    },
+    accounts={
+        "google": lambda: settings.GOOGLE_ADS_CUSTOMER_ID,
+        "meta": lambda: settings.META_AD_ACCOUNT_ID,
+        "amazon": lambda: settings.AMAZON_CLIENT_ID,
+    },
+    burst_seconds=settings.RATE_LIMIT_BURST_SECONDS,
+    max_wait=settings.RATE_LIMIT_MAX_WAIT_SECONDS,
+)
@@ -1,56 +1,347 @@
-"""Retry utility with exponential backoff."""
+"""Retry engine with decorrelated jitter, Retry-After, deadlines and retry budgets."""
+import asyncio
+import inspect
+import random
+import threading
 import time
-from typing import Callable, TypeVar, Optional
+from collections import deque
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from functools import wraps
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+from config import settings
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 T = TypeVar('T')
 
+# HTTP status codes worth retrying: rate limiting and transient server errors
+RETRYABLE_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+class RetryBudget:
+    """
+    Cap on retries as a fraction of requests over a sliding window.
+
+    Retries are allowed while they stay under ``ratio`` of the calls made
+    in the last ``window`` seconds, plus ``min_retries`` so that low traffic
+    can still retry. Shared by many callers, this keeps a platform outage
+    from multiplying load with a retry storm.
+    """
+
+    def __init__(self, ratio: float, min_retries: int, window: float, clock: Callable[[], float] = time.monotonic):
+        """Initialize an empty budget."""
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window = window
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._requests: deque = deque()
+        self._retries: deque = deque()
+
+    def record_request(self) -> None:
+        """Record a first attempt."""
+        with self._lock:
+            now = self._clock()
+            self._requests.append(now)
+            self._expire(now)
+
+    def try_spend(self) -> bool:
+        """Record a retry if the budget allows one; return whether it did."""
+        with self._lock:
+            now = self._clock()
+            self._expire(now)
+            if len(self._retries) >= self.min_retries + self.ratio * len(self._requests):
+                return False
+            self._retries.append(now)
+            return True
+
+    def stats(self) -> dict:
+        """Calls and retries in the current window."""
+        with self._lock:
+            self._expire(self._clock())
+            return {"requests": len(self._requests), "retries": len(self._retries)}
+
+    def _expire(self, now: float) -> None:
+        cutoff = now - self.window
+        for timestamps in (self._requests, self._retries):
+            while timestamps and timestamps[0] < cutoff:
+                timestamps.popleft()
+
+
+class RetryMetrics:
+    """Counters for one named retry policy."""
+
+    def __init__(self):
+        """Initialize all counters at zero."""
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.retries = 0
+        self.successes = 0
+        self.failures = 0
+        self.budget_exhausted = 0
+        self.deadline_exceeded = 0
+        self.backoff_seconds = 0.0
+
+    def incr(self, name: str, amount: float = 1) -> None:
+        """Add ``amount`` to a counter."""
+        with self._lock:
+            setattr(self, name, getattr(self, name) + amount)
+
+    def snapshot(self) -> dict:
+        """Current counter values."""
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "retries": self.retries,
+                "successes": self.successes,
+                "failures": self.failures,
+                "budget_exhausted": self.budget_exhausted,
+                "deadline_exceeded": self.deadline_exceeded,
+                "backoff_seconds": round(self.backoff_seconds, 3),
+            }
+
+
+_metrics: Dict[str, RetryMetrics] = {}
+_metrics_lock = threading.Lock()
+
+
+def retry_metrics(name: str) -> RetryMetrics:
+    """Get the metrics for a policy name, creating them on first use."""
+    with _metrics_lock:
+        if name not in _metrics:
+            _metrics[name] = RetryMetrics()
+        return _metrics[name]
+
+
+def retry_stats() -> dict:
+    """Metrics of every named retry policy, plus the shared budget's window."""
+    with _metrics_lock:
+        policies = {name: metrics.snapshot() for name, metrics in _metrics.items()}
+    return {"policies": policies, "budget": default_retry_budget.stats()}
+
+
+def status_code_of(exc: BaseException) -> Optional[int]:
+    """HTTP status code carried by an exception, if any."""
+    status_code = getattr(exc, "status_code", None)
+    if status_code is None:
+        status_code = getattr(getattr(exc, "response", None), "status_code", None)
+    return status_code
+
+
+def retry_after_of(exc: BaseException) -> Optional[float]:
+    """
+    Seconds the server asked us to wait, from a ``retry_after`` attribute or
+    a ``Retry-After`` response header (delta-seconds or HTTP-date).
+    """
+    value = getattr(exc, "retry_after", None)
+    if value is None:
+        headers = getattr(getattr(exc, "response", None), "headers", None) or {}
+        value = headers.get("Retry-After") if hasattr(headers, "get") else None
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except (TypeError, ValueError):
+        pass
+    try:
+        when = parsedate_to_datetime(str(value))
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max((when - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class RetryPolicy:
+    """
+    Retry a sync or async callable with decorrelated jitter.
+
+    Each delay is drawn uniformly between ``initial_delay`` and
+    ``backoff_factor`` times the previous delay, capped at ``max_delay``,
+    so concurrent callers spread out instead of retrying in lockstep. A
+    server's Retry-After is honoured as a lower bound. Retrying stops when
+    ``max_retries`` is reached, when the next attempt would start after
+    ``deadline`` seconds from the first, or when the shared budget is spent;
+    the last error is then raised. Async callables sleep with
+    ``asyncio.sleep`` and never block the event loop; their attempts are
+    also cut off at the deadline.
+
+    Use as a decorator, or via ``call`` / ``acall``.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        initial_delay: float = 1.0,
+        backoff_factor: float = 3.0,
+        max_delay: float = 30.0,
+        deadline: Optional[float] = None,
+        retry_if: Callable[[BaseException], bool] = lambda e: True,
+        budget: Optional[RetryBudget] = None,
+        name: str = "default",
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        rng: Optional[random.Random] = None,
+    ):
+        """
+        Initialize the policy; ``budget`` defaults to the process-wide budget.
+        ``clock``, ``sleep`` and ``rng`` can be replaced to test timing.
+        """
+        self.max_retries = max_retries
+        self.initial_delay = initial_delay
+        self.backoff_factor = backoff_factor
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self.retry_if = retry_if
+        self.budget = budget if budget is not None else default_retry_budget
+        self.name = name
+        self.metrics = retry_metrics(name)
+        self._clock = clock
+        self._sleep = sleep
+        self._rng = rng if rng is not None else random.Random()
+
+    def __call__(self, func: Callable[..., T]) -> Callable[..., T]:
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                return await self.acall(func, *args, **kwargs)
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs) -> T:
+            return self.call(func, *args, **kwargs)
+        return wrapper
+
+    def call(self, func: Callable[..., T], *args, **kwargs) -> T:
+        """Call ``func`` with retries, sleeping between attempts."""
+        started = self._start()
+        delay = 0.0
+        attempt = 0
+        while True:
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                delay = self._next_delay(e, attempt, started, delay, func)
+                if delay is None:
+                    raise
+                self._sleep(delay)
+                attempt += 1
+            else:
+                self.metrics.incr("successes")
+                return result
+
+    async def acall(self, func: Callable[..., Awaitable[T]], *args, **kwargs) -> T:
+        """Await ``func`` with retries, without blocking the event loop between attempts."""
+        started = self._start()
+        delay = 0.0
+        attempt = 0
+        while True:
+            try:
+                if self.deadline is None:
+                    result = await func(*args, **kwargs)
+                else:
+                    remaining = self.deadline - (self._clock() - started)
+                    result = await asyncio.wait_for(func(*args, **kwargs), max(remaining, 0))
+            except Exception as e:
+                delay = self._next_delay(e, attempt, started, delay, func)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                attempt += 1
+            else:
+                self.metrics.incr("successes")
+                return result
+
+    def _start(self) -> float:
+        self.metrics.incr("calls")
+        self.budget.record_request()
+        return self._clock()
+
+    def _next_delay(
+        self,
+        error: Exception,
+        attempt: int,
+        started: float,
+        previous_delay: float,
+        func: Callable[..., Any],
+    ) -> Optional[float]:
+        """Delay before the next attempt, or None to give up and raise ``error``."""
+        func_name = getattr(func, "__name__", repr(func))
+        total = self.max_retries + 1
+
+        if not self.retry_if(error) or attempt >= self.max_retries:
+            self.metrics.incr("failures")
+            if self.retry_if(error):
+                logger.error(f"All {total} attempts failed for {func_name}: {error}")
+            return None
+
+        upper = max(previous_delay * self.backoff_factor, self.initial_delay)
+        delay = min(self._rng.uniform(self.initial_delay, upper), self.max_delay)
+        retry_after = retry_after_of(error)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+
+        if self.deadline is not None and self._clock() - started + delay > self.deadline:
+            self.metrics.incr("deadline_exceeded")
+            self.metrics.incr("failures")
+            logger.error(
+                f"Giving up on {func_name} after {attempt + 1} attempt(s): "
+                f"retrying in {delay:.2f}s would pass its {self.deadline:g}s deadline. Last error: {error}"
+            )
+            return None
+
+        if not self.budget.try_spend():
+            self.metrics.incr("budget_exhausted")
+            self.metrics.incr("failures")
+            logger.error(f"Giving up on {func_name} after {attempt + 1} attempt(s): retry budget exhausted. Last error: {error}")
+            return None
+
+        self.metrics.incr("retries")
+        self.metrics.incr("backoff_seconds", delay)
+        logger.warning(
+            f"Attempt {attempt + 1}/{total} failed for {func_name}: {error}. "
+            f"Retrying in {delay:.2f} seconds..."
+        )
+        return delay
+
 
 def retry_with_backoff(
     max_retries: int = 3,
     initial_delay: float = 1.0,
     backoff_factor: float = 2.0,
     exceptions: tuple = (Exception,),
+    max_delay: float = 30.0,
+    deadline: Optional[float] = None,
+    budget: Optional[RetryBudget] = None,
+    name: Optional[str] = None,
 ):
     """
-    Decorator for retrying functions with exponential backoff.
-    
+    Decorator for retrying sync or async functions with jittered backoff.
+
     Args:
         max_retries: Maximum number of retry attempts
-        initial_delay: Initial delay in seconds
-        backoff_factor: Multiplier for delay after each retry
+        initial_delay: Smallest delay in seconds
+        backoff_factor: Growth of the delay's upper bound after each retry
         exceptions: Tuple of exceptions to catch and retry on
+        max_delay: Largest delay in seconds
+        deadline: Seconds after the first attempt past which no retry starts
+        budget: Retry budget to draw from (default: the process-wide budget)
+        name: Metrics name (default: the function's qualified name)
     """
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
-        @wraps(func)
-        def wrapper(*args, **kwargs) -> T:
-            delay = initial_delay
-            last_exception = None
-            
-            for attempt in range(max_retries + 1):
-                try:
-                    return func(*args, **kwargs)
-                except exceptions as e:
-                    last_exception = e
-                    if attempt < max_retries:
-                        logger.warning(
-                            f"Attempt {attempt + 1}/{max_retries + 1} failed for {func.__name__}: {e}. "
-                            f"Retrying in {delay:.2f} seconds..."
-                        )
-                        time.sleep(delay)
-                        delay *= backoff_factor
-                    else:
-                        logger.error(
-                            f"All {max_retries + 1} attempts failed for {func.__name__}: {e}"
-                        )
-            
-            # If we get here, all retries failed
-            raise last_exception
-        
-        return wrapper
+        policy = RetryPolicy(
+            max_retries=max_retries,
+            initial_delay=initial_delay,
+            backoff_factor=backoff_factor,
+            max_delay=max_delay,
+            deadline=deadline,
+            retry_if=lambda e: isinstance(e, exceptions),
+            budget=budget,
+            name=name or func.__qualname__,
+        )
+        return policy(func)
     return decorator
 
 
@@ -58,44 +349,46 @@ def retry_on_http_error(
     max_retries: int = 3,
     initial_delay: float = 1.0,
     backoff_factor: float = 2.0,
-    status_codes: tuple = (429, 500, 502, 503, 504),
+    status_codes: tuple = RETRYABLE_STATUS_CODES,
+    max_delay: float = 30.0,
+    deadline: Optional[float] = None,
+    budget: Optional[RetryBudget] = None,
+    name: Optional[str] = None,
 ):
     """
-    Decorator for retrying HTTP requests on specific status codes.
-    
+    Decorator for retrying sync or async HTTP requests on specific status codes.
+
+    The status code is read from the exception's ``status_code`` or
+    ``response.status_code``; a Retry-After header is honoured.
+
     Args:
         max_retries: Maximum number of retry attempts
-        initial_delay: Initial delay in seconds
-        backoff_factor: Multiplier for delay after each retry
+        initial_delay: Smallest delay in seconds
+        backoff_factor: Growth of the delay's upper bound after each retry
         status_codes: Tuple of HTTP status codes to retry on
+        max_delay: Largest delay in seconds
+        deadline: Seconds after the first attempt past which no retry starts
+        budget: Retry budget to draw from (default: the process-wide budget)
+        name: Metrics name (default: the function's qualified name)
     """
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
-        @wraps(func)
-        def wrapper(*args, **kwargs) -> T:
-            delay = initial_delay
-            last_exception = None
-            
-            for attempt in range(max_retries + 1):
-                try:
-                    return func(*args, **kwargs)
-                except Exception as e:
-                    # Check if it's an HTTP error with retryable status code
-                    status_code = getattr(e, 'status_code', None)
-                    if status_code in status_codes:
-                        if attempt < max_retries:
-                            logger.warning(
-                                f"HTTP {status_code} error on attempt {attempt + 1}/{max_retries + 1} "
-                                f"for {func.__name__}. Retrying in {delay:.2f} seconds..."
-                            )
-                            time.sleep(delay)
-                            delay *= backoff_factor
-                            continue
-                    
-                    # If not retryable or max retries reached, raise
-                    raise
-            
-            # If we get here, all retries failed
-            raise last_exception
-        
-        return wrapper
+        policy = RetryPolicy(
+            max_retries=max_retries,
+            initial_delay=initial_delay,
+            backoff_factor=backoff_factor,
+            max_delay=max_delay,
+            deadline=deadline,
+            retry_if=lambda e: status_code_of(e) in status_codes,
+            budget=budget,
+            name=name or func.__qualname__,
+        )
+        return policy(func)
     return decorator
+
+
+# Process-wide retry budget shared by all policies unless given their own
+default_retry_budget = RetryBudget(
+    ratio=settings.RETRY_BUDGET_RATIO,
+    min_retries=settings.RETRY_BUDGET_MIN_RETRIES,
+    window=settings.RETRY_BUDGET_WINDOW_SECONDS,
+)
@@ -0,0 +1,82 @@
+"""Single-flight coalescing of concurrent identical computations."""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+
+class AsyncSingleFlight:
+    """
+    Run at most one coroutine per key at a time.
+
+    The first caller for a key (the leader) awaits the function; callers
+    that arrive while it is running (followers) await and share its result
+    or its exception. Each follower waits at most its own ``timeout``; the
+    leader's work is shielded from it. Nothing is remembered once the call
+    completes - combine with a cache to reuse results.
+    """
+
+    def __init__(self):
+        """Initialize with no calls in flight."""
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+        self.leaders = 0
+        self.followers = 0
+        self.timeouts = 0
+        self.errors = 0
+
+    async def do(
+        self,
+        key: Hashable,
+        fn: Callable[[], Awaitable[Any]],
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """
+        Return ``await fn()``, sharing one execution among concurrent callers of ``key``.
+
+        Raises:
+            TimeoutError: If this caller is a follower and the leader has not
+                finished within ``timeout`` seconds
+        """
+        future = self._calls.get(key)
+        if future is not None:
+            self.followers += 1
+            try:
+                return await asyncio.wait_for(asyncio.shield(future), timeout)
+            except asyncio.TimeoutError:
+                self.timeouts += 1
+                raise TimeoutError("Timed out waiting for an identical in-flight request")
+
+        future = self._calls[key] = asyncio.get_running_loop().create_future()
+        self.leaders += 1
+        try:
+            value = await fn()
+        except asyncio.CancelledError:
+            future.set_exception(RuntimeError("Identical in-flight request was cancelled"))
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            self.errors += 1
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            del self._calls[key]
+            # Followers may all have timed out; don't warn about an unread error
+            if future.done() and not future.cancelled():
+                future.exception()
+
+    def stats(self) -> dict:
+        """Counters for observing how much work is being coalesced."""
+        return {
+            "in_flight": len(self._calls),
+            "leaders": self.leaders,
+            "followers": self.followers,
+            "timeouts": self.timeouts,
+            "errors": self.errors,
+        }
+
+
+# Process-wide coalescing of identical dashboard queries in request handlers
+dashboard_flights = AsyncSingleFlight()
+
+# Process-wide coalescing of duplicate plan executions
+execution_flights = AsyncSingleFlight()
@@ -0,0 +1,104 @@
+"""Helpers for streaming large JSON, NDJSON and CSV responses."""
+import csv
+import io
+import json
+import zlib
+from typing import Iterable, Iterator, List
+
+
+def stream_json_array(items: Iterable[dict], chunk_size: int = 500) -> Iterator[str]:
+    """
+    Serialize an iterable of dictionaries as a JSON array, chunk by chunk.
+
+    Items are encoded as they are pulled from the iterable, so memory stays
+    flat no matter how many items there are. Several items are grouped per
+    yielded chunk to keep the number of writes to the client reasonable.
+
+    Args:
+        items: Iterable of JSON-serializable dictionaries
+        chunk_size: Number of items to encode per yielded chunk
+    """
+    buffer = ["["]
+    first = True
+    count = 0
+
+    for item in items:
+        if not first:
+            buffer.append(",")
+        buffer.append(json.dumps(item))
+        first = False
+        count += 1
+
+        if count >= chunk_size:
+            yield "".join(buffer)
+            buffer = []
+            count = 0
+
+    buffer.append("]")
+    yield "".join(buffer)
+
+
+def stream_ndjson(items: Iterable[dict], chunk_size: int = 500) -> Iterator[str]:
+    """
+    Serialize an iterable of dictionaries as newline-delimited JSON.
+
+    Args:
+        items: Iterable of JSON-serializable dictionaries
+        chunk_size: Number of items to encode per yielded chunk
+    """
+    buffer = []
+
+    for item in items:
+        buffer.append(json.dumps(item))
+        buffer.append("\n")
+
+        if len(buffer) >= chunk_size * 2:
+            yield "".join(buffer)
+            buffer = []
+
+    if buffer:
+        yield "".join(buffer)
+
+
+def stream_csv(items: Iterable[dict], fieldnames: List[str], chunk_size: int = 500) -> Iterator[str]:
+    """
+    Serialize an iterable of dictionaries as CSV with a header row.
+
+    Args:
+        items: Iterable of dictionaries keyed by ``fieldnames``
+        fieldnames: Column order for the header and rows
+        chunk_size: Number of rows to encode per yielded chunk
+    """
+    output = io.StringIO()
+    writer = csv.DictWriter(output, fieldnames=fieldnames, extrasaction="ignore")
+    writer.writeheader()
+    count = 0
+
+    for item in items:
+        writer.writerow(item)
+        count += 1
+
+        if count >= chunk_size:
+            yield output.getvalue()
+            output.seek(0)
+            output.truncate(0)
+            count = 0
+
+    yield output.getvalue()
+
+
+def gzip_stream(chunks: Iterable[str]) -> Iterator[bytes]:
+    """
+    Gzip-compress a stream of text chunks on the fly.
+
+    Args:
+        chunks: Iterable of text chunks, encoded as UTF-8
+    """
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode("utf-8"))
+        if data:
+            yield data
+
+    yield compressor.flush()